@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark administrator de-duplication: ContactIndex vs the old linear scan.
+
+Run from the project root:
+    python -m benchmarks.bench_contact_index
+"""
+import random
+import time
+
+from src.utils.contacts import ContactIndex
+
+POSITIONS = ["Joukkueenjohtaja", "Valmentaja", "Huoltaja", "Rahastonhoitaja"]
+
+
+def synthetic_contacts(count, unique_ratio=0.25, seed=1):
+    """Generate contact rows where each administrator manages several teams."""
+    rng = random.Random(seed)
+    administrators = max(1, int(count * unique_ratio))
+    return [
+        {
+            'league': f"League {rng.randrange(400)}",
+            'team': f"Team {i}",
+            'administrator_name': f"Admin {admin}",
+            'position': rng.choice(POSITIONS),
+            'email': f"admin{admin}@example.fi"
+        }
+        for i, admin in ((i, rng.randrange(administrators)) for i in range(count))
+    ]
+
+
+def linear_scan(contacts):
+    """The previous O(n^2) de-duplication from ContactScraper.scrape."""
+    unique_contacts = []
+    seen_emails = set()
+    
+    for contact in contacts:
+        contact = dict(contact)
+        email = contact['email']
+        if email not in seen_emails:
+            seen_emails.add(email)
+            unique_contacts.append(contact)
+        else:
+            for existing in unique_contacts:
+                if existing['email'] == email:
+                    existing['team'] += f", {contact['team']}"
+                    existing['league'] += f", {contact['league']}"
+                    if contact['position'] != existing['position']:
+                        existing['position'] += f", {contact['position']}"
+                    break
+    
+    return unique_contacts
+
+
+def contact_index(contacts):
+    index = ContactIndex()
+    for contact in contacts:
+        index.add(contact)
+    return index.rows()
+
+
+def timed(func, contacts):
+    start = time.perf_counter()
+    rows = func(contacts)
+    return time.perf_counter() - start, len(rows)
+
+
+def main():
+    print(f"{'contacts':>10} {'linear scan':>14} {'ContactIndex':>14} {'unique':>8}")
+    for count in (1_000, 5_000, 10_000, 20_000, 100_000):
+        contacts = synthetic_contacts(count)
+        index_time, unique = timed(contact_index, contacts)
+        # The quadratic version takes minutes at 100k, so it is only run up to 20k
+        if count <= 20_000:
+            scan_time, scan_unique = timed(linear_scan, contacts)
+            assert scan_unique == unique
+            scan = f"{scan_time:>13.3f}s"
+        else:
+            scan = f"{'skipped':>14}"
+        print(f"{count:>10} {scan} {index_time:>13.3f}s {unique:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Fixtures and reporting for the stage benchmark suite.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from src.utils.browser import BrowserManager
+
+_results = []
+
+
+class StageReport:
+    """Collects one benchmark row per stage for the terminal summary."""
+    
+    def record(self, stage, pages, wall_time, round_trips, bytes_received=0):
+        _results.append({
+            'stage': stage,
+            'pages': pages,
+            'wall_time': wall_time,
+            'pages_per_sec': pages / wall_time if wall_time else float('inf'),
+            'round_trips_per_page': round_trips / pages if pages else 0,
+            'kb_per_page': bytes_received / 1024 / pages if pages else 0
+        })
+
+
+@pytest.fixture
+def stage_report():
+    return StageReport()
+
+
+@contextmanager
+def chrome(**browser_options):
+    """Headless Chrome, or skip the test when no browser is installed."""
+    manager = BrowserManager(headless=True, **browser_options)
+    try:
+        driver = manager.__enter__()
+    except Exception as e:
+        pytest.skip(f"Chrome is not available: {e}")
+    
+    try:
+        yield driver
+    finally:
+        manager.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="module")
+def driver():
+    with chrome() as driver:
+        yield driver
+
+
+@contextmanager
+def count_commands(driver):
+    """Count WebDriver commands (HTTP round trips) issued inside the block."""
+    counter = {'commands': 0}
+    original = driver.execute
+    
+    def execute(*args, **kwargs):
+        counter['commands'] += 1
+        return original(*args, **kwargs)
+    
+    driver.execute = execute
+    try:
+        yield counter
+    finally:
+        driver.execute = original
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    
+    terminalreporter.section("stage benchmarks")
+    terminalreporter.write_line(
+        f"{'stage':<28} {'pages':>6} {'wall time':>10} {'pages/s':>9} {'round trips/page':>17} {'KB/page':>8}"
+    )
+    for row in _results:
+        terminalreporter.write_line(
+            f"{row['stage']:<28} {row['pages']:>6} {row['wall_time']:>9.3f}s "
+            f"{row['pages_per_sec']:>9.1f} {row['round_trips_per_page']:>17.1f} {row['kb_per_page']:>8.1f}"
+        )
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Local replay server standing in for tulospalvelu.palloliitto.fi.
+
+Recorded pages live under ``fixtures/pages`` and are served by request path,
+so ``/team/101/players`` is answered with ``fixtures/pages/team/101/players.html``.
+Paths with a file extension (stylesheets, images, scripts) are served as-is.
+Latency and failing responses can be injected to exercise throttling logic.
+
+Run standalone from the project root:
+    python -m benchmarks.replay_server --port 8000
+"""
+import argparse
+import mimetypes
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "pages"
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serves recorded pages over keep-alive HTTP/1.1."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, self.client_address))
+            request_number = len(self.server.requests)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.fail_every and request_number % self.server.fail_every == 0:
+            self._send(self.server.fail_status, b"Injected failure")
+            return
+        
+        path = unquote(urlsplit(self.path).path).strip("/")
+        for candidate in (FIXTURES_DIR / path, FIXTURES_DIR / f"{path}.html"):
+            if path and candidate.is_file() and FIXTURES_DIR in candidate.resolve().parents:
+                content_type = mimetypes.guess_type(candidate.name)[0] or "application/octet-stream"
+                self._send(200, candidate.read_bytes(), content_type)
+                return
+        self._send(404, b"Not found")
+    
+    def _send(self, status, body, content_type="text/html"):
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8"
+                         if content_type.startswith("text/") else content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_sent += len(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Threaded replay server that records every request it answers.
+    
+    Args:
+        port: Port to bind on 127.0.0.1, 0 picks a free one
+        latency: Seconds added to every response
+        fail_every: Answer every Nth request with ``fail_status``, 0 disables
+        fail_status: Status code of injected failures
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, port=0, latency=0, fail_every=0, fail_status=503):
+        super().__init__(("127.0.0.1", port), ReplayHandler)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.lock = threading.Lock()
+        self.requests = []
+        self.bytes_sent = 0
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self._thread = None
+    
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0, help="Seconds added to every response")
+    parser.add_argument("--fail-every", type=int, default=0, help="Fail every Nth request")
+    parser.add_argument("--fail-status", type=int, default=503, help="Status code of injected failures")
+    args = parser.parse_args()
+    
+    server = ReplayServer(port=args.port, latency=args.latency,
+                          fail_every=args.fail_every, fail_status=args.fail_status)
+    print(f"Serving {FIXTURES_DIR} at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark the resource-blocking profile against the local replay server.
+
+Loads the same league and players pages with and without blocking and
+reports the bytes and milliseconds saved per page (requires Chrome).
+"""
+import time
+
+from benchmarks.conftest import chrome
+from src.utils.browser import DEFAULT_BLOCKED_URLS, blocked_urls
+
+PAGE_PATHS = [
+    "/category/P12!etejp25/tables",
+    "/category/P11!etejp25/tables",
+    "/team/101/players",
+    "/team/102/players",
+]
+
+# The fixture pages reference a local stand-in tracker instead of third-party hosts
+BLOCK_CONFIG = {'patterns': DEFAULT_BLOCKED_URLS + ["*/js/analytics.js"]}
+
+
+def load_pages(replay_server, **browser_options):
+    """Load every page once and return (seconds, bytes served) for the batch."""
+    with chrome(**browser_options) as driver:
+        # Warm up the browser so startup is not counted
+        driver.get(replay_server.base_url + "/team/103/players")
+        bytes_before = replay_server.bytes_sent
+        start = time.perf_counter()
+        for path in PAGE_PATHS:
+            driver.get(replay_server.base_url + path)
+        return time.perf_counter() - start, replay_server.bytes_sent - bytes_before
+
+
+def test_blocked_urls_respects_stage_allowlist():
+    assert "*.css" in blocked_urls({}, stage="contact")
+    assert "*.css" not in blocked_urls({}, stage="categories")
+    assert blocked_urls({'enabled': False}, stage="contact") == []
+    assert blocked_urls(None) == []
+
+
+def test_resource_blocking_savings(replay_server, stage_report):
+    full_time, full_bytes = load_pages(replay_server)
+    blocked_time, blocked_bytes = load_pages(
+        replay_server, blocked_urls=blocked_urls(BLOCK_CONFIG, stage="contact")
+    )
+    pages = len(PAGE_PATHS)
+    
+    stage_report.record("page loads (all assets)", pages, full_time, pages, full_bytes)
+    stage_report.record("page loads (blocked)", pages, blocked_time, pages, blocked_bytes)
+    
+    assert blocked_bytes < full_bytes
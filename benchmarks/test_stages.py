@@ -0,0 +1,105 @@
+"""
+End-to-end stage benchmarks against the local replay server.
+
+The browser benchmarks need Chrome and are skipped without it; the parser
+benchmarks run anywhere. Results are printed in the "stage benchmarks"
+section of the pytest summary:
+    python -m pytest benchmarks -q
+"""
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from benchmarks.conftest import count_commands
+from benchmarks.replay_server import FIXTURES_DIR
+from src.pages.categories_page import CategoriesPage
+from src.pages.contact_page import ContactPage, parse_officials_html, select_administrator
+from src.pages.teams_page import TeamsPage, parse_teams_html
+
+LEAGUE_PATHS = ["/category/P12!etejp25/tables", "/category/P11!etejp25/tables"]
+TEAM_IDS = ["101", "102"]
+
+
+@pytest.fixture
+def config(replay_server, tmp_path, monkeypatch):
+    # Page objects write debug dumps relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return {
+        'site': {'base_url': replay_server.base_url},
+        'delays': {'ready_timeout': 5, 'dom_quiet': 0.1}
+    }
+
+
+def test_categories_stage(driver, config, stage_report):
+    page = CategoriesPage(driver, config)
+    
+    start = time.perf_counter()
+    with count_commands(driver) as counter:
+        page.navigate()
+        assert page.apply_filters_for_scraping()
+        results = page.get_results()
+    stage_report.record("categories", 1, time.perf_counter() - start, counter['commands'])
+    
+    assert [r['name'] for r in results] == ["P12 Etelä", "P11 Etelä"]
+
+
+def test_teams_stage(driver, config, replay_server, stage_report):
+    page = TeamsPage(driver, config)
+    
+    start = time.perf_counter()
+    with count_commands(driver) as counter:
+        teams = [page.extract_teams(replay_server.base_url + path) for path in LEAGUE_PATHS]
+    stage_report.record("teams", len(LEAGUE_PATHS), time.perf_counter() - start, counter['commands'])
+    
+    assert [len(league) for league in teams] == [3, 1]
+
+
+def test_contact_stage(driver, config, replay_server, stage_report):
+    page = ContactPage(driver, config)
+    
+    start = time.perf_counter()
+    with count_commands(driver) as counter:
+        contacts = [page.extract_contact(f"{replay_server.base_url}/team/{team_id}/players")
+                    for team_id in TEAM_IDS]
+    stage_report.record("contact", len(TEAM_IDS), time.perf_counter() - start, counter['commands'])
+    
+    assert [c['email'] for c in contacts] == ["liisa.johtaja@example.fi", "pekka@example.fi"]
+    
+    # Team 103 never renders the officials table; the timeout is raised so
+    # the scraper leaves the team to be retried
+    with pytest.raises(TimeoutException):
+        page.extract_contact(f"{replay_server.base_url}/team/103/players")
+
+
+def test_officials_script_matches_parser(driver, config, replay_server):
+    html = (FIXTURES_DIR / "team/101/players.html").read_text(encoding="utf-8")
+    page = ContactPage(driver, config)
+    driver.get(f"{replay_server.base_url}/team/101/players")
+    
+    assert page._extract_officials_script() == parse_officials_html(html)
+
+
+def test_teams_parser(stage_report):
+    html = (FIXTURES_DIR / "category/P12!etejp25/tables.html").read_text(encoding="utf-8")
+    rounds = 200
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        teams = parse_teams_html(html, "https://tulospalvelu.palloliitto.fi/category/P12!etejp25/tables")
+    # One page_source round trip per page in the browser
+    stage_report.record("teams (page_source parse)", rounds, time.perf_counter() - start, rounds)
+    
+    assert len(teams) == 3
+
+
+def test_officials_parser(stage_report):
+    html = (FIXTURES_DIR / "team/101/players.html").read_text(encoding="utf-8")
+    rounds = 200
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        administrator = select_administrator(parse_officials_html(html))
+    stage_report.record("contact (HTML parse)", rounds, time.perf_counter() - start, 0)
+    
+    assert administrator['position'] == "Joukkueenjohtaja"
@@ -0,0 +1,149 @@
+"""
+Shared pytest fixtures: a local stand-in for tulospalvelu.palloliitto.fi, a
+browser pool that leases fake drivers and page objects with canned results.
+
+See ``benchmarks/replay_server.py`` for how recorded pages are served. Set
+``server.latency`` to add a fixed delay to every response.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from benchmarks.replay_server import ReplayServer
+
+
+class FakeDriver:
+    """Driver handed to fake page objects; WebDriver commands do nothing."""
+    
+    def execute(self, *args, **kwargs):
+        pass
+
+
+class FakePool:
+    """Stand-in for ``BrowserPool`` that never starts a browser.
+    
+    Takes the same arguments and records the thread of every lease. Like the
+    real pool it hands out at most ``size`` drivers at a time, and
+    ``max_active`` is the most that were leased at once.
+    """
+    
+    def __init__(self, size=1, **kwargs):
+        self.size = size
+        self.leases = []
+        self.max_active = 0
+        self._active = 0
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        pass
+    
+    @contextmanager
+    def acquire(self):
+        with self._slots:
+            with self._lock:
+                self.leases.append(threading.get_ident())
+                self._active += 1
+                self.max_active = max(self.max_active, self._active)
+            try:
+                yield FakeDriver()
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+
+class FakePage:
+    """Stand-in for ``TeamsPage`` and ``ContactPage`` that answers from ``extract``.
+    
+    ``extract`` is called with the page URL. A TimeoutException it raises is
+    counted in ``ready.timeouts``, as ``ReadinessWaiter`` does.
+    """
+    
+    extract = None
+    
+    def __init__(self, driver, config):
+        self.ready = SimpleNamespace(timings=[], timeouts=0, rate_limited=0.0)
+    
+    def extract_teams(self, league_url):
+        return self._extract(league_url)
+    
+    def extract_contact(self, players_url):
+        return self._extract(players_url)
+    
+    def _extract(self, url):
+        try:
+            return self.extract(url)
+        except TimeoutException:
+            self.ready.timeouts += 1
+            raise
+
+
+class FakeCategoriesPage:
+    """Stand-in for ``CategoriesPage`` that lists canned leagues.
+    
+    ``results`` maps the value of the last filter button to the leagues
+    listed for it. ``delay`` is slept on navigation, to keep leases open.
+    """
+    
+    url = "https://example.fi/categories"
+    results = {}
+    delay = 0
+    
+    def __init__(self, driver, config):
+        self.ready = SimpleNamespace(timings=[])
+        self.filter_value = None
+    
+    def navigate(self):
+        time.sleep(self.delay)
+    
+    def apply_filters_for_scraping(self, filters=None):
+        self.filter_value = filters[-1]['value']
+        return True
+    
+    def iter_results(self, debug_name="results"):
+        yield from self.results[self.filter_value]
+
+
+@pytest.fixture
+def replay_server():
+    """Run the replay server on a free local port for the duration of a test."""
+    with ReplayServer() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_pool():
+    """FakePool class for one test; every pool it creates is kept in ``created``."""
+    class Pool(FakePool):
+        created = []
+        
+        def __init__(self, size=1, **kwargs):
+            super().__init__(size, **kwargs)
+            self.created.append(self)
+    
+    return Pool
+
+
+@pytest.fixture
+def fake_categories_page():
+    """FakeCategoriesPage class for one test; set ``results`` on it."""
+    class Page(FakeCategoriesPage):
+        results = {}
+    
+    return Page
+
+
+@pytest.fixture
+def fake_page():
+    """Return a factory of FakePage classes that answer with ``extract(url)``."""
+    def make(extract):
+        return type("Page", (FakePage,), {'extract': staticmethod(extract)})
+    
+    return make
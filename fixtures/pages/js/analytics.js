@@ -0,0 +1,4 @@
+// Stand-in for a third-party tracker
+(function () {
+    window.__analyticsLoaded = true;
+})();
@@ -5,11 +5,15 @@ Allows running specific stages of the scraping process.
 """
 
 import click
+import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
 from src.scrapers.categories_scraper import CategoriesScraper
+from src.scrapers.teams_scraper import TeamsScraper
+from src.scrapers.contact_scraper import ContactScraper
+from src.scrapers.pipeline_scraper import PipelineScraper
 
 # Set up logging
 logging.basicConfig(
@@ -30,11 +34,25 @@ logger = logging.getLogger(__name__)
               help='Show what would be done without actually doing it')
 @click.option('--config', type=click.Path(exists=True), 
               default='config/scraper.json', help='Path to configuration file')
-def main(stage, delay, resume, dry_run, config):
+@click.option('--workers', type=click.IntRange(min=1), default=1,
+              help='Number of parallel browsers per stage')
+@click.option('--engine', type=click.Choice(['threads', 'async']), default='threads',
+              help='Crawl engine for the teams and contact stages')
+@click.option('--adaptive', is_flag=True,
+              help='Adapt concurrency (up to --workers) to latency and errors')
+@click.option('--incremental', is_flag=True,
+              help='Only refetch new, changed or stale leagues and teams, merging into the previous run')
+@click.option('--pipeline', is_flag=True,
+              help='With --stage all, stream leagues and teams to the next stage as they are found')
+def main(stage, delay, resume, dry_run, config, workers, engine, adaptive, incremental, pipeline):
     """Finnish Soccer League scraper with staged processing."""
+    if pipeline and (incremental or engine != 'threads'):
+        # The pipeline streams work through its own worker threads
+        raise click.UsageError("--incremental and --engine are not supported with --pipeline")
+    
     start_time = datetime.now()
     
-    logger.info(f"Starting scraper - Stage: {stage}, Delay: {delay}s")
+    logger.info(f"Starting scraper - Stage: {stage}, Delay: {delay}s, Workers: {workers}, Engine: {engine}")
     if dry_run:
         logger.info("DRY RUN MODE - No actual requests will be made")
     
@@ -43,16 +61,18 @@ def main(stage, delay, resume, dry_run, config):
         Path(dir_path).mkdir(parents=True, exist_ok=True)
     
     try:
-        if stage == 'all':
-            run_categories(delay, resume, dry_run, config)
-            run_teams(delay, resume, dry_run)
-            run_contact(delay, resume, dry_run)
+        if stage == 'all' and pipeline:
+            run_pipeline(delay, resume, dry_run, config, workers, adaptive)
+        elif stage == 'all':
+            run_categories(delay, resume, dry_run, config, workers)
+            run_teams(delay, resume, dry_run, config, workers, engine, adaptive, incremental)
+            run_contact(delay, resume, dry_run, config, workers, engine, adaptive, incremental)
         elif stage == 'categories':
-            run_categories(delay, resume, dry_run, config)
+            run_categories(delay, resume, dry_run, config, workers)
         elif stage == 'teams':
-            run_teams(delay, resume, dry_run)
+            run_teams(delay, resume, dry_run, config, workers, engine, adaptive, incremental)
         elif stage == 'contact':
-            run_contact(delay, resume, dry_run)
+            run_contact(delay, resume, dry_run, config, workers, engine, adaptive, incremental)
         
         logger.info("Scraping completed successfully")
         
@@ -65,25 +85,50 @@ def main(stage, delay, resume, dry_run, config):
         logger.info(f"Total execution time: {elapsed_time}")
 
 
-def run_categories(delay, resume, dry_run, config_path):
+def run_categories(delay, resume, dry_run, config_path, workers=1):
     """Stage 1: Scrape league/cup URLs from categories page."""
     logger.info("Running Categories stage")
     scraper = CategoriesScraper(config_path)
-    scraper.scrape(delay=delay, resume=resume, dry_run=dry_run)
+    scraper.scrape(delay=delay, resume=resume, dry_run=dry_run, workers=workers)
 
 
-def run_teams(delay, resume, dry_run):
+def run_teams(delay, resume, dry_run, config_path, workers=1, engine='threads', adaptive=False,
+              incremental=False):
     """Stage 2: Scrape team URLs from league pages."""
     logger.info("Running Teams stage")
-    # TODO: Implement teams scraping
-    logger.info("Teams stage not yet implemented")
+    if dry_run:
+        logger.info(f"DRY RUN - would scrape teams with {workers} workers")
+        return
+    scraper = TeamsScraper(load_config(config_path))
+    scraper.scrape(workers=workers, engine=engine, adaptive=adaptive, incremental=incremental)
 
 
-def run_contact(delay, resume, dry_run):
+def run_contact(delay, resume, dry_run, config_path, workers=1, engine='threads', adaptive=False,
+                incremental=False):
     """Stage 3: Scrape administrator contact info from team pages."""
     logger.info("Running Contact stage")
-    # TODO: Implement contact scraping
-    logger.info("Contact stage not yet implemented")
+    if dry_run:
+        logger.info(f"DRY RUN - would scrape contacts with {workers} workers")
+        return
+    scraper = ContactScraper(load_config(config_path))
+    scraper.scrape(workers=workers, engine=engine, resume=resume, adaptive=adaptive,
+                   incremental=incremental)
+
+
+def run_pipeline(delay, resume, dry_run, config_path, workers=1, adaptive=False):
+    """Stages 1-3 at once: leagues and teams are queued to the next stage as found."""
+    logger.info("Running pipelined stages")
+    if dry_run:
+        logger.info(f"DRY RUN - would run the pipeline with {workers} workers per stage")
+        return
+    scraper = PipelineScraper(config_path)
+    scraper.scrape(delay=delay, resume=resume, workers=workers, adaptive=adaptive)
+
+
+def load_config(config_path):
+    """Load the scraper configuration file."""
+    with open(config_path) as f:
+        return json.load(f)
 
 
 if __name__ == "__main__":
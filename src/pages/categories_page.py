@@ -3,78 +3,52 @@ Page object for the categories page (Finnish version with Vuetify buttons).
 """
 
 import logging
+import re
 import time
 from pathlib import Path
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+from src.pages.consent import ConsentHandler
+from src.utils.waits import ReadinessWaiter
 
 logger = logging.getLogger(__name__)
 
+# Filter buttons clicked when no combination is configured
+DEFAULT_FILTERS = [
+    {"value": "football", "text": "Jalkapallo"},
+    {"value": "spletela", "text": "Etelä"},
+    {"value": "league", "text": "Sarja/cup"},
+    {"value": "B", "text": "Pojat"},
+    # No filter for age (all ages)
+]
+
 
 class CategoriesPage:
-    def __init__(self, driver):
+    def __init__(self, driver, config=None):
         self.driver = driver
         self.wait = WebDriverWait(driver, 20)  # Increased timeout
-        self.url = "https://tulospalvelu.palloliitto.fi/categories"
+        self.ready = ReadinessWaiter.from_config(driver, config)
+        self.consent = ConsentHandler(driver, self.ready)
+        base_url = (config or {}).get('site', {}).get('base_url', "https://tulospalvelu.palloliitto.fi")
+        self.url = f"{base_url.rstrip('/')}/categories"
     
     def navigate(self):
         """Navigate to the categories page."""
         logger.info(f"Navigating to {self.url}")
-        self.driver.get(self.url)
-        time.sleep(3)  # Let page load
+        self.ready.navigate(self.url)
         
-        # Handle cookie consent popup
-        self._handle_cookie_consent()
-    
-    def _handle_cookie_consent(self):
-        """Handle cookie consent popup if it appears."""
+        # Let the filter buttons render
         try:
-            logger.info("Checking for cookie consent popup")
-            
-            # Look for the cookie consent dialog
-            consent_dialog = self.driver.find_elements(By.ID, "CybotCookiebotDialog")
-            if consent_dialog:
-                logger.info("Cookie consent dialog found")
-                
-                # Try to find and click "Allow all" button
-                try:
-                    allow_all_button = self.wait.until(
-                        EC.element_to_be_clickable((By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"))
-                    )
-                    logger.info("Clicking 'Allow all' button")
-                    allow_all_button.click()
-                    time.sleep(2)  # Wait for popup to close
-                    logger.info("Cookie consent handled")
-                except TimeoutException:
-                    logger.warning("Allow all button not found, trying alternative method")
-                    
-                    # Try to find and click "Deny" button as fallback
-                    try:
-                        deny_button = self.driver.find_element(By.ID, "CybotCookiebotDialogBodyButtonDecline")
-                        logger.info("Clicking 'Deny' button")
-                        deny_button.click()
-                        time.sleep(2)
-                        logger.info("Cookie consent handled with deny")
-                    except NoSuchElementException:
-                        logger.warning("Deny button not found")
-                        
-                    # Try to close dialog using close button
-                    try:
-                        close_button = self.driver.find_element(By.CLASS_NAME, "CybotCookiebotBannerCloseButton")
-                        logger.info("Clicking close button")
-                        close_button.click()
-                        time.sleep(2)
-                    except NoSuchElementException:
-                        logger.warning("Close button not found")
-            else:
-                logger.info("No cookie consent dialog found")
-                
-        except Exception as e:
-            logger.warning(f"Error handling cookie consent: {e}")
-            # Continue anyway - maybe the popup isn't there
+            self.ready.wait_for((By.CSS_SELECTOR, "button.v-btn"), "filter buttons")
+        except TimeoutException:
+            logger.warning("Filter buttons did not appear, continuing")
+        
+        # Handle cookie consent popup
+        self.consent.handle()
     
     def explore_filters(self):
         """Explore the filter structure to understand the page."""
@@ -133,7 +107,6 @@ class CategoriesPage:
             
             # Scroll to button and click using JavaScript
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-            time.sleep(0.5)
             
             # Try JavaScript click first (works even if element is obscured)
             try:
@@ -145,7 +118,8 @@ class CategoriesPage:
                 button.click()
                 logger.info("Clicked using regular click")
             
-            time.sleep(2)  # Increased wait for filter to apply
+            # Wait for the filter to apply
+            self.ready.wait_for_quiet(f"filter {filter_value or filter_text}")
             
             return True
             
@@ -153,15 +127,14 @@ class CategoriesPage:
             logger.error(f"Error applying filter: {e}", exc_info=True)
             return False
     
-    def apply_filters_for_scraping(self):
-        """Apply the specific filters needed for scraping."""
-        filters = [
-            {"value": "football", "text": "Jalkapallo"},
-            {"value": "spletela", "text": "Etelä"},
-            {"value": "league", "text": "Sarja/cup"},
-            {"value": "B", "text": "Pojat"},
-            # No filter for age (all ages)
-        ]
+    def apply_filters_for_scraping(self, filters=None):
+        """Apply the filters needed for scraping.
+        
+        Args:
+            filters: Filter buttons to click in order, as {value, text}
+                dicts; defaults to ``DEFAULT_FILTERS``
+        """
+        filters = filters or DEFAULT_FILTERS
         
         for i, filter_config in enumerate(filters):
             logger.info(f"Applying filter {i+1}: {filter_config}")
@@ -172,7 +145,6 @@ class CategoriesPage:
             if not success:
                 logger.error(f"Failed to apply filter {i+1}")
                 return False
-            time.sleep(1)  # Wait between filters
         
         logger.info("All filters applied successfully")
         
@@ -180,11 +152,14 @@ class CategoriesPage:
         self._handle_date_picker()
         
         # Wait for results to load
-        time.sleep(5)
+        try:
+            self.ready.wait_for((By.ID, "results"), "results")
+        except TimeoutException:
+            logger.warning("Results div did not appear after applying filters")
         
         # Try scrolling to trigger any lazy loading
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(3)
+        self.ready.wait_for_quiet("lazy loading")
         
         return True
     
@@ -197,7 +172,7 @@ class CategoriesPage:
             if close_buttons:
                 logger.info(f"Found {len(close_buttons)} close buttons")
                 close_buttons[0].click()
-                time.sleep(1)
+                self.ready.wait_for_quiet("date picker closed")
                 return
             
             # Look for overlay to click outside
@@ -205,7 +180,7 @@ class CategoriesPage:
             if overlays:
                 logger.info("Found overlay, clicking to close")
                 overlays[0].click()
-                time.sleep(1)
+                self.ready.wait_for_quiet("date picker closed")
                 return
             
             # Look for a "confirm" or "ok" button
@@ -213,7 +188,7 @@ class CategoriesPage:
             if confirm_buttons:
                 logger.info("Found confirm button, clicking")
                 confirm_buttons[0].click()
-                time.sleep(1)
+                self.ready.wait_for_quiet("date picker closed")
                 return
                 
             logger.info("No date picker or modal found to close")
@@ -223,86 +198,102 @@ class CategoriesPage:
     
     def get_results(self):
         """Get the league/cup results after filtering."""
+        return list(self.iter_results())
+    
+    def iter_results(self, debug_name="results"):
+        """Yield the league/cup results after filtering, one at a time as parsed.
+        
+        Args:
+            debug_name: Names the debug files saved if the results cannot be
+                read, so parallel filter combinations do not overwrite them
+        """
         try:
             # Let's wait for the page to fully load after filters
             logger.info("Waiting for results to load...")
             
-            # Save debug info before searching
-            self._save_debug_info()
-            
             # Look for the results div with id="results"
             try:
                 results_div = self.wait.until(
                     EC.presence_of_element_located((By.ID, "results"))
                 )
                 logger.info("Results div found")
-                
-                # Find all anchor tags within the results div
-                category_links = results_div.find_elements(By.TAG_NAME, "a")
-                logger.info(f"Found {len(category_links)} anchor tags in results div")
-                
-                results = []
-                for link in category_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if not href or "/category/" not in href:
-                            continue
-                            
-                        # Get text from the link or its child elements
-                        text = link.text.strip()
-                        if not text:
-                            # Try to get text from child divs
-                            divs = link.find_elements(By.TAG_NAME, "div")
-                            for div in divs:
-                                div_text = div.text.strip()
-                                if div_text and not div_text == "Etelä Jalkapallo 2025":
-                                    text = div_text
-                                    break
-                        
-                        if text and href:
-                            # Clean up the text - take first meaningful line
-                            lines = text.split("\n")
-                            name = ""
-                            for line in lines:
-                                if line.strip() and line.strip() not in ["Etelä Jalkapallo 2025"]:
-                                    name = line.strip()
-                                    break
-                            
-                            if name:
-                                results.append({
-                                    "name": name,
-                                    "url": href
-                                })
-                                logger.debug(f"Added result: {name} - {href}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parsing link: {e}")
-                        continue
-                
-                logger.info(f"Found {len(results)} valid league/cup results")
-                
-                # Log first few results for verification
-                for i, result in enumerate(results[:5]):
-                    logger.info(f"Result {i+1}: {result['name']} - {result['url']}")
-                
-                return results
-                
             except TimeoutException:
                 logger.error("Results div not found")
-                self._save_debug_info()
-                return []
+                self._save_debug_info(debug_name)
+                return
+            
+            start = time.monotonic()
+            # Find all anchor tags within the results div
+            category_links = results_div.find_elements(By.TAG_NAME, "a")
+            logger.info(f"Found {len(category_links)} anchor tags in results div")
+            
+            count = 0
+            for link in category_links:
+                try:
+                    result = self._parse_result_link(link)
+                except Exception as e:
+                    logger.warning(f"Error parsing link: {e}")
+                    continue
+                if result is None:
+                    continue
+                
+                count += 1
+                # Log first few results for verification
+                if count <= 5:
+                    logger.info(f"Result {count}: {result['name']} - {result['url']}")
+                yield result
+            
+            logger.info(f"Found {count} valid league/cup results")
+            self.ready.record("extraction", start)
                 
         except Exception as e:
             logger.error(f"Error getting results: {e}", exc_info=True)
-            self._save_debug_info()
-            return []
+            self._save_debug_info(debug_name)
+    
+    def _parse_result_link(self, link):
+        """Return the {name, url} of a results link, or None if it is not a category."""
+        href = link.get_attribute("href")
+        if not href or "/category/" not in href:
+            return None
+            
+        # Get text from the link or its child elements
+        text = link.text.strip()
+        if not text:
+            # Try to get text from child divs
+            divs = link.find_elements(By.TAG_NAME, "div")
+            for div in divs:
+                div_text = div.text.strip()
+                if div_text and not div_text == "Etelä Jalkapallo 2025":
+                    text = div_text
+                    break
+        
+        if not text:
+            return None
+        
+        # Clean up the text - take first meaningful line
+        lines = text.split("\n")
+        name = ""
+        for line in lines:
+            if line.strip() and line.strip() not in ["Etelä Jalkapallo 2025"]:
+                name = line.strip()
+                break
+        
+        if not name:
+            return None
+        logger.debug(f"Added result: {name} - {href}")
+        return {
+            "name": name,
+            "url": href
+        }
     
-    def _save_debug_info(self):
+    def _save_debug_info(self, name="results"):
         """Save debug information when results are not found."""
+        start = time.monotonic()
+        suffix = re.sub(r'[^A-Za-z0-9_.-]', '_', name)
         try:
             # Save page source with proper encoding
             page_source = self.driver.page_source
-            debug_file = Path("data/intermediate/debug_results_page.html")
+            debug_file = Path(f"data/intermediate/debug_{suffix}_page.html")
             debug_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Write with explicit encoding
@@ -315,7 +306,7 @@ class CategoriesPage:
                 logger.info(f"File size: {debug_file.stat().st_size} bytes")
             
             # Save screenshot
-            screenshot_file = Path("data/intermediate/debug_screenshot.png")
+            screenshot_file = Path(f"data/intermediate/debug_{suffix}_screenshot.png")
             self.driver.save_screenshot(str(screenshot_file))
             logger.info(f"Saved screenshot to {screenshot_file}")
             
@@ -329,6 +320,7 @@ class CategoriesPage:
             
         except Exception as e:
             logger.error(f"Error saving debug info: {e}")
+        self.ready.record("debug dump", start)
     
     def get_page_source(self):
         """Get the current page source for debugging."""
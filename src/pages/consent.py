@@ -0,0 +1,91 @@
+"""
+Shared cookie consent handling for all page objects.
+"""
+import logging
+import threading
+import time
+import weakref
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+logger = logging.getLogger(__name__)
+
+CONSENT_COOKIE = "CookieConsent"
+CONSENT_DIALOG = (By.ID, "CybotCookiebotDialog")
+
+# Buttons that dismiss the dialog, in order of preference
+CONSENT_BUTTONS = [
+    (By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"),
+    (By.ID, "CybotCookiebotDialogBodyButtonAccept"),
+    (By.ID, "CybotCookiebotDialogBodyButtonDecline"),
+    (By.CLASS_NAME, "CybotCookiebotBannerCloseButton"),
+    (By.CSS_SELECTOR, ".cookie-accept"),
+    (By.CSS_SELECTOR, "[data-accept-cookies]"),
+]
+
+# Drivers whose browser already holds a consent decision
+_consented = weakref.WeakSet()
+_consented_lock = threading.Lock()
+
+
+class ConsentHandler:
+    """Dismisses the Cookiebot dialog at most once per browser.
+    
+    Once consent is recorded for a driver, either because the dialog was
+    dismissed, the consent cookie is already set (seeded or from a persistent
+    profile) or the site did not ask, later calls return without any
+    WebDriver round trips. Each call is recorded in the waiter's timings.
+    
+    Args:
+        driver: Selenium WebDriver
+        ready: ReadinessWaiter of the calling page object
+    """
+    
+    def __init__(self, driver, ready):
+        self.driver = driver
+        self.ready = ready
+    
+    def handle(self):
+        """Handle the consent dialog if this browser has not done so yet."""
+        start = time.monotonic()
+        if self.driver in _consented:
+            self.ready.record("consent (cached)", start)
+            return
+        
+        try:
+            if self.driver.get_cookie(CONSENT_COOKIE):
+                logger.info("Consent cookie already set")
+            else:
+                self._dismiss_dialog()
+            self._mark()
+        except Exception as e:
+            logger.debug(f"No cookie consent or error handling it: {e}")
+        
+        self.ready.record("consent", start)
+    
+    def _dismiss_dialog(self):
+        """Click the first visible consent button, if the dialog is shown."""
+        dialogs = self.driver.find_elements(*CONSENT_DIALOG)
+        if not dialogs or not dialogs[0].is_displayed():
+            logger.info("No cookie consent dialog found")
+            return
+        
+        logger.info("Cookie consent dialog found")
+        for locator in CONSENT_BUTTONS:
+            try:
+                button = self.driver.find_element(*locator)
+            except NoSuchElementException:
+                continue
+            
+            if button.is_displayed():
+                button.click()
+                logger.info(f"Clicked consent button: {locator[1]}")
+                self.ready.wait_until_hidden(CONSENT_DIALOG, "cookie dialog hidden")
+                return
+        
+        raise RuntimeError("Cookie consent dialog has no clickable button")
+    
+    def _mark(self):
+        with _consented_lock:
+            _consented.add(self.driver)
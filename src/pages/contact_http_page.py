@@ -0,0 +1,127 @@
+"""
+Contact HTTP page - Browser-free fetch of administrator contacts by team ID.
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+import requests
+
+from src.pages.contact_page import parse_officials_html, select_administrator
+from src.utils.http import create_session
+from src.utils.rate_limit import RateLimiter
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.teams import TEAM_ID_PATTERN
+
+logger = logging.getLogger(__name__)
+
+
+class ContactHttpPage:
+    """Fetches the officials of a team over plain HTTP instead of a browser.
+    
+    The site renders ``/team/<id>/players`` client-side, so the fast path
+    reads the configured ``http.players_url`` endpoint instead, for example
+    ``"https://host/team/{team_id}/players"`` on a server that returns the
+    rendered officials table. Returns the same contact dictionary as
+    ``ContactPage.extract_contact``, and None whenever the response has no
+    officials, so the caller can fall back to Selenium.
+    
+    Args:
+        config: Configuration dictionary
+        session: Shared session from ``create_session``; one is created if not given
+    """
+    
+    def __init__(self, config, session: Optional[requests.Session] = None):
+        self.config = config
+        http_config = config.get('http', {})
+        self.timeout = http_config.get('timeout', 15)
+        self.url_template = http_config['players_url']
+        self.session = session or self.create_session(config)
+        self.rate_limiter = RateLimiter.from_config(config)
+        self.cache = SnapshotCache.from_config(config)
+        self.timings = []  # (label, seconds), as in ReadinessWaiter.timings
+        self.rate_limited = 0.0  # seconds spent waiting on the rate limiter
+    
+    @staticmethod
+    def enabled(config) -> bool:
+        """Return True if the ``http`` config section sets up the fast path."""
+        http_config = (config or {}).get('http', {})
+        return bool(http_config.get('players_url')) and http_config.get('enabled', True)
+    
+    @staticmethod
+    def create_session(config) -> requests.Session:
+        """Create the keep-alive session described by the ``http`` config section."""
+        http_config = config.get('http', {})
+        return create_session(pool_size=http_config.get('pool_size', 10),
+                              retries=http_config.get('retries', 2))
+    
+    def extract_contact(self, players_url: str) -> Optional[Dict[str, str]]:
+        """Extract team administrator contact information for a players page.
+        
+        Args:
+            players_url: URL of the team players page
+        
+        Returns:
+            Dictionary with name and email, or None if not found
+        
+        Raises:
+            requests.HTTPError: If the endpoint answers 429 or 5xx after
+                retries; the site is overloaded, so the team is not retried
+                in a browser
+        """
+        if self.cache:
+            cached = self.cache.get("contact", players_url)
+            if cached is not None:
+                logger.info(f"Using cached contact for players page: {players_url}")
+                return cached
+        
+        url = self.resolve_url(players_url)
+        if url is None:
+            logger.warning(f"No team ID in {players_url}, skipping HTTP fast path")
+            return None
+        
+        if self.rate_limiter:
+            start = time.monotonic()
+            self.rate_limiter.acquire(url)
+            self.record("rate limit", start)
+            self.rate_limited += time.monotonic() - start
+        
+        logger.info(f"Fetching officials over HTTP: {url}")
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+        finally:
+            self.record("http fetch", start)
+        
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        if not response.ok:
+            logger.warning(f"HTTP {response.status_code} from {url}")
+            return None
+        
+        start = time.monotonic()
+        officials = parse_officials_html(response.text)
+        for official in officials:
+            logger.info(f"Found official: {official['position']} - {official['name']}")
+        administrator = select_administrator(officials)
+        self.record("extraction", start)
+        
+        if administrator is None:
+            logger.info(f"No officials in HTTP response for {url}")
+        elif self.cache:
+            self.cache.put("contact", players_url, administrator)
+        return administrator
+    
+    def resolve_url(self, players_url: str) -> Optional[str]:
+        """Map a players page URL to the configured endpoint, None without a team ID."""
+        match = TEAM_ID_PATTERN.search(players_url)
+        if not match:
+            return None
+        return self.url_template.format(team_id=match.group(1))
+    
+    def record(self, label, start):
+        """Record the time spent since ``start`` under ``label``."""
+        self.timings.append((label, time.monotonic() - start))
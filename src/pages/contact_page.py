@@ -4,16 +4,150 @@ Contact page object - Handles scraping administrator contact information from te
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from src.pages.consent import ConsentHandler
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.waits import ReadinessWaiter
+
 logger = logging.getLogger(__name__)
 
 
+# Walks the officials table inside the browser and returns every official
+# with an email, so the whole table costs one execute_script round trip.
+OFFICIALS_SCRIPT = """
+var section = document.querySelector('.activeofficials');
+if (!section) { return null; }
+var table = section.querySelector('table');
+if (!table) { return []; }
+var officials = [];
+var rows = table.querySelectorAll('tr');
+for (var i = 0; i < rows.length; i++) {
+    var cells = rows[i].querySelectorAll('td');
+    if (cells.length < 2) { continue; }
+    var namefield = rows[i].querySelector('.namefield');
+    if (!namefield) { continue; }
+    var nameLink = namefield.querySelector('a');
+    if (!nameLink) { continue; }
+    // The contact div is nested in the name link in the rendered app, but
+    // an HTML parser moves it next to the link (links cannot nest)
+    var div = namefield.querySelector('div');
+    if (!div) { continue; }
+    var email = null;
+    var phone = null;
+    var links = div.querySelectorAll('a');
+    for (var j = 0; j < links.length; j++) {
+        var href = links[j].href || '';
+        if (href.indexOf('mailto:') === 0) {
+            email = href.substring(7);
+        } else if (href.indexOf('tel:') === 0) {
+            phone = href.substring(4);
+        }
+    }
+    if (!email) { continue; }
+    // Name text only: the nested contact div is not part of it
+    var parts = [];
+    var walker = document.createTreeWalker(nameLink, NodeFilter.SHOW_TEXT, null);
+    while (walker.nextNode()) {
+        var text = walker.currentNode.nodeValue.replace(/\\s+/g, ' ').trim();
+        if (text && !div.contains(walker.currentNode)) { parts.push(text); }
+    }
+    officials.push({
+        position: cells[0].innerText.trim(),
+        name: parts.join(' '),
+        email: email,
+        phone: phone
+    });
+}
+return officials;
+"""
+
+
+def parse_officials_html(html: str) -> List[Dict[str, str]]:
+    """Parse officials with contact information out of a players page snapshot.
+    
+    Follows the same path as ``OFFICIALS_SCRIPT``: ``.activeofficials`` table
+    rows, the ``namefield`` link and the mailto/tel links in the cell's div.
+    The name is the link text outside that div, as in the script.
+    
+    Args:
+        html: HTML of the team players page
+        
+    Returns:
+        Officials with name, email, position and optional phone, in table order
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    section = soup.select_one(".activeofficials")
+    table = section.find("table") if section else None
+    if table is None:
+        return []
+    
+    officials = []
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) < 2:
+            continue
+        
+        namefield = row.select_one(".namefield")
+        name_link = namefield.find("a") if namefield else None
+        div = namefield.find("div") if name_link else None
+        if div is None:
+            continue
+        
+        email = None
+        phone = None
+        for link in div.find_all("a"):
+            href = link.get("href") or ""
+            if href.startswith("mailto:"):
+                email = href.replace("mailto:", "")
+            elif href.startswith("tel:"):
+                phone = href.replace("tel:", "")
+        
+        if not email:
+            continue
+        
+        # The nested contact div is not part of the visible name
+        name = " ".join(
+            " ".join(text.split()) for text in name_link.find_all(string=True)
+            if text.strip() and div not in text.parents
+        )
+        official = {'name': name, 'email': email}
+        if phone:
+            official['phone'] = phone
+        official['position'] = " ".join(cells[0].get_text().split())
+        officials.append(official)
+    
+    return officials
+
+
+def select_administrator(officials: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Pick the team administrator from a list of officials.
+    
+    Args:
+        officials: Officials with contact information, in table order
+        
+    Returns:
+        The first Joukkueenjohtaja, otherwise the first official, or None
+    """
+    # Return the first official with "Joukkueenjohtaja" if found
+    for official in officials:
+        if "Joukkueenjohtaja" in official.get('position', ''):
+            logger.info("Returning Joukkueenjohtaja")
+            return official
+    
+    # Otherwise return the first official with contact info
+    if officials:
+        logger.info(f"No Joukkueenjohtaja found, returning first official: {officials[0]['position']}")
+        return officials[0]
+    
+    return None
+
+
 class ContactPage:
     """Page object for extracting contact information from team players pages."""
     
@@ -21,6 +155,10 @@ class ContactPage:
         self.driver = driver
         self.config = config
         self.wait = WebDriverWait(driver, 20)
+        self.ready = ReadinessWaiter.from_config(driver, config)
+        self.consent = ConsentHandler(driver, self.ready)
+        self.extraction_mode = config.get('extraction', {}).get('contact', 'script')
+        self.cache = SnapshotCache.from_config(config)
         self.output_dir = Path("data/intermediate")
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -31,80 +169,109 @@ class ContactPage:
             players_url: URL of the team players page
             
         Returns:
-            Dictionary with name and email, or None if not found
+            Dictionary with name and email, or None if the officials table
+            lists nobody with contact information
+            
+        Raises:
+            TimeoutException: If the officials table does not load
+            WebDriverException: If the browser session fails
         """
-        logger.info(f"Navigating to players page: {players_url}")
-        self.driver.get(players_url)
+        if self.cache:
+            cached = self.cache.get("contact", players_url)
+            if cached is not None:
+                logger.info(f"Using cached contact for players page: {players_url}")
+                return cached
         
-        # Handle cookie consent if needed
-        self._handle_cookie_consent()
+        logger.info(f"Navigating to players page: {players_url}")
+        self.ready.navigate(players_url)
         
-        # Wait for page to load
-        time.sleep(self.config.get('delays', {}).get('page_load', 3))
+        # Wait for the player list container
+        logger.info("Waiting for player list to load")
         
+        # Find the active officials section. A timeout or browser error is
+        # raised rather than returned as "no contact", so the team is retried
         try:
-            # Wait for the player list container
-            logger.info("Waiting for player list to load")
-            
-            # Find the active officials section
-            officials_section = self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "activeofficials"))
-            )
-            
-            # Find the table inside the officials section
-            table = officials_section.find_element(By.TAG_NAME, "table")
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            
-            logger.debug(f"Found {len(rows)} rows in officials table")
-            
-            # Collect all officials with contact information
-            all_officials = []
-            
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
-                    if len(cells) >= 2:
-                        # Get position from first cell
-                        position = cells[0].text.strip()
-                        
-                        # Extract contact from the row
-                        contact_info = self._extract_contact_from_row(row)
-                        
-                        if contact_info:
-                            contact_info['position'] = position
-                            all_officials.append(contact_info)
-                            logger.info(f"Found official: {position} - {contact_info['name']}")
-                            
-                except Exception as e:
-                    logger.debug(f"Error processing row: {e}")
-            
-            # Return the first official with "Joukkueenjohtaja" if found
-            for official in all_officials:
-                if "Joukkueenjohtaja" in official.get('position', ''):
-                    logger.info("Returning Joukkueenjohtaja")
-                    return official
-            
-            # Otherwise return the first official with contact info
-            if all_officials:
-                logger.info(f"No Joukkueenjohtaja found, returning first official: {all_officials[0]['position']}")
-                return all_officials[0]
-            
-            logger.warning("No officials with contact information found")
-            
-            # Debug: save page source if no administrator found
-            debug_file = self.output_dir / f"debug_contact_{int(time.time())}.html"
-            with open(debug_file, 'w') as f:
-                f.write(self.driver.page_source)
-            logger.info(f"Page source saved to: {debug_file}")
-            
+            officials_section = self.ready.wait_for((By.CLASS_NAME, "activeofficials"), "officials table")
         except TimeoutException:
             logger.error("Timeout waiting for officials section to load")
-        except Exception as e:
-            logger.error(f"Error extracting contact: {e}")
-            
+            raise
+        
+        # Handle cookie consent once the page has rendered
+        self.consent.handle()
+        
+        start = time.monotonic()
+        if self.extraction_mode == 'webdriver':
+            all_officials = self._extract_officials_webdriver(officials_section)
+        else:
+            all_officials = self._extract_officials_script()
+        self.ready.record("extraction", start)
+        
+        administrator = select_administrator(all_officials)
+        if administrator:
+            if self.cache:
+                self.cache.put("contact", players_url, administrator)
+            return administrator
+        
+        logger.warning("No officials with contact information found")
+        
+        # Debug: save page source if no administrator found
+        start = time.monotonic()
+        debug_file = self.output_dir / f"debug_contact_{int(time.time())}.html"
+        with open(debug_file, 'w') as f:
+            f.write(self.driver.page_source)
+        logger.info(f"Page source saved to: {debug_file}")
+        self.ready.record("debug dump", start)
+        
         return None
     
+    def _extract_officials_script(self) -> List[Dict[str, str]]:
+        """Collect all officials with one injected script call."""
+        officials = []
+        for official in self.driver.execute_script(OFFICIALS_SCRIPT) or []:
+            contact_info = {
+                'name': official['name'],
+                'email': official['email']
+            }
+            if official.get('phone'):
+                contact_info['phone'] = official['phone']
+            contact_info['position'] = official['position']
+            officials.append(contact_info)
+            logger.info(f"Found official: {contact_info['position']} - {contact_info['name']}")
+        
+        return officials
+    
+    def _extract_officials_webdriver(self, officials_section) -> List[Dict[str, str]]:
+        """Collect all officials by walking the table element by element."""
+        # Find the table inside the officials section
+        table = officials_section.find_element(By.TAG_NAME, "table")
+        rows = table.find_elements(By.TAG_NAME, "tr")
+        
+        logger.debug(f"Found {len(rows)} rows in officials table")
+        
+        # Collect all officials with contact information
+        all_officials = []
+        
+        for row in rows:
+            try:
+                cells = row.find_elements(By.TAG_NAME, "td")
+                
+                if len(cells) >= 2:
+                    # Get position from first cell
+                    position = cells[0].text.strip()
+                    
+                    # Extract contact from the row
+                    contact_info = self._extract_contact_from_row(row)
+                    
+                    if contact_info:
+                        contact_info['position'] = position
+                        all_officials.append(contact_info)
+                        logger.info(f"Found official: {position} - {contact_info['name']}")
+                        
+            except Exception as e:
+                logger.debug(f"Error processing row: {e}")
+        
+        return all_officials
+    
     def _extract_contact_from_row(self, row) -> Optional[Dict[str, str]]:
         """Extract contact information from a table row."""
         try:
@@ -120,16 +287,19 @@ class ContactPage:
         try:
             # Get the name from the first <a> tag
             name_link = cell.find_element(By.TAG_NAME, "a")
-            name = name_link.text.strip()
+            name = " ".join(name_link.text.split())
             
             # Look for contact info in the nested structure
             email = None
             phone = None
             
             try:
-                # Find all links within the nested div
-                div_in_link = name_link.find_element(By.TAG_NAME, "div")
-                contact_links = div_in_link.find_elements(By.TAG_NAME, "a")
+                # Find all links within the contact div, leaving its text out of the name
+                contact_div = cell.find_element(By.TAG_NAME, "div")
+                contact_text = " ".join(contact_div.text.split())
+                if contact_text and name.endswith(contact_text):
+                    name = name[:-len(contact_text)].strip()
+                contact_links = contact_div.find_elements(By.TAG_NAME, "a")
                 
                 for link in contact_links:
                     href = link.get_attribute("href")
@@ -160,51 +330,3 @@ class ContactPage:
             logger.debug(f"Error extracting contact from cell: {e}")
             
         return None
-    
-    def _handle_cookie_consent(self):
-        """Handle cookie consent popup if it appears."""
-        try:
-            # Check if cookie consent is present
-            consent_dialog = self.driver.find_elements(By.ID, "CybotCookiebotDialog")
-            if consent_dialog and consent_dialog[0].is_displayed():
-                logger.info("Cookie consent dialog found")
-                
-                # Try to click "Allow all" button
-                try:
-                    allow_all_button = self.driver.find_element(
-                        By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"
-                    )
-                    if allow_all_button.is_displayed():
-                        allow_all_button.click()
-                        logger.info("Clicked 'Allow all' button")
-                        time.sleep(1)
-                        return
-                except NoSuchElementException:
-                    pass
-                    
-                # Try alternative button IDs or classes
-                alternative_selectors = [
-                    "CybotCookiebotDialogBodyButtonAccept",
-                    ".cookie-accept",
-                    "[data-accept-cookies]"
-                ]
-                
-                for selector in alternative_selectors:
-                    try:
-                        if selector.startswith("#"):
-                            button = self.driver.find_element(By.ID, selector[1:])
-                        elif selector.startswith("."):
-                            button = self.driver.find_element(By.CLASS_NAME, selector[1:])
-                        else:
-                            button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            
-                        if button.is_displayed():
-                            button.click()
-                            logger.info(f"Clicked consent button: {selector}")
-                            time.sleep(1)
-                            return
-                    except NoSuchElementException:
-                        continue
-                        
-        except Exception as e:
-            logger.debug(f"No cookie consent or error handling it: {e}")
\ No newline at end of file
@@ -4,16 +4,66 @@ Teams page object - Handles scraping team URLs from league pages.
 import logging
 import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List
+from urllib.parse import urljoin
 
+from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+from src.pages.consent import ConsentHandler
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.waits import ReadinessWaiter
 
 logger = logging.getLogger(__name__)
 
 
+def parse_teams_html(html: str, base_url: str) -> List[Dict[str, str]]:
+    """Parse team links out of a league page snapshot.
+    
+    Mirrors the WebDriver walk in ``TeamsPage._iter_teams_webdriver``:
+    every ``tr`` of every ``table``, links in the third ``td`` that point
+    at ``/team/`` (excluding the ``/team/0/`` placeholder).
+    
+    Args:
+        html: Page source of the league page
+        base_url: URL the page was loaded from, used to resolve relative hrefs
+        
+    Returns:
+        List of dictionaries containing team information
+    """
+    return list(iter_teams_html(html, base_url))
+
+
+def iter_teams_html(html: str, base_url: str) -> Iterator[Dict[str, str]]:
+    """Yield team links out of a league page snapshot as they are parsed.
+    
+    Streaming variant of ``parse_teams_html``.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    
+    for table in soup.find_all("table"):
+        for row in table.find_all("tr"):
+            cells = row.find_all("td")
+            if len(cells) < 3:
+                continue
+            
+            for link in cells[2].find_all("a"):
+                href = link.get("href")
+                if not href:
+                    continue
+                href = urljoin(base_url, href)
+                
+                if '/team/' in href and '/team/0/' not in href:
+                    name = " ".join(link.get_text().split())
+                    if name:
+                        logger.debug(f"Found team: {name}")
+                        yield {'name': name, 'url': href}
+                elif '/team/0/' in href:
+                    logger.debug(f"Skipping null team placeholder: {href}")
+
+
 class TeamsPage:
     """Page object for extracting team information from league pages."""
     
@@ -21,6 +71,10 @@ class TeamsPage:
         self.driver = driver
         self.config = config
         self.wait = WebDriverWait(driver, 20)
+        self.ready = ReadinessWaiter.from_config(driver, config)
+        self.consent = ConsentHandler(driver, self.ready)
+        self.extraction_mode = config.get('extraction', {}).get('teams', 'page_source')
+        self.cache = SnapshotCache.from_config(config)
         self.output_dir = Path("data/intermediate")
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -33,69 +87,68 @@ class TeamsPage:
         Returns:
             List of dictionaries containing team information
         """
-        logger.info(f"Navigating to league page: {league_url}")
-        self.driver.get(league_url)
+        return list(self.iter_teams(league_url))
+    
+    def iter_teams(self, league_url: str) -> Iterator[Dict[str, str]]:
+        """Yield team URLs from a league page as they are parsed.
         
-        # Handle cookie consent if needed
-        self._handle_cookie_consent()
+        Args:
+            league_url: URL of the league page
+            
+        Yields:
+            Dictionaries containing team information
+            
+        Raises:
+            TimeoutException: If the league tables do not load. Errors are
+                raised rather than ending the league with no teams, so the
+                league is not recorded as fetched
+        """
+        if self.cache:
+            cached = self.cache.get("teams", league_url)
+            if cached is not None:
+                logger.info(f"Using cached teams for league page: {league_url}")
+                yield from cached
+                return
         
-        # Wait for page to load
-        time.sleep(self.config.get('delays', {}).get('page_load', 3))
+        logger.info(f"Navigating to league page: {league_url}")
+        self.ready.navigate(league_url)
         
-        teams = []
+        # Only kept when there is a cache to store the league in
+        teams = [] if self.cache else None
+        count = 0
         
         try:
             # Wait for tables to load
             logger.info("Waiting for tables to load")
             
-            # Wait for at least one table to be present
-            self.wait.until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
+            # Wait for at least one table to be present and rendering to settle
+            self.ready.wait_for((By.TAG_NAME, "table"), "league tables")
             
-            # Find all tables on the page
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
-            logger.info(f"Found {len(tables)} tables on the page")
+            # Handle cookie consent once the page has rendered
+            self.consent.handle()
             
-            # Process each table
-            for table_idx, table in enumerate(tables):
-                try:
-                    rows = table.find_elements(By.TAG_NAME, "tr")
-                    logger.debug(f"Table {table_idx + 1} has {len(rows)} rows")
-                    
-                    for row_idx, row in enumerate(rows):
-                        try:
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            
-                            # Check if third cell exists and contains a link
-                            if len(cells) >= 3:
-                                third_cell = cells[2]  # 0-indexed, so 3rd cell is index 2
-                                links = third_cell.find_elements(By.TAG_NAME, "a")
-                                
-                                for link in links:
-                                    href = link.get_attribute('href')
-                                    if href and '/team/' in href and '/team/0/' not in href:
-                                        team_info = {
-                                            'name': link.text.strip(),
-                                            'url': href
-                                        }
-                                        if team_info['name']:  # Only add if name is not empty
-                                            teams.append(team_info)
-                                            logger.debug(f"Found team: {team_info['name']}")
-                                    elif href and '/team/0/' in href:
-                                        logger.debug(f"Skipping null team placeholder: {href}")
-                                            
-                        except Exception as e:
-                            logger.debug(f"Error processing row {row_idx} in table {table_idx}: {e}")
-                            
-                except Exception as e:
-                    logger.debug(f"Error processing table {table_idx}: {e}")
+            start = time.monotonic()
+            if self.extraction_mode == 'webdriver':
+                found = self._iter_teams_webdriver()
+            else:
+                # One page_source round trip instead of one per table/row/cell/link
+                found = iter_teams_html(self.driver.page_source, self.driver.current_url)
+            for team in found:
+                count += 1
+                if teams is not None:
+                    teams.append(team)
+                yield team
+            self.ready.record("extraction", start)
             
-            logger.info(f"Total teams found: {len(teams)}")
+            logger.info(f"Total teams found: {count}")
+            
+            if teams:
+                self.cache.put("teams", league_url, teams)
                 
             # Debug: save page source if no teams found
-            if len(teams) == 0:
+            if count == 0:
                 logger.warning("No teams found on the page, saving page source for debugging")
+                start = time.monotonic()
                 debug_file = self.output_dir / f"debug_teams_page_{int(time.time())}.html"
                 with open(debug_file, 'w') as f:
                     f.write(self.driver.page_source)
@@ -105,63 +158,58 @@ class TeamsPage:
                 screenshot_file = self.output_dir / f"debug_teams_screenshot_{int(time.time())}.png"
                 self.driver.save_screenshot(str(screenshot_file))
                 logger.info(f"Screenshot saved to: {screenshot_file}")
+                self.ready.record("debug dump", start)
                 
         except TimeoutException:
             logger.error("Timeout waiting for tables to load")
             # Save debug info even on timeout
+            start = time.monotonic()
             debug_file = self.output_dir / f"debug_timeout_{int(time.time())}.html"
             with open(debug_file, 'w') as f:
                 f.write(self.driver.page_source)
             logger.info(f"Page source saved to: {debug_file}")
+            self.ready.record("debug dump", start)
+            raise
         except Exception as e:
             logger.error(f"Error extracting teams: {e}")
-            
-        return teams
+            raise
     
-    def _handle_cookie_consent(self):
-        """Handle cookie consent popup if it appears."""
-        try:
-            # Check if cookie consent is present
-            consent_dialog = self.driver.find_elements(By.ID, "CybotCookiebotDialog")
-            if consent_dialog and consent_dialog[0].is_displayed():
-                logger.info("Cookie consent dialog found")
-                
-                # Try to click "Allow all" button
-                try:
-                    allow_all_button = self.driver.find_element(
-                        By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"
-                    )
-                    if allow_all_button.is_displayed():
-                        allow_all_button.click()
-                        logger.info("Clicked 'Allow all' button")
-                        time.sleep(1)
-                        return
-                except NoSuchElementException:
-                    pass
-                    
-                # Try alternative button IDs or classes
-                alternative_selectors = [
-                    "CybotCookiebotDialogBodyButtonAccept",
-                    ".cookie-accept",
-                    "[data-accept-cookies]"
-                ]
+    def _iter_teams_webdriver(self) -> Iterator[Dict[str, str]]:
+        """Yield team links by walking the tables element by element."""
+        # Find all tables on the page
+        tables = self.driver.find_elements(By.TAG_NAME, "table")
+        logger.info(f"Found {len(tables)} tables on the page")
+        
+        # Process each table
+        for table_idx, table in enumerate(tables):
+            try:
+                rows = table.find_elements(By.TAG_NAME, "tr")
+                logger.debug(f"Table {table_idx + 1} has {len(rows)} rows")
                 
-                for selector in alternative_selectors:
+                for row_idx, row in enumerate(rows):
                     try:
-                        if selector.startswith("#"):
-                            button = self.driver.find_element(By.ID, selector[1:])
-                        elif selector.startswith("."):
-                            button = self.driver.find_element(By.CLASS_NAME, selector[1:])
-                        else:
-                            button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                        cells = row.find_elements(By.TAG_NAME, "td")
+                        
+                        # Check if third cell exists and contains a link
+                        if len(cells) >= 3:
+                            third_cell = cells[2]  # 0-indexed, so 3rd cell is index 2
+                            links = third_cell.find_elements(By.TAG_NAME, "a")
                             
-                        if button.is_displayed():
-                            button.click()
-                            logger.info(f"Clicked consent button: {selector}")
-                            time.sleep(1)
-                            return
-                    except NoSuchElementException:
-                        continue
+                            for link in links:
+                                href = link.get_attribute('href')
+                                if href and '/team/' in href and '/team/0/' not in href:
+                                    team_info = {
+                                        'name': link.text.strip(),
+                                        'url': href
+                                    }
+                                    if team_info['name']:  # Only add if name is not empty
+                                        logger.debug(f"Found team: {team_info['name']}")
+                                        yield team_info
+                                elif href and '/team/0/' in href:
+                                    logger.debug(f"Skipping null team placeholder: {href}")
+                                        
+                    except Exception as e:
+                        logger.debug(f"Error processing row {row_idx} in table {table_idx}: {e}")
                         
-        except Exception as e:
-            logger.debug(f"No cookie consent or error handling it: {e}")
\ No newline at end of file
+            except Exception as e:
+                logger.debug(f"Error processing table {table_idx}: {e}")
@@ -4,20 +4,30 @@ Scraper for Stage 1: Categories page.
 
 import json
 import logging
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
 
-from src.utils.browser import BrowserManager
-from src.pages.categories_page import CategoriesPage
+from src.utils.browser import BrowserManager, BrowserPool, browser_options
+from src.utils.instrumentation import CommandCounter, RunReport
+from src.utils.jsonl import JsonLinesWriter, write_json_stream
+from src.utils.store import ResultStore
+from src.pages.categories_page import DEFAULT_FILTERS, CategoriesPage
 
 logger = logging.getLogger(__name__)
 
+# Tells the merging thread that one filter combination has finished
+_DONE = object()
+
 
 class CategoriesScraper:
     def __init__(self, config_path="config/scraper.json"):
         with open(config_path) as f:
             self.config = json.load(f)
+        self.store = ResultStore.from_config(self.config)
     
     def explore(self):
         """Explore the categories page to understand its structure."""
@@ -25,7 +35,7 @@ class CategoriesScraper:
         
         # For exploration, let's use non-headless mode
         with BrowserManager(headless=False, window_size=browser_config.get("window_size", "1920,1080")) as driver:
-            page = CategoriesPage(driver)
+            page = CategoriesPage(driver, self.config)
             page.navigate()
             
             # Explore the filter structure
@@ -52,8 +62,17 @@ class CategoriesScraper:
             # Keep browser open for manual inspection
             input("\nPress Enter to close the browser and continue...\n")
     
-    def scrape(self, delay=2.0, resume=False, dry_run=False):
-        """Scrape league/cup URLs from categories page."""
+    def scrape(self, delay=2.0, resume=False, dry_run=False, on_league=None, workers=1):
+        """Scrape league/cup URLs from categories page.
+        
+        The filter combinations from ``filter_sets`` are swept on up to
+        ``workers`` browsers, and the leagues are merged by category URL.
+        
+        Args:
+            workers: Number of browsers sweeping filter combinations concurrently
+            on_league: Optional callback called with each league as soon as it
+                is first parsed from the results
+        """
         logger.info("Starting Categories scraper")
         
         if dry_run:
@@ -66,48 +85,29 @@ class CategoriesScraper:
         # Check if resuming
         if resume and output_path.exists():
             logger.info(f"Resuming: {output_path} already exists, skipping categories stage")
+            if on_league:
+                with open(output_path, encoding="utf-8") as f:
+                    for league in json.load(f).get("leagues", []):
+                        on_league(league)
             return
         
-        browser_config = self.config.get("browser", {})
-        results = []
+        filter_sets = self.filter_sets()
+        report = RunReport("categories")
         
         try:
-            with BrowserManager(
-                headless=browser_config.get("headless", True),
-                window_size=browser_config.get("window_size", "1920,1080")
-            ) as driver:
-                page = CategoriesPage(driver)
-                page.navigate()
-                
-                # Apply filters
-                logger.info("Applying filters...")
-                success = page.apply_filters_for_scraping()
-                
-                if not success:
-                    raise Exception("Failed to apply filters")
-                
-                # Get results
-                results = page.get_results()
-                logger.info(f"Found {len(results)} leagues/cups")
-                
-                # Add metadata
-                data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "filters_applied": {
-                        "sport": "Jalkapallo (Football)",
-                        "area": "Etelä (South)",
-                        "type": "Sarja/cup (Leagues and Cups)",
-                        "gender": "Pojat (Boys)",
-                        "age": "All ages"
-                    },
-                    "leagues": results
-                }
-                
-                # Save results
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                
-                logger.info(f"Saved {len(results)} leagues to {output_path}")
+            leagues = self._sweep(filter_sets, report, on_league, workers)
+            
+            if self.store:
+                # leagues.json is exported from the store once the listing is saved
+                self.store.start_listing()
+                for position, league in enumerate(leagues):
+                    self.store.save_league(league, position)
+                leagues = self.store.listed_leagues()
+            
+            count = self.write_leagues(output_path, filter_sets, leagues)
+            report.write()
+            
+            logger.info(f"Saved {count} leagues to {output_path}")
                 
         except Exception as e:
             logger.error(f"Error during categories scraping: {e}")
@@ -115,3 +115,118 @@ class CategoriesScraper:
         
         finally:
             time.sleep(delay)  # Respect rate limiting
+    
+    def filter_sets(self) -> List[Dict[str, Any]]:
+        """Return the filter combinations to sweep from the ``filters`` config.
+        
+        Each combination is ``{"name": ..., "buttons": [{value, text}, ...]}``;
+        the name defaults to the joined button values. Without a ``filters``
+        section the page's default combination is swept alone.
+        """
+        filter_sets = []
+        for filter_set in self.config.get("filters") or [{"buttons": DEFAULT_FILTERS}]:
+            buttons = filter_set["buttons"]
+            name = filter_set.get("name") or "-".join(
+                button.get("value") or button.get("text") for button in buttons
+            )
+            filter_sets.append({"name": name, "buttons": buttons})
+        return filter_sets
+    
+    def _sweep(self, filter_sets: List[Dict[str, Any]], report: RunReport,
+               on_league=None, workers: int = 1) -> List[Dict[str, Any]]:
+        """Collect leagues for every filter combination in parallel.
+        
+        Combinations share a pool of at most ``workers`` browsers and wait
+        for a lease when all of them are busy. Leagues are merged by
+        category URL as they are parsed, and each one lists the names of the
+        combinations that found it under ``filters``. ``on_league`` is
+        called on the calling thread the first time a league is seen.
+        
+        Returns:
+            Merged leagues, ordered by the first combination and position
+            each was found at
+        """
+        browser_config = self.config.get("browser", {})
+        found = queue.Queue()
+        
+        def sweep(index, filter_set):
+            try:
+                with pool.acquire() as driver:
+                    counter = CommandCounter.attach(driver)
+                    calls, start = counter.count, time.monotonic()
+                    page = CategoriesPage(driver, self.config)
+                    page.navigate()
+                    
+                    # Apply filters
+                    logger.info(f"Applying filters '{filter_set['name']}'...")
+                    if not page.apply_filters_for_scraping(filter_set['buttons']):
+                        raise Exception(f"Failed to apply filters '{filter_set['name']}'")
+                    
+                    # Each league is merged as soon as it is parsed
+                    for position, league in enumerate(page.iter_results(filter_set['name'])):
+                        found.put(((index, position), league))
+                    
+                    report.add_page(page.url, page.ready.timings,
+                                    time.monotonic() - start, counter.count - calls)
+            finally:
+                found.put(_DONE)
+        
+        merged: Dict[str, Dict[str, Any]] = {}
+        first_seen: Dict[str, Tuple[int, int]] = {}
+        
+        size = min(workers, len(filter_sets))
+        
+        with BrowserPool(
+            size=size,
+            warm=False,
+            **browser_options(browser_config, stage="categories")
+        ) as pool, ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(sweep, i, filter_set) for i, filter_set in enumerate(filter_sets)]
+            
+            remaining = len(futures)
+            while remaining:
+                item = found.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                
+                seen_at, league = item
+                name = filter_sets[seen_at[0]]['name']
+                existing = merged.get(league['url'])
+                if existing is not None:
+                    if name not in existing['filters']:
+                        existing['filters'].append(name)
+                    first_seen[league['url']] = min(first_seen[league['url']], seen_at)
+                    continue
+                
+                merged[league['url']] = {**league, 'filters': [name]}
+                first_seen[league['url']] = seen_at
+                if on_league:
+                    on_league(merged[league['url']])
+            
+            # Fail the stage if any combination failed
+            for future in futures:
+                future.result()
+        
+        leagues = sorted(merged.values(), key=lambda league: first_seen[league['url']])
+        logger.info(f"Found {len(leagues)} unique leagues across {len(filter_sets)} filter combinations")
+        return leagues
+    
+    def write_leagues(self, output_path: Path, filter_sets: List[Dict[str, Any]],
+                      leagues: Iterable[Dict[str, Any]]) -> int:
+        """Stream leagues to leagues.json and leagues.jsonl.
+        
+        Returns:
+            Number of leagues written
+        """
+        # Metadata goes ahead of the league list
+        with JsonLinesWriter(output_path.with_suffix(".jsonl")) as lines:
+            def stream():
+                for league in leagues:
+                    lines.write(league)
+                    yield league
+            
+            return write_json_stream(output_path, {
+                "timestamp": datetime.now().isoformat(),
+                "filters_applied": filter_sets
+            }, "leagues", stream())
@@ -5,12 +5,24 @@ Extracts team administrator (Joukkueenjohtaja) contact information from team pag
 import csv
 import json
 import logging
-from datetime import datetime
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, Any, Optional, Tuple
 
+from src.pages.contact_http_page import ContactHttpPage
 from src.pages.contact_page import ContactPage
-from src.utils.browser import BrowserManager
+from src.utils.browser import BrowserPool, browser_options
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.concurrency import AIMDController, Slot, adaptive_slot
+from src.utils.contacts import ContactIndex
+from src.utils.instrumentation import CommandCounter, RunReport
+from src.utils.jsonl import JsonLinesWriter, read_json_lines
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.store import ResultStore
+from src.utils.teams import parse_team_id, plan_incremental_fetches, plan_team_fetches
+from src.utils.crawl_engine import run_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +40,112 @@ class ContactScraper:
         self.output_dir = Path("data")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.intermediate_dir = Path("data/intermediate")
+        self.journal = CheckpointJournal(self.intermediate_dir / "contacts_journal.jsonl", key_field="team_id")
+        self.cache = SnapshotCache.from_config(config)
+        self.report = RunReport("contact")
+        self.store = ResultStore.from_config(config)
+        # Keep-alive session for the browser-free fast path, if configured
+        self.http_session = ContactHttpPage.create_session(config) if ContactHttpPage.enabled(config) else None
+        # Store records fetched before this are ignored unless resuming
+        self._since = None
         
-    def scrape(self) -> Path:
+    def scrape(self, workers: int = 1, engine: str = "threads", resume: bool = False,
+               adaptive: bool = False, incremental: bool = False) -> Path:
         """Scrape contact information from all teams collected in Stage 2.
         
+        Teams appearing in several leagues are fetched once per team ID.
+        Every fetched team is appended to the checkpoint journal, or saved to
+        the result store if configured, and contacts.csv is built from those
+        records at the end, with one row per league appearance before
+        de-duplication.
+        
+        Args:
+            workers: Number of browsers processing teams concurrently
+            engine: "threads" for a thread pool, "async" for the asyncio crawl engine
+            resume: Skip teams already in the journal instead of starting over
+            adaptive: Let an AIMD controller pick how many of the workers are busy
+            incremental: Keep earlier results and only fetch teams that are new,
+                changed leagues, or were fetched longer ago than
+                ``incremental.max_age_days``
+            
         Returns:
             Path to the output CSV file with contact information
         """
         logger.info("Starting Stage 3: Contact scraping")
         
+        all_teams = list(self._iter_team_appearances())
+        logger.info(f"Found {len(all_teams)} teams to process")
+        
+        plan = plan_team_fetches(all_teams)
+        
+        if incremental:
+            max_age = timedelta(days=self.config.get('incremental', {}).get('max_age_days', 7))
+            pending = plan_incremental_fetches(plan, self.begin(resume=True), max_age)
+            if self.cache:
+                # Stale teams must come from the site; a cache entry would hand
+                # back the same stale contact under a fresh timestamp
+                for team in pending:
+                    self.cache.invalidate("contact", self._players_url(team['team_url']))
+        else:
+            done = self.begin(resume)
+            pending = [team for team in plan if team['team_id'] not in done]
+            if done:
+                logger.info(f"Resuming: {len(plan) - len(pending)} teams already in journal, "
+                            f"{len(pending)} left")
+        
+        browser_config = self.config.get("browser", {})
+        controller = AIMDController.from_config(self.config, workers) if adaptive else None
+        
+        try:
+            with BrowserPool(
+                size=workers,
+                max_pages=browser_config.get("recycle_after", 100),
+                # Browsers are only started for cache or fast path misses
+                warm=self.cache is None and self.http_session is None and bool(pending),
+                **browser_options(browser_config, stage="contact")
+            ) as pool, self.checkpoint():
+                def process(item):
+                    i, team = item
+                    logger.info(f"Processing team {i}/{len(pending)}: {team['team_name']}")
+                    self.fetch_team(pool, team, controller)
+                
+                list(run_jobs(
+                    list(enumerate(pending, 1)), process, workers, engine,
+                    url_of=lambda item: item[1]['team_url'], config=self.config
+                ))
+                
+        except Exception as e:
+            logger.error(f"Failed to complete contact scraping: {e}")
+            raise
+        
+        done = self.load_done()
+        if incremental:
+            # Merge: keep one record per team still listed, drop the rest
+            current = {team['team_id'] for team in plan}
+            done = {team_id: record for team_id, record in done.items() if team_id in current}
+            self.save_done(done)
+        return self.write_contacts(self._iter_team_appearances(), done)
+    
+    def _iter_team_appearances(self) -> Iterator[Dict[str, str]]:
+        """Yield one entry per team per league from the Stage 2 output.
+        
+        Queries the result store if configured. Otherwise streams teams.jsonl
+        when present, falling back to teams.json from runs that predate it.
+        """
+        if self.store:
+            yield from self.store.iter_team_appearances()
+            return
+        
+        teams_lines = self.intermediate_dir / "teams.jsonl"
+        if teams_lines.exists():
+            for line in read_json_lines(teams_lines):
+                yield {
+                    'league_name': line['league_name'],
+                    'team_name': line['team_name'],
+                    'team_url': line['team_url']
+                }
+            return
+        
         # Load teams data from Stage 2
         teams_file = self.intermediate_dir / "teams.json"
         if not teams_file.exists():
@@ -45,101 +154,239 @@ class ContactScraper:
         with open(teams_file, 'r') as f:
             teams_data = json.load(f)
             
-        all_teams = []
         for league in teams_data.get('leagues', []):
             for team in league.get('teams', []):
-                all_teams.append({
+                yield {
                     'league_name': league['league_name'],
                     'team_name': team['name'],
                     'team_url': team['url']
-                })
-                
-        logger.info(f"Found {len(all_teams)} teams to process")
+                }
+    
+    def begin(self, resume: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Start a run and return the records it can skip.
         
-        contacts = []
-        browser_config = self.config.get("browser", {})
+        Without ``resume`` the journal is emptied; with a result store,
+        earlier records are kept but ignored by ``load_done`` instead.
+        
+        Returns:
+            Fetched contact records keyed by team_id
+        """
+        self._since = None
+        if not resume:
+            if self.store:
+                self._since = datetime.now().isoformat()
+            else:
+                self.journal.reset()
+        return self.load_done()
+    
+    @contextmanager
+    def checkpoint(self):
+        """Keep records of the enclosed fetches durable.
+        
+        Opens the journal for appending, or with a result store commits its
+        last batch on the way out, including on errors and Ctrl-C.
+        """
+        if self.store is None:
+            with self.journal:
+                yield
+            return
         
         try:
-            with BrowserManager(
-                headless=browser_config.get("headless", True),
-                window_size=browser_config.get("window_size", "1920,1080")
-            ) as driver:
-                contact_page = ContactPage(driver, self.config)
-                
-                for i, team in enumerate(all_teams, 1):
-                    logger.info(f"Processing team {i}/{len(all_teams)}: {team['team_name']}")
-                    
-                    # Skip null team placeholders
-                    if '/team/0/' in team['team_url']:
-                        logger.warning(f"  Skipping null team placeholder: {team['team_url']}")
-                        continue
-                    
-                    try:
-                        # Convert /info URL to /players URL
-                        players_url = team['team_url'].replace('/info', '/players')
-                        
-                        contact_info = contact_page.extract_contact(players_url)
-                        
-                        if contact_info:
-                            contact_data = {
-                                'league': team['league_name'],
-                                'team': team['team_name'],
-                                'administrator_name': contact_info['name'],
-                                'position': contact_info.get('position', 'Unknown'),
-                                'email': contact_info['email']
-                            }
-                            
-                            # Add phone if available
-                            if 'phone' in contact_info:
-                                contact_data['phone'] = contact_info['phone']
-                            
-                            contacts.append(contact_data)
-                            logger.info(f"  Found administrator: {contact_info['name']} ({contact_info.get('position', 'Unknown')})")
-                        else:
-                            logger.warning(f"  No administrator found for {team['team_name']}")
-                            
-                    except Exception as e:
-                        logger.error(f"  Error processing team: {e}")
-                        
-                # Remove duplicates (same administrator might manage multiple teams)
-                unique_contacts = []
-                seen_emails = set()
-                
-                for contact in contacts:
-                    email = contact['email']
-                    if email not in seen_emails:
-                        seen_emails.add(email)
-                        unique_contacts.append(contact)
-                    else:
-                        # Find existing contact and append team info
-                        for existing in unique_contacts:
-                            if existing['email'] == email:
-                                existing['team'] += f", {contact['team']}"
-                                existing['league'] += f", {contact['league']}"
-                                # If positions differ, append both
-                                if contact['position'] != existing['position']:
-                                    existing['position'] += f", {contact['position']}"
-                                break
-                
-                # Save results to CSV
-                output_file = self.output_dir / "contacts.csv"
-                with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                    # Include phone field if any contacts have phone numbers
-                    has_phone = any('phone' in contact for contact in unique_contacts)
-                    fieldnames = ['administrator_name', 'position', 'email', 'team', 'league']
-                    if has_phone:
-                        fieldnames.insert(3, 'phone')  # Insert phone after email
-                    
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    
-                    writer.writeheader()
-                    writer.writerows(unique_contacts)
-                
-                logger.info(f"Contact data saved to {output_file}")
-                logger.info(f"Total unique administrators found: {len(unique_contacts)}")
-                
-                return output_file
-                
-        except Exception as e:
-            logger.error(f"Failed to complete contact scraping: {e}")
-            raise
\ No newline at end of file
+            yield
+        finally:
+            self.store.flush()
+    
+    def load_done(self) -> Dict[str, Dict[str, Any]]:
+        """Return the contact records of this run, keyed by team_id.
+        
+        An indexed query on the result store if configured, else a read of
+        the journal.
+        """
+        if self.store:
+            return self.store.contact_records(since=self._since)
+        return self.journal.load()
+    
+    def save_done(self, done: Dict[str, Dict[str, Any]]):
+        """Persist records whose leagues were updated after fetching."""
+        if self.store:
+            self.store.update_contact_leagues(done.values())
+        else:
+            self.journal.rewrite(done)
+    
+    def fetch_team(self, pool: BrowserPool, team: Dict[str, Any],
+                   controller: Optional[AIMDController] = None):
+        """Fetch the contact of one planned team and record it in the journal or store.
+        
+        Args:
+            pool: Browser pool the page is fetched with
+            team: Entry from ``plan_team_fetches``
+            controller: Optional adaptive concurrency controller
+        """
+        # Skip null team placeholders
+        if '/team/0/' in team['team_url']:
+            logger.warning(f"  Skipping null team placeholder: {team['team_url']}")
+            return
+        
+        with adaptive_slot(controller) as slot:
+            try:
+                contact_info, fetched_at = self._fetch_contact(pool, team['team_url'], slot)
+            except Exception as e:
+                # Not journaled, so the team is retried on --resume
+                slot.fail(type(e).__name__)
+                logger.error(f"  Error processing team {team['team_name']}: {e}")
+                return
+        
+        if contact_info:
+            logger.info(f"  Found administrator for {team['team_name']}: "
+                        f"{contact_info['name']} ({contact_info.get('position', 'Unknown')})")
+        else:
+            logger.warning(f"  No administrator found for {team['team_name']}")
+        
+        record = {
+            'team_id': team['team_id'],
+            'team_url': team['team_url'],
+            'leagues': sorted({a['league_name'] for a in team['appearances']}),
+            'fetched_at': fetched_at.isoformat(),
+            'contact': contact_info
+        }
+        if self.store:
+            self.store.save_contact(record)
+        else:
+            self.journal.append(record)
+    
+    def write_contacts(self, all_teams: Iterable[Dict[str, str]], done: Dict[str, Dict[str, Any]]) -> Path:
+        """Write contacts.csv, contacts.jsonl and the stage's run report.
+        
+        Each fetched contact is fanned back out to every league the team
+        appears in, then de-duplicated by administrator. With
+        ``output.contacts_parquet`` set, the rows before de-duplication are
+        also written there in long format.
+        
+        Args:
+            all_teams: Team entries with league_name, team_name and team_url
+            done: Journal or store records keyed by team_id
+            
+        Returns:
+            Path to the output CSV file with contact information
+        """
+        parquet_file = self.config.get('output', {}).get('contacts_parquet')
+        long_rows = []
+        
+        # Remove duplicates (same administrator might manage multiple teams)
+        index = ContactIndex()
+        for team in all_teams:
+            record = done.get(parse_team_id(team['team_url']))
+            if record and record['contact']:
+                row = self._contact_row(team, record['contact'])
+                index.add(row)
+                if parquet_file:
+                    long_rows.append(row)
+        
+        # Save results to CSV, and to JSON Lines row by row alongside it
+        output_file = self.output_dir / "contacts.csv"
+        with open(output_file, 'w', newline='', encoding='utf-8') as f, \
+                JsonLinesWriter(self.output_dir / "contacts.jsonl") as lines:
+            # Include phone field if any contacts have phone numbers
+            fieldnames = ['administrator_name', 'position', 'email', 'team', 'league']
+            if index.has_phone:
+                fieldnames.insert(3, 'phone')  # Insert phone after email
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            
+            writer.writeheader()
+            for row in index.iter_rows():
+                writer.writerow(row)
+                lines.write(row)
+        
+        logger.info(f"Contact data saved to {output_file}")
+        if parquet_file:
+            # Imported here so runs without Parquet output never load pandas
+            from src.utils.parquet_export import write_contacts_parquet
+            write_contacts_parquet(parquet_file, long_rows)
+        logger.info(f"Total unique administrators found: {len(index)}")
+        if self.cache:
+            logger.info(f"Pages served from snapshot cache: {self.cache.hits}")
+        self.report.write()
+        
+        return output_file
+    
+    def _fetch_contact(self, pool: BrowserPool, team_url: str,
+                       slot: Optional[Slot] = None) -> Tuple[Optional[Dict[str, str]], datetime]:
+        """Extract the administrator contact of a single team.
+        
+        With the HTTP fast path configured it is tried first, and a browser
+        is only leased when it finds nothing.
+        
+        Args:
+            pool: Browser pool the page is fetched with
+            team_url: Team URL from teams.json
+            slot: Adaptive concurrency slot that page timeouts are reported to
+            
+        Returns:
+            Contact dictionary from the page object, or None if not found, and
+            when the page was fetched (earlier than now for a cache hit)
+            
+        Raises:
+            TimeoutException: If the players page does not load
+            WebDriverException: If the browser session fails
+            requests.HTTPError: If the fast path endpoint is overloaded
+        """
+        players_url = self._players_url(team_url)
+        
+        # Checked here as well as in the page objects to avoid leasing a browser
+        if self.cache:
+            cached = self.cache.get_entry("contact", players_url)
+            if cached is not None:
+                logger.info(f"  Using cached contact for {players_url}")
+                return cached['data'], datetime.fromtimestamp(cached['fetched_at'])
+        
+        if self.http_session is not None:
+            http_page = ContactHttpPage(self.config, self.http_session)
+            start = time.monotonic()
+            try:
+                contact_info = http_page.extract_contact(players_url)
+            finally:
+                self.report.add_page(players_url, http_page.timings, time.monotonic() - start)
+                if slot is not None:
+                    slot.exclude(http_page.rate_limited)
+            if contact_info:
+                return contact_info, datetime.now()
+            logger.info(f"  HTTP fast path found nothing for {players_url}, using browser")
+        
+        with pool.acquire() as driver:
+            counter = CommandCounter.attach(driver)
+            calls, start = counter.count, time.monotonic()
+            contact_page = ContactPage(driver, self.config)
+            try:
+                contact_info = contact_page.extract_contact(players_url)
+            finally:
+                self.report.add_page(players_url, contact_page.ready.timings,
+                                     time.monotonic() - start, counter.count - calls)
+                if slot is not None:
+                    # Measure the site, not the scraper's own throttling
+                    slot.exclude(contact_page.ready.rate_limited)
+            if slot is not None and contact_page.ready.timeouts:
+                slot.fail("TimeoutException")
+        
+        return contact_info, datetime.now()
+    
+    @staticmethod
+    def _players_url(team_url: str) -> str:
+        """Convert a team /info URL to its /players URL."""
+        return team_url.replace('/info', '/players')
+    
+    @staticmethod
+    def _contact_row(team: Dict[str, str], contact_info: Dict[str, str]) -> Dict[str, str]:
+        """Build a contacts.csv row for one team appearance."""
+        contact_data = {
+            'league': team['league_name'],
+            'team': team['team_name'],
+            'administrator_name': contact_info['name'],
+            'position': contact_info.get('position', 'Unknown'),
+            'email': contact_info['email']
+        }
+        
+        # Add phone if available
+        if 'phone' in contact_info:
+            contact_data['phone'] = contact_info['phone']
+        
+        return contact_data
@@ -0,0 +1,183 @@
+"""
+Pipeline scraper - Runs stages 1, 2 and 3 concurrently.
+Leagues flow to team workers and teams flow to contact workers through
+queues as soon as they are found, instead of stage by stage.
+"""
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Any
+
+from src.scrapers.categories_scraper import CategoriesScraper
+from src.scrapers.contact_scraper import ContactScraper
+from src.scrapers.teams_scraper import TeamsScraper
+from src.utils.browser import BrowserPool, browser_options
+from src.utils.concurrency import AIMDController
+from src.utils.teams import parse_team_id
+
+logger = logging.getLogger(__name__)
+
+# Tells a worker that its queue will receive no more items
+_DONE = object()
+
+
+class PipelineScraper:
+    """Streams work from stage 1 through stage 3 with producer/consumer queues.
+    
+    Stage 1 runs on the calling thread and queues each league as it is found.
+    Team workers extract the league's teams and queue every team ID the first
+    time it is seen; contact workers fetch those teams into the contact
+    journal, or the result store if configured. leagues.json, teams.json and
+    contacts.csv are written as in the staged run.
+    """
+    
+    def __init__(self, config_path: str = "config/scraper.json"):
+        """Initialize the pipeline scraper.
+        
+        Args:
+            config_path: Path to the configuration file
+        """
+        self.categories = CategoriesScraper(config_path)
+        self.config = self.categories.config
+        self.teams = TeamsScraper(self.config)
+        self.contacts = ContactScraper(self.config)
+    
+    def scrape(self, delay: float = 2.0, resume: bool = False, workers: int = 1,
+               adaptive: bool = False) -> Path:
+        """Run all three stages as one pipeline.
+        
+        Args:
+            delay: Delay passed to the categories stage
+            resume: Reuse leagues.json and skip teams already in the contact journal
+            workers: Number of browsers for each stage
+            adaptive: Let AIMD controllers pick how many workers are busy per stage
+        
+        Returns:
+            Path to the output CSV file with contact information
+        """
+        logger.info(f"Starting pipelined scraping with {workers} workers per stage")
+        
+        league_queue = queue.Queue()
+        team_queue = queue.Queue()
+        leagues: List[Dict[str, str]] = []
+        league_results: Dict[int, Dict[str, Any]] = {}
+        planned: Dict[str, Dict[str, Any]] = {}
+        lock = threading.Lock()
+        
+        done = self.contacts.begin(resume)
+        if done:
+            logger.info(f"Resuming: {len(done)} teams already in journal")
+        
+        browser_config = self.config.get("browser", {})
+        teams_controller = AIMDController.from_config(self.config, workers) if adaptive else None
+        contact_controller = AIMDController.from_config(self.config, workers) if adaptive else None
+        
+        def queue_league(league):
+            with lock:
+                leagues.append(league)
+                index = len(leagues)
+            league_queue.put((index, league))
+        
+        def teams_worker(pool):
+            for index, league in iter(league_queue.get, _DONE):
+                try:
+                    result = self.teams.fetch_league(pool, league, index, len(leagues), teams_controller)
+                except Exception as e:
+                    logger.error(f"  Error processing league {league['name']}: {e}")
+                    continue
+                if result is None:
+                    continue
+                
+                with lock:
+                    league_results[index] = result
+                    new_teams = []
+                    for team in result['teams']:
+                        appearance = {
+                            'league_name': result['league_name'],
+                            'team_name': team['name'],
+                            'team_url': team['url']
+                        }
+                        team_id = parse_team_id(team['url'])
+                        if team_id in planned:
+                            planned[team_id]['appearances'].append(appearance)
+                            continue
+                        planned[team_id] = {
+                            'team_id': team_id,
+                            'team_url': team['url'],
+                            'team_name': team['name'],
+                            'appearances': [appearance]
+                        }
+                        if team_id not in done:
+                            new_teams.append(planned[team_id])
+                
+                for team in new_teams:
+                    team_queue.put(team)
+        
+        def contact_worker(pool):
+            for team in iter(team_queue.get, _DONE):
+                logger.info(f"Processing team: {team['team_name']}")
+                try:
+                    self.contacts.fetch_team(pool, team, contact_controller)
+                except Exception as e:
+                    logger.error(f"  Error processing team {team['team_name']}: {e}")
+        
+        try:
+            with BrowserPool(
+                size=workers,
+                max_pages=browser_config.get("recycle_after", 100),
+                warm=False,
+                **browser_options(browser_config, stage="teams")
+            ) as teams_pool, BrowserPool(
+                size=workers,
+                max_pages=browser_config.get("recycle_after", 100),
+                warm=False,
+                **browser_options(browser_config, stage="contact")
+            ) as contact_pool, self.contacts.checkpoint():
+                teams_threads = self._start(workers, teams_worker, teams_pool)
+                contact_threads = self._start(workers, contact_worker, contact_pool)
+                
+                try:
+                    self.categories.scrape(delay=delay, resume=resume, on_league=queue_league,
+                                           workers=workers)
+                finally:
+                    # Drain stage 2 before telling stage 3 no more teams will come
+                    self._finish(league_queue, teams_threads)
+                    self._finish(team_queue, contact_threads)
+        
+        except Exception as e:
+            logger.error(f"Pipelined scraping failed: {e}")
+            raise
+        
+        all_teams = [league_results[index] for index in sorted(league_results)]
+        self.teams.write_teams(len(leagues), all_teams)
+        
+        # Journal records carry the leagues known when the team was fetched;
+        # appearances found later are filled in for incremental runs
+        done = self.contacts.load_done()
+        for team_id, team in planned.items():
+            if team_id in done:
+                done[team_id]['leagues'] = sorted({a['league_name'] for a in team['appearances']})
+        self.contacts.save_done(done)
+        
+        appearances = [
+            {'league_name': league['league_name'], 'team_name': team['name'], 'team_url': team['url']}
+            for league in all_teams for team in league['teams']
+        ]
+        return self.contacts.write_contacts(appearances, done)
+    
+    @staticmethod
+    def _start(workers: int, target, pool: BrowserPool) -> List[threading.Thread]:
+        """Start ``workers`` daemon threads running ``target(pool)``."""
+        threads = [threading.Thread(target=target, args=(pool,), daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+    
+    @staticmethod
+    def _finish(work_queue: queue.Queue, threads: List[threading.Thread]):
+        """Signal the end of ``work_queue`` and wait for its workers."""
+        for _ in threads:
+            work_queue.put(_DONE)
+        for thread in threads:
+            thread.join()
@@ -4,12 +4,19 @@ Extracts team URLs from league pages.
 """
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Optional
 
 from src.pages.teams_page import TeamsPage
-from src.utils.browser import BrowserManager
+from src.utils.browser import BrowserPool, browser_options
+from src.utils.concurrency import AIMDController, adaptive_slot
+from src.utils.crawl_engine import run_jobs
+from src.utils.instrumentation import CommandCounter, RunReport
+from src.utils.jsonl import JsonLinesWriter, write_json_stream
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.store import ResultStore
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +33,194 @@ class TeamsScraper:
         self.config = config
         self.output_dir = Path("data/intermediate")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = SnapshotCache.from_config(config)
+        self.report = RunReport("teams")
+        self.store = ResultStore.from_config(config)
         
-    def scrape(self) -> Path:
+    def scrape(self, workers: int = 1, engine: str = "threads", adaptive: bool = False,
+               incremental: bool = False) -> Path:
         """Scrape teams from all leagues collected in Stage 1.
         
+        Args:
+            workers: Number of browsers processing leagues concurrently
+            engine: "threads" for a thread pool, "async" for the asyncio crawl engine
+            adaptive: Let an AIMD controller pick how many of the workers are busy
+            incremental: Reuse leagues from the previous teams.json that are still
+                listed and younger than ``incremental.max_age_days``
+            
         Returns:
             Path to the output file with team URLs
         """
         logger.info("Starting Stage 2: Teams scraping")
         
+        leagues = self._load_leagues()
+        logger.info(f"Found {len(leagues)} leagues to process")
+        
+        output_file = self.output_dir / "teams.json"
+        previous = self._load_previous_leagues(output_file, leagues) if incremental else {}
+        reused = self._load_fresh_leagues(output_file, leagues, previous) if incremental else {}
+        pending = [(i, league) for i, league in enumerate(leagues, 1) if league['url'] not in reused]
+        if incremental and self.cache:
+            # Stale leagues must come from the site; a cache entry would hand
+            # back the same stale teams under a fresh timestamp
+            for _, league in pending:
+                self.cache.invalidate("teams", league['url'])
+        
+        browser_config = self.config.get("browser", {})
+        controller = AIMDController.from_config(self.config, workers) if adaptive else None
+        
+        try:
+            with BrowserPool(
+                size=workers,
+                max_pages=browser_config.get("recycle_after", 100),
+                # With a cache, browsers are only started for misses
+                warm=self.cache is None and bool(pending),
+                **browser_options(browser_config, stage="teams")
+            ) as pool:
+                def process(item):
+                    i, league = item
+                    return self.fetch_league(pool, league, i, len(leagues), controller)
+                
+                results = run_jobs(
+                    pending, process, workers, engine,
+                    url_of=lambda item: item[1]['url'], config=self.config
+                )
+                
+                def merged():
+                    # Pending leagues keep leagues.json order, so results line up
+                    # with the leagues that are not reused; failed leagues are None
+                    for league in leagues:
+                        entry = reused.get(league['url']) or next(results)
+                        if entry is None and not self.store:
+                            # Keep the last teams of a league that failed; the
+                            # store keeps them by not saving the failure
+                            entry = previous.get(league['url'])
+                        if entry:
+                            yield entry
+                        
+                return self.write_teams(len(leagues), merged())
+                
+        except Exception as e:
+            logger.error(f"Failed to complete teams scraping: {e}")
+            raise
+    
+    def fetch_league(self, pool: BrowserPool, league: Dict[str, str], index: int, total: int,
+                     controller: Optional[AIMDController] = None) -> Optional[Dict[str, Any]]:
+        """Extract the teams of one league on a pooled browser, or from the cache.
+        
+        Returns:
+            League entry for teams.json, or None if the league failed
+        """
+        cached = self.cache.get_entry("teams", league['url']) if self.cache else None
+        if cached is not None:
+            logger.info(f"League {index}/{total} from cache: {league['name']}")
+            return {
+                'league_name': league['name'],
+                'league_url': league['url'],
+                # When the page was fetched, so incremental runs age it correctly
+                'fetched_at': datetime.fromtimestamp(cached['fetched_at']).isoformat(),
+                'teams': cached['data']
+            }
+        
+        with adaptive_slot(controller) as slot, pool.acquire() as driver:
+            counter = CommandCounter.attach(driver)
+            calls, start = counter.count, time.monotonic()
+            teams_page = TeamsPage(driver, self.config)
+            result = self._process_league(teams_page, league, index, total)
+            self.report.add_page(league['url'], teams_page.ready.timings,
+                                 time.monotonic() - start, counter.count - calls)
+            # Measure the site, not the scraper's own throttling
+            slot.exclude(teams_page.ready.rate_limited)
+            if result is None:
+                slot.fail("league failed")
+            elif teams_page.ready.timeouts:
+                slot.fail("TimeoutException")
+            return result
+    
+    def write_teams(self, leagues_processed: int, all_teams: Iterable[Dict[str, Any]]) -> Path:
+        """Write teams.json, teams.jsonl and the stage's run report.
+        
+        League entries are written as they arrive from ``all_teams``, so a
+        generator of results is never held in memory as a whole. teams.jsonl
+        holds one line per team appearance.
+        
+        With a result store, entries are saved to it first and both files are
+        exported from the store. Only leagues that were fetched are saved, so
+        a league that failed (None in ``all_teams``) keeps its last stored
+        teams.
+        
+        Returns:
+            Path to the output file with team URLs
+        """
+        output_file = self.output_dir / "teams.json"
+        total_teams = 0
+        
+        if self.store:
+            for entry in all_teams:
+                if entry is not None:
+                    self.store.save_league_teams(entry)
+            all_teams = self.store.iter_league_entries()
+        
+        with JsonLinesWriter(self.output_dir / "teams.jsonl") as lines:
+            def stream():
+                nonlocal total_teams
+                for entry in all_teams:
+                    total_teams += len(entry['teams'])
+                    for team in entry['teams']:
+                        lines.write({
+                            'league_name': entry['league_name'],
+                            'league_url': entry['league_url'],
+                            'team_name': team['name'],
+                            'team_url': team['url']
+                        })
+                    yield entry
+            
+            write_json_stream(
+                output_file,
+                {'timestamp': datetime.now().isoformat(), 'leagues_processed': leagues_processed},
+                'leagues', stream(),
+                footer=lambda: {'total_teams': total_teams}
+            )
+            
+        logger.info(f"Teams data saved to {output_file}")
+        logger.info(f"Total teams collected: {total_teams}")
+        if self.cache:
+            logger.info(f"Pages served from snapshot cache: {self.cache.hits}")
+        self.report.write()
+        
+        return output_file
+    
+    def _process_league(self, teams_page: TeamsPage, league: Dict[str, str],
+                        index: int, total: int) -> Optional[Dict[str, Any]]:
+        """Extract the teams of a single league.
+        
+        Returns:
+            League entry for teams.json, or None if the league failed
+        """
+        logger.info(f"Processing league {index}/{total}: {league['name']}")
+        
+        try:
+            teams = teams_page.extract_teams(league['url'])
+            logger.info(f"  Found {len(teams)} teams in {league['name']}")
+            
+            return {
+                'league_name': league['name'],
+                'league_url': league['url'],
+                'fetched_at': datetime.now().isoformat(),
+                'teams': teams
+            }
+            
+        except Exception as e:
+            logger.error(f"  Error processing league {league['name']}: {e}")
+            return None
+    
+    def _load_leagues(self) -> List[Dict[str, str]]:
+        """Return the leagues listed by Stage 1, from the store if configured."""
+        if self.store:
+            leagues = list(self.store.listed_leagues())
+            if leagues:
+                return leagues
+        
         # Load leagues data from Stage 1
         leagues_file = self.output_dir / "leagues.json"
         if not leagues_file.exists():
@@ -43,54 +229,63 @@ class TeamsScraper:
         with open(leagues_file, 'r') as f:
             leagues_data = json.load(f)
             
-        leagues = leagues_data.get('leagues', [])
-        logger.info(f"Found {len(leagues)} leagues to process")
+        return leagues_data.get('leagues', [])
+    
+    def _load_previous_leagues(self, teams_file: Path,
+                               leagues: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Return the previous entries of leagues that are still in ``leagues``.
         
-        all_teams = []
-        browser_config = self.config.get("browser", {})
+        Entries come from the result store if configured, else from the
+        previous teams.json.
         
-        try:
-            with BrowserManager(
-                headless=browser_config.get("headless", True),
-                window_size=browser_config.get("window_size", "1920,1080")
-            ) as driver:
-                teams_page = TeamsPage(driver, self.config)
-                
-                for i, league in enumerate(leagues, 1):
-                    logger.info(f"Processing league {i}/{len(leagues)}: {league['name']}")
-                    
-                    try:
-                        teams = teams_page.extract_teams(league['url'])
-                        
-                        league_teams = {
-                            'league_name': league['name'],
-                            'league_url': league['url'],
-                            'teams': teams
-                        }
-                        all_teams.append(league_teams)
-                        
-                        logger.info(f"  Found {len(teams)} teams")
-                        
-                    except Exception as e:
-                        logger.error(f"  Error processing league: {e}")
-                        
-                # Save results
-                output_file = self.output_dir / "teams.json"
-                output_data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'leagues_processed': len(leagues),
-                    'total_teams': sum(len(lt['teams']) for lt in all_teams),
-                    'leagues': all_teams
+        Returns:
+            Previous league entries keyed by league URL, each with ``fetched_at``
+        """
+        listed = {league['url'] for league in leagues}
+        
+        if self.store:
+            return {entry['league_url']: entry for entry in self.store.iter_league_entries()
+                    if entry['league_url'] in listed}
+        
+        if not teams_file.exists():
+            logger.info("Incremental: no previous teams.json, fetching every league")
+            return {}
+        
+        with open(teams_file, 'r') as f:
+            previous = json.load(f)
+        
+        entries = {}
+        for entry in previous.get('leagues', []):
+            if entry['league_url'] in listed:
+                # Files written before per-league timestamps fall back to the run timestamp
+                entries[entry['league_url']] = {
+                    **entry, 'fetched_at': entry.get('fetched_at') or previous['timestamp']
                 }
-                
-                with open(output_file, 'w') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
-                    
-                logger.info(f"Teams data saved to {output_file}")
-                logger.info(f"Total teams collected: {output_data['total_teams']}")
-                
-                return output_file
-                
-        except Exception as e:
-            logger.error(f"Failed to complete teams scraping: {e}")
-            raise
\ No newline at end of file
+        return entries
+    
+    def _load_fresh_leagues(self, teams_file: Path, leagues: List[Dict[str, str]],
+                            previous: Optional[Dict[str, Dict[str, Any]]] = None
+                            ) -> Dict[str, Dict[str, Any]]:
+        """Return previously fetched league entries that can be kept as they are.
+        
+        An entry is kept when its league is still in ``leagues`` and it was
+        fetched within ``incremental.max_age_days``.
+        
+        Args:
+            previous: Entries from ``_load_previous_leagues``, loaded if not given
+        
+        Returns:
+            Previous league entries keyed by league URL
+        """
+        max_age = timedelta(days=self.config.get('incremental', {}).get('max_age_days', 7))
+        listed = {league['url'] for league in leagues}
+        if previous is None:
+            previous = self._load_previous_leagues(teams_file, leagues)
+        
+        cutoff = datetime.now() - max_age
+        fresh = {url: entry for url, entry in previous.items()
+                 if datetime.fromisoformat(entry['fetched_at']) >= cutoff}
+        
+        logger.info(f"Incremental: reusing {len(fresh)} leagues, "
+                    f"fetching {len(listed - set(fresh))} new or stale leagues")
+        return fresh
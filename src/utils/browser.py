@@ -2,19 +2,132 @@
 Browser management utility for Selenium WebDriver.
 """
 
+import collections
+import heapq
+import itertools
 import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+from src.utils.driver_cache import resolve_driver_path
+from src.utils.instrumentation import CommandProfiler
 
 logger = logging.getLogger(__name__)
 
+# Assets none of the scrapers read. Patterns use the wildcard syntax of the
+# CDP Network.setBlockedURLs command.
+DEFAULT_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*cookiebot.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+]
+
+# Per-stage patterns removed from the block list. The categories stage checks
+# button visibility, which needs the Vuetify stylesheets.
+DEFAULT_ALLOWED_URLS = {
+    "categories": ["*.css"],
+}
+
+
+# Cookiebot consent decision accepting all categories, seeded into new
+# browsers so the consent dialog never opens
+DEFAULT_CONSENT_COOKIES = [
+    {
+        "name": "CookieConsent",
+        "value": (
+            "{stamp:%27-1%27%2Cnecessary:true%2Cpreferences:true%2Cstatistics:true"
+            "%2Cmarketing:true%2Cmethod:%27explicit%27%2Cver:1%2Cutc:1700000000000%2Cregion:%27fi%27}"
+        ),
+        "domain": "tulospalvelu.palloliitto.fi",
+        "path": "/",
+    }
+]
+
+
+def blocked_urls(block_config, stage=None):
+    """Resolve the URL patterns to block for a stage.
+    
+    Args:
+        block_config: ``browser.block_resources`` config section, or None
+        stage: Stage name used to look up its allowlist
+        
+    Returns:
+        List of URL patterns, empty when blocking is disabled
+    """
+    if block_config is None or not block_config.get("enabled", True):
+        return []
+    
+    patterns = block_config.get("patterns", DEFAULT_BLOCKED_URLS)
+    allow = block_config.get("allow", DEFAULT_ALLOWED_URLS).get(stage, [])
+    return [pattern for pattern in patterns if pattern not in allow]
+
+
+def browser_options(browser_config, stage=None):
+    """Map the ``browser`` config section to BrowserManager keyword arguments.
+    
+    Profiles go in a subdirectory per stage, so pools of stages running at
+    the same time (the pipeline) never hand two browsers the same profile.
+    """
+    user_data_dir = browser_config.get("user_data_dir")
+    if user_data_dir and stage:
+        user_data_dir = str(Path(user_data_dir) / stage)
+    return {
+        "headless": browser_config.get("headless", True),
+        "window_size": browser_config.get("window_size", "1920,1080"),
+        "blocked_urls": blocked_urls(browser_config.get("block_resources"), stage),
+        "page_load_strategy": browser_config.get("page_load_strategy", "normal"),
+        "user_data_dir": user_data_dir,
+        "driver_path": browser_config.get("driver_path"),
+        "consent_cookies": (
+            browser_config.get("consent_cookies", DEFAULT_CONSENT_COOKIES)
+            if browser_config.get("seed_consent", False) else None
+        ),
+        "command_profile": (
+            f"data/reports/{stage or 'browser'}_commands.folded"
+            if browser_config.get("profile_commands", False) else None
+        ),
+    }
+
 
 class BrowserManager:
-    def __init__(self, headless=False, window_size="1920,1080"):
+    PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+    
+    def __init__(self, headless=False, window_size="1920,1080", blocked_urls=None,
+                 page_load_strategy="normal", user_data_dir=None, consent_cookies=None,
+                 driver_path=None, command_profile=None):
+        if page_load_strategy not in self.PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Unknown page load strategy: {page_load_strategy}")
         self.headless = headless
         self.window_size = window_size
+        self.blocked_urls = blocked_urls or []
+        # "eager" returns from driver.get at DOMContentLoaded, "none" right after
+        # navigation starts; page objects then wait for their own selectors
+        self.page_load_strategy = page_load_strategy
+        # Each browser gets its own profile under user_data_dir, since Chrome
+        # locks a profile. Profiles of quit browsers are handed out again
+        # (lowest number first), so recycling keeps consent and the cache
+        # instead of adding a directory per browser
+        self.user_data_dir = user_data_dir
+        self.consent_cookies = consent_cookies or []
+        self.driver_path = driver_path
+        # Opt-in: time every WebDriver command and write folded stacks here
+        self.profiler = CommandProfiler(command_profile) if command_profile else None
+        self._profile_numbers = itertools.count()
+        self._free_profiles = []  # heap of profile numbers no browser is using
+        self._driver_profiles = {}
+        self._profile_lock = threading.Lock()
         self.driver = None
     
     def __enter__(self):
@@ -26,9 +139,46 @@ class BrowserManager:
         """Context manager exit."""
         if self.driver:
             self.driver.quit()
+            self.release_profile(self.driver)
+        self.write_profile()
+    
+    def write_profile(self):
+        """Write the command profile of every driver created so far, if enabled."""
+        if self.profiler:
+            self.profiler.write()
+    
+    def release_profile(self, driver):
+        """Make the profile of a quit driver available to the next one."""
+        with self._profile_lock:
+            number = self._driver_profiles.pop(driver, None)
+            if number is not None:
+                heapq.heappush(self._free_profiles, number)
+    
+    def _take_profile(self):
+        """Return the lowest free profile number, or a new one."""
+        with self._profile_lock:
+            if self._free_profiles:
+                return heapq.heappop(self._free_profiles)
+            return next(self._profile_numbers)
     
     def _create_driver(self):
         """Create and configure Chrome WebDriver."""
+        profile_number = self._take_profile() if self.user_data_dir else None
+        try:
+            driver = self._start_driver(profile_number)
+        except Exception:
+            if profile_number is not None:
+                with self._profile_lock:
+                    heapq.heappush(self._free_profiles, profile_number)
+            raise
+        
+        if profile_number is not None:
+            with self._profile_lock:
+                self._driver_profiles[driver] = profile_number
+        return driver
+    
+    def _start_driver(self, profile_number=None):
+        """Start Chrome, using ``profile-<profile_number>`` if given."""
         options = Options()
         
         if self.headless:
@@ -37,11 +187,208 @@ class BrowserManager:
         options.add_argument(f'--window-size={self.window_size}')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        options.page_load_strategy = self.page_load_strategy
+        
+        if profile_number is not None:
+            profile_dir = Path(self.user_data_dir).resolve() / f"profile-{profile_number}"
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            options.add_argument(f'--user-data-dir={profile_dir}')
         
-        # Install/update ChromeDriver automatically
-        service = Service(ChromeDriverManager().install())
+        if any(pattern.endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')) for pattern in self.blocked_urls):
+            # Skip image decoding entirely, not just the network fetch
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        
+        # Configured driver, or one resolved once and cached per Chrome version
+        service = Service(resolve_driver_path(self.driver_path))
         
         driver = webdriver.Chrome(service=service, options=options)
-        logger.info(f"Browser created (headless={self.headless})")
+        
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            logger.debug(f"Blocking {len(self.blocked_urls)} URL patterns")
+        
+        for cookie in self.consent_cookies:
+            # CDP can set cookies for a domain before anything was loaded from it
+            driver.execute_cdp_cmd("Network.setCookie", cookie)
+        if self.consent_cookies:
+            logger.debug(f"Seeded {len(self.consent_cookies)} consent cookies")
+        
+        if self.profiler:
+            self.profiler.attach(driver)
+        
+        logger.info(f"Browser created (headless={self.headless}, "
+                    f"page_load_strategy={self.page_load_strategy})")
         
         return driver
+
+
+class BrowserPool:
+    """Pool of warm WebDriver instances handed out to worker threads.
+    
+    Each driver is recycled after ``max_pages`` leases (one lease is one page
+    load in the scrapers) or as soon as it is found to have crashed. With
+    ``warm=False`` drivers are only started when first leased. Remaining
+    keyword arguments are passed to ``BrowserManager``.
+    """
+    
+    def __init__(self, size=1, max_pages=100, warm=True, **browser_options):
+        self.size = size
+        self.max_pages = max_pages
+        self.warm = warm
+        self._manager = BrowserManager(**browser_options)
+        self._idle = collections.deque()
+        self._page_loads = {}
+        self._slots = 0  # drivers running or being started
+        # Guards the fields above; notified whenever a driver is returned or a
+        # slot is freed, so blocked workers can take it or start a replacement
+        self._available = threading.Condition()
+        self._closed = False
+    
+    def __enter__(self):
+        """Context manager entry."""
+        if self.warm:
+            self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def start(self):
+        """Start drivers until the pool holds ``size`` of them."""
+        while self._reserve_slot():
+            self._release(self._spawn())
+        logger.info(f"Browser pool started with {self.size} drivers")
+    
+    @contextmanager
+    def acquire(self):
+        """Lease a driver for the duration of a ``with`` block."""
+        driver = self._checkout()
+        try:
+            yield driver
+        finally:
+            self._checkin(driver)
+    
+    def close(self):
+        """Quit every driver owned by the pool."""
+        with self._available:
+            self._closed = True
+            drivers = list(self._page_loads)
+            self._page_loads.clear()
+            self._idle.clear()
+            self._slots = 0
+            self._available.notify_all()
+        
+        for driver in drivers:
+            self._quit(driver)
+        logger.info(f"Browser pool closed ({len(drivers)} drivers)")
+        self._manager.write_profile()
+    
+    def _reserve_slot(self):
+        """Reserve room for one more driver if the pool is not full."""
+        with self._available:
+            if self._closed or self._slots >= self.size:
+                return False
+            self._slots += 1
+            return True
+    
+    def _spawn(self):
+        """Create a driver for an already reserved slot."""
+        try:
+            driver = self._manager._create_driver()
+        except Exception:
+            self._free_slot()
+            raise
+        
+        with self._available:
+            self._page_loads[driver] = 0
+        return driver
+    
+    def _free_slot(self):
+        """Give up a reserved slot and wake a worker to fill it."""
+        with self._available:
+            self._slots -= 1
+            self._available.notify()
+    
+    def _release(self, driver):
+        """Put a driver back on the idle list and wake a waiting worker."""
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+    
+    def _checkout(self):
+        """Take an idle driver, starting one if the pool is not full.
+        
+        Blocks until a driver is returned or a slot is freed; a worker woken
+        by a freed slot starts the replacement itself, so a failed start is
+        raised to that worker instead of stranding the others.
+        """
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._slots < self.size:
+                    self._slots += 1
+                    break
+                self._available.wait()
+        
+        return self._spawn()
+    
+    def _checkin(self, driver):
+        """Return a driver to the pool, or retire it if it is worn out or dead.
+        
+        The session is probed on every return: page objects catch WebDriver
+        errors themselves, so a dead session rarely surfaces in the lease.
+        """
+        alive = self._is_alive(driver, probe=True)
+        
+        reason = None
+        with self._available:
+            if self._closed or driver not in self._page_loads:
+                reason = "pool closed"
+            else:
+                self._page_loads[driver] += 1
+                if not alive:
+                    reason = "driver crashed"
+                elif self._page_loads[driver] >= self.max_pages:
+                    reason = f"reached {self.max_pages} page loads"
+                
+                if reason is None:
+                    self._idle.append(driver)
+                    self._available.notify()
+                    return
+                
+                # A waiting worker starts the replacement on its own thread
+                del self._page_loads[driver]
+                self._slots -= 1
+                self._available.notify()
+        
+        logger.info(f"Recycling browser: {reason}")
+        self._quit(driver)
+    
+    @staticmethod
+    def _is_alive(driver, probe=False):
+        """Check whether the driver process (and optionally the session) is up."""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is not None and process.poll() is not None:
+            return False
+        
+        if probe:
+            try:
+                driver.current_url
+            except WebDriverException:
+                return False
+        return True
+    
+    def _quit(self, driver):
+        """Quit a driver, ignoring errors from already dead sessions, and free its profile."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {e}")
+        self._manager.release_profile(driver)
@@ -0,0 +1,104 @@
+"""
+Append-only checkpoint journal for resumable stages.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointJournal:
+    """JSON Lines journal with one record per processed work item.
+    
+    Every ``append`` is flushed and fsynced, so a crash loses at most the
+    record being written. A truncated last line is ignored on load, and the
+    next append starts on a new line after it.
+    
+    Args:
+        path: Journal file, created on first append
+        key_field: Record field that identifies a work item
+    """
+    
+    def __init__(self, path, key_field: str = "key"):
+        self.path = Path(path)
+        self.key_field = key_field
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def __enter__(self):
+        """Context manager entry."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if not self._ends_with_newline():
+            # Terminate a line cut short by a crash so the next record parses
+            self._file.write("\n")
+            self._file.flush()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        if self._file:
+            self._file.close()
+            self._file = None
+    
+    def _ends_with_newline(self) -> bool:
+        """Check whether the journal is empty or its last line is complete."""
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read all records, keyed by ``key_field``; later records win."""
+        records = {}
+        if not self.path.exists():
+            return records
+        
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring corrupt journal line {line_number} in {self.path}")
+                    continue
+                records[record[self.key_field]] = record
+        
+        return records
+    
+    def append(self, record: Dict[str, Any]):
+        """Durably append one record."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def rewrite(self, records: Dict[str, Dict[str, Any]]):
+        """Atomically replace the journal with ``records``, one line each.
+        
+        Used to drop superseded and obsolete records once a run has finished;
+        the journal must not be open for appending.
+        """
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        logger.info(f"Compacted checkpoint journal {self.path} to {len(records)} records")
+    
+    def reset(self):
+        """Delete the journal to start a fresh run."""
+        if self.path.exists():
+            self.path.unlink()
+            logger.info(f"Removed checkpoint journal {self.path}")
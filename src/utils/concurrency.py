@@ -0,0 +1,155 @@
+"""
+Adaptive (AIMD) limit on the number of pages in flight.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Slot:
+    """One in-flight page; call ``fail`` to report a soft error such as a timeout."""
+    
+    def __init__(self, epoch: int = 0):
+        self.epoch = epoch
+        self.error: Optional[str] = None
+        self.excluded = 0.0
+    
+    def fail(self, reason: str):
+        self.error = reason
+    
+    def exclude(self, seconds: float):
+        """Leave time the scraper held itself back, e.g. for the rate limiter, out of the latency."""
+        self.excluded += seconds
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease concurrency controller.
+    
+    Workers take a slot per page. After every ``window`` successful pages the
+    limit grows by one if the window's p95 latency stays within
+    ``latency_tolerance`` times the baseline. It is halved on an error
+    (exception, timeout, HTTP 429/5xx) or when the p95 rises past that bound.
+    Only one decrease happens per epoch, so a burst of failures from pages
+    started under the old limit does not collapse it to the minimum.
+    
+    Args:
+        initial: Starting limit
+        minimum: Lowest limit
+        maximum: Highest limit, normally the number of workers
+        window: Successful pages per increase decision
+        latency_tolerance: Allowed p95 growth over the baseline
+    """
+    
+    def __init__(self, initial: int = 1, minimum: int = 1, maximum: int = 8,
+                 window: int = 10, latency_tolerance: float = 1.5):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.window = max(1, window)
+        self.latency_tolerance = latency_tolerance
+        self.baseline_p95: Optional[float] = None
+        self.decisions = []  # (timestamp, action, limit, reason)
+        self._in_flight = 0
+        self._epoch = 0
+        self._latencies = deque()
+        self._cond = threading.Condition()
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], workers: int) -> "AIMDController":
+        """Create a controller from the ``adaptive`` config section."""
+        settings = (config or {}).get('adaptive', {})
+        return cls(
+            initial=settings.get('initial', 1),
+            minimum=settings.get('minimum', 1),
+            maximum=settings.get('maximum', workers),
+            window=settings.get('window', 10),
+            latency_tolerance=settings.get('latency_tolerance', 1.5)
+        )
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight slot for the duration of a ``with`` block."""
+        slot = self.acquire()
+        start = time.monotonic()
+        try:
+            yield slot
+        except Exception as e:
+            slot.fail(type(e).__name__)
+            raise
+        finally:
+            self.release(slot, max(0.0, time.monotonic() - start - slot.excluded))
+    
+    def acquire(self) -> Slot:
+        """Block until the number of pages in flight is below the limit."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            return Slot(self._epoch)
+    
+    def release(self, slot: Slot, latency: float):
+        """Finish a slot and adjust the limit from its outcome."""
+        with self._cond:
+            self._in_flight -= 1
+            
+            if slot.error:
+                if slot.epoch == self._epoch:
+                    self._decrease(slot.error)
+            else:
+                self._latencies.append(latency)
+                if len(self._latencies) >= self.window:
+                    self._evaluate_window()
+            
+            self._cond.notify_all()
+    
+    def _evaluate_window(self):
+        latencies = sorted(self._latencies)
+        self._latencies.clear()
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+        
+        if self.baseline_p95 is None:
+            self.baseline_p95 = p95
+        
+        if p95 > self.baseline_p95 * self.latency_tolerance:
+            self._decrease(f"p95 {p95:.2f}s above baseline {self.baseline_p95:.2f}s")
+            return
+        
+        # Track the baseline slowly so gradual drift is not mistaken for overload
+        self.baseline_p95 = 0.8 * self.baseline_p95 + 0.2 * p95
+        if self.limit < self.maximum:
+            self.limit += 1
+            self._log("increase", f"p95 {p95:.2f}s stable")
+    
+    def _decrease(self, reason: str):
+        self._epoch += 1
+        self._latencies.clear()
+        new_limit = max(self.minimum, self.limit // 2)
+        if new_limit != self.limit:
+            self.limit = new_limit
+            self._log("decrease", reason)
+        else:
+            self._log("hold", reason)
+    
+    def _log(self, action: str, reason: str):
+        self.decisions.append((time.time(), action, self.limit, reason))
+        logger.info(f"Concurrency {action} to {self.limit}: {reason}")
+
+
+@contextmanager
+def adaptive_slot(controller: Optional[AIMDController]):
+    """Slot from ``controller``, or a no-op slot when adaptivity is off."""
+    if controller is None:
+        yield Slot()
+    else:
+        with controller.slot() as slot:
+            yield slot
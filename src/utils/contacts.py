@@ -0,0 +1,60 @@
+"""
+Contact de-duplication for the contact stage.
+"""
+
+from typing import Any, Dict, Iterator, List
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for use as a de-duplication key."""
+    return email.strip().lower()
+
+
+class ContactIndex:
+    """Merges contact rows for the same administrator in O(1) per row.
+    
+    Rows are keyed on normalized email. Teams, leagues and positions are
+    collected as ordered sets (insertion-ordered dict keys) and only joined
+    into comma-separated strings when ``rows`` is called.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.has_phone = False
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def add(self, contact: Dict[str, str]):
+        """Add one contact row, merging it into an existing administrator."""
+        key = normalize_email(contact['email'])
+        entry = self._entries.get(key)
+        if contact.get('phone'):
+            self.has_phone = True
+        
+        if entry is None:
+            self._entries[key] = {
+                'row': dict(contact),
+                'team': {contact['team']: None},
+                'league': {contact['league']: None},
+                'position': {contact['position']: None}
+            }
+            return
+        
+        entry['team'][contact['team']] = None
+        entry['league'][contact['league']] = None
+        entry['position'][contact['position']] = None
+        if contact.get('phone') and not entry['row'].get('phone'):
+            entry['row']['phone'] = contact['phone']
+    
+    def rows(self) -> List[Dict[str, str]]:
+        """Return one merged row per administrator, in first-seen order."""
+        return list(self.iter_rows())
+    
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        """Yield the merged rows of ``rows`` one at a time."""
+        for entry in self._entries.values():
+            row = dict(entry['row'])
+            for field in ('team', 'league', 'position'):
+                row[field] = ", ".join(entry[field])
+            yield row
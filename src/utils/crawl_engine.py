@@ -0,0 +1,113 @@
+"""
+Asyncio crawl engine with bounded concurrency and per-host politeness.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Jobs in flight against one host unless ``crawl.per_host`` says otherwise;
+# independent of the worker count so more workers do not mean a harder hit host
+DEFAULT_PER_HOST = 4
+
+
+class AsyncCrawlEngine:
+    """Runs one fetch job per item on an asyncio event loop.
+    
+    ``fetch`` may be a coroutine function (an async HTTP fetcher) or a plain
+    function, which is run in executor threads so blocking work such as a
+    leased WebDriver session or a requests call does not stall the loop.
+    
+    Args:
+        concurrency: Maximum number of jobs in flight overall
+        per_host: Maximum number of jobs in flight against one host
+    """
+    
+    def __init__(self, concurrency: int = 4, per_host: int = DEFAULT_PER_HOST):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.elapsed = 0.0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], workers: int) -> "AsyncCrawlEngine":
+        """Create an engine from the ``crawl`` config section."""
+        settings = (config or {}).get('crawl', {})
+        return cls(
+            concurrency=settings.get('concurrency', workers),
+            per_host=settings.get('per_host', DEFAULT_PER_HOST)
+        )
+    
+    def run(self, items: Iterable[Any], fetch: Callable[[Any], Any],
+            url_of: Optional[Callable[[Any], str]] = None) -> List[Any]:
+        """Fetch every item and return the results in input order.
+        
+        Args:
+            items: Work items, e.g. leagues or teams
+            fetch: Function or coroutine function called with one item
+            url_of: Returns the URL of an item, used for the per-host limit
+            
+        Returns:
+            One result per item; None where the job raised
+        """
+        return asyncio.run(self.run_async(items, fetch, url_of))
+    
+    async def run_async(self, items: Iterable[Any], fetch: Callable[[Any], Any],
+                        url_of: Optional[Callable[[Any], str]] = None) -> List[Any]:
+        """Coroutine version of ``run`` for callers already inside a loop."""
+        items = list(items)
+        start = time.monotonic()
+        limit = asyncio.Semaphore(self.concurrency)
+        hosts = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        is_async = asyncio.iscoroutinefunction(fetch)
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            loop = asyncio.get_running_loop()
+            
+            async def run_one(item):
+                host = urlsplit(url_of(item)).netloc if url_of else ""
+                async with hosts[host], limit:
+                    try:
+                        if is_async:
+                            return await fetch(item)
+                        return await loop.run_in_executor(executor, fetch, item)
+                    except Exception as e:
+                        logger.error(f"Crawl job failed: {e}")
+                        return None
+            
+            results = await asyncio.gather(*(run_one(item) for item in items))
+        
+        self.elapsed = time.monotonic() - start
+        if items:
+            logger.info(f"Crawled {len(items)} items in {self.elapsed:.1f}s "
+                        f"({len(items) / max(self.elapsed, 1e-9):.2f} items/s)")
+        return results
+
+
+def run_jobs(items: List[Any], process: Callable[[Any], Any], workers: int, engine: str = "threads",
+             url_of: Optional[Callable[[Any], str]] = None,
+             config: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Run ``process`` over ``items`` on the selected engine, yielding results in order.
+    
+    With threads each result is yielded as soon as it and all earlier ones
+    are done; the async engine yields once every item has finished.
+    
+    Args:
+        items: Work items
+        process: Function called with one item
+        workers: Thread count, and the async concurrency unless configured
+        engine: "threads" for a thread pool, "async" for ``AsyncCrawlEngine``
+        url_of: Returns the URL of an item, used for the per-host limit
+        config: Scraper configuration holding the ``crawl`` section
+    """
+    if engine == "async":
+        yield from AsyncCrawlEngine.from_config(config, workers).run(items, process, url_of=url_of)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(process, items)
@@ -0,0 +1,119 @@
+"""
+ChromeDriver binary resolution with an offline-capable cache.
+
+``ChromeDriverManager().install()`` does version lookups over the network on
+every call. The resolved path is cached on disk keyed on the installed Chrome
+version, and in memory for the lifetime of the process.
+"""
+
+import json
+import logging
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = Path.home() / ".cache" / "palloliitto-scraper" / "chromedriver.json"
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+VERSION_PATTERN = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+_resolved = {}
+_lock = threading.Lock()
+
+
+def detect_chrome_version() -> Optional[str]:
+    """Return the installed Chrome version, or None if it cannot be found."""
+    for binary in CHROME_BINARIES:
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        
+        match = VERSION_PATTERN.search(output)
+        if match:
+            return match.group(1)
+    
+    return None
+
+
+def resolve_driver_path(explicit_path: Optional[str] = None, cache_file: Path = CACHE_FILE) -> str:
+    """Return a ChromeDriver path, downloading only on a cache miss.
+    
+    Args:
+        explicit_path: Driver path from the config, used as-is when set
+        cache_file: JSON file mapping Chrome versions to driver paths
+        
+    Returns:
+        Path to the ChromeDriver executable
+        
+    Raises:
+        FileNotFoundError: If ``explicit_path`` does not exist
+    """
+    if explicit_path:
+        if not Path(explicit_path).is_file():
+            raise FileNotFoundError(f"Configured ChromeDriver not found: {explicit_path}")
+        return explicit_path
+    
+    with _lock:
+        key = str(cache_file)
+        if key not in _resolved:
+            _resolved[key] = _resolve_cached(Path(cache_file))
+        return _resolved[key]
+
+
+def _resolve_cached(cache_file: Path) -> str:
+    version = detect_chrome_version()
+    cache = _load_cache(cache_file)
+    
+    cached = cache.get(version) if version else None
+    if cached and Path(cached).is_file():
+        logger.info(f"Using cached ChromeDriver for Chrome {version}: {cached}")
+        return cached
+    
+    try:
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        # Offline and Chrome version unknown: any driver we have is better than none
+        fallback = next((p for p in reversed(list(cache.values())) if Path(p).is_file()), None)
+        if fallback is None:
+            raise
+        logger.warning(f"ChromeDriver lookup failed ({e}), using cached {fallback}")
+        return fallback
+    
+    if version:
+        cache[version] = path
+        _save_cache(cache_file, cache)
+        logger.info(f"Cached ChromeDriver for Chrome {version}: {path}")
+    return path
+
+
+def _load_cache(cache_file: Path) -> dict:
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file: Path, cache: dict):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not write ChromeDriver cache {cache_file}: {e}")
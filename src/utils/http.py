@@ -0,0 +1,52 @@
+"""
+HTTP session utility for browser-free page fetches.
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+
+def create_session(pool_size=10, retries=2, user_agent=DEFAULT_USER_AGENT):
+    """Create a requests session with keep-alive connection pooling.
+    
+    Args:
+        pool_size: Connections kept open per host, should be >= worker count
+        retries: Retries for connection errors and 502/503/504 responses
+        user_agent: User-Agent header sent with every request
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"],
+            # Hand back the last response so the caller sees its status
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Language": "fi,en;q=0.8"
+    })
+    logger.debug(f"HTTP session created (pool_size={pool_size})")
+    
+    return session
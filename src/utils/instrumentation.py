@@ -0,0 +1,268 @@
+"""
+Per-page timing instrumentation and end-of-stage run reports.
+"""
+
+import csv
+import json
+import logging
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("rate_limit", "navigation", "http", "consent", "wait", "extraction", "debug_dump")
+PERCENTILES = (50, 90, 95, 99)
+
+# Frames under src/ are kept when attributing WebDriver commands to callers
+SRC_ROOT = str(Path(__file__).resolve().parent.parent)
+PAGES_ROOT = str(Path(SRC_ROOT) / "pages")
+
+
+def phase_of(label: str) -> str:
+    """Map a ``ReadinessWaiter`` timing label to a report phase.
+    
+    Element and DOM-quiet waits are recorded under descriptive labels such
+    as "league tables", so anything not named explicitly counts as a wait.
+    """
+    if label == "rate limit":
+        return "rate_limit"
+    if label == "navigation":
+        return "navigation"
+    if label == "http fetch":
+        return "http"
+    if label.startswith("consent"):
+        return "consent"
+    if label == "extraction":
+        return "extraction"
+    if label == "debug dump":
+        return "debug_dump"
+    return "wait"
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class CommandCounter:
+    """Counts WebDriver commands sent by one driver.
+    
+    Wraps ``driver.execute``, which every WebDriver and WebElement call goes
+    through. A pooled driver is leased to one thread at a time, so callers
+    take the difference of ``count`` around a page.
+    """
+    
+    def __init__(self, driver):
+        self.count = 0
+        execute = driver.execute
+        
+        def counted(*args, **kwargs):
+            self.count += 1
+            return execute(*args, **kwargs)
+        
+        driver.execute = counted
+    
+    @classmethod
+    def attach(cls, driver) -> "CommandCounter":
+        """Return the counter of ``driver``, installing it on first use."""
+        counter = getattr(driver, "_command_counter", None)
+        if counter is None:
+            counter = cls(driver)
+            driver._command_counter = counter
+        return counter
+
+
+class RunReport:
+    """Collects per-page timings for one stage and writes the run report.
+    
+    Args:
+        stage: Stage name used in the report file names
+    """
+    
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.pages: List[Dict[str, Any]] = []
+        self.started_at = datetime.now().isoformat()
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def add_page(self, url: str, timings: Sequence[Tuple[str, float]], total: float,
+                 webdriver_calls: int = 0):
+        """Record one page.
+        
+        Args:
+            url: Page URL
+            timings: (label, seconds) pairs, as in ``ReadinessWaiter.timings``
+            total: Wall time spent on the page
+            webdriver_calls: WebDriver commands sent for the page
+        """
+        page = {'url': url, 'total': round(total, 4),
+                'webdriver_calls': webdriver_calls}
+        for label, seconds in timings:
+            phase = phase_of(label)
+            page[phase] = round(page.get(phase, 0) + seconds, 4)
+        with self._lock:
+            self.pages.append(page)
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, mean, percentiles and max per phase.
+        
+        Each phase only counts the pages where it occurred.
+        """
+        summary = {}
+        for field in ("total", "webdriver_calls") + PHASES:
+            values = [page[field] for page in self.pages if field in page]
+            if not values:
+                continue
+            stats = {'count': len(values), 'mean': round(sum(values) / len(values), 4)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}"] = percentile(values, pct)
+            stats['max'] = max(values)
+            summary[field] = stats
+        return summary
+    
+    def write(self, output_dir: Optional[Path] = None) -> Path:
+        """Write ``<stage>_report.json`` and ``<stage>_pages.csv``.
+        
+        Returns:
+            Path to the JSON report
+        """
+        output_dir = Path(output_dir or "data/reports")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        summary = self.summary()
+        report = {
+            'stage': self.stage,
+            'started_at': self.started_at,
+            'wall_time': round(time.monotonic() - self._start, 4),
+            'pages': len(self.pages),
+            'summary': summary,
+            'page_timings': self.pages
+        }
+        report_file = output_dir / f"{self.stage}_report.json"
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        
+        csv_file = output_dir / f"{self.stage}_pages.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['url', 'total', 'webdriver_calls', *PHASES])
+            writer.writeheader()
+            writer.writerows(self.pages)
+        
+        for field, stats in summary.items():
+            logger.info(f"{self.stage} {field}: n={stats['count']} p50={stats['p50']} "
+                        f"p95={stats['p95']} max={stats['max']}")
+        logger.info(f"Run report saved to {report_file}")
+        return report_file
+
+
+def _frame_name(frame) -> str:
+    """Return ``Class.method`` (or the function name) for a frame."""
+    code = frame.f_code
+    qualname = getattr(code, "co_qualname", None)  # Python 3.11+
+    if qualname:
+        return qualname
+    owner = frame.f_locals.get("self")
+    return f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+
+
+class CommandProfiler:
+    """Counts and times every WebDriver command, attributed to its caller.
+    
+    Wraps ``driver.execute`` like ``CommandCounter``, but records the call
+    stack of code under ``src/`` for each command. Commands are attributed to
+    the innermost page-object method on that stack; the full stacks are
+    written as folded stacks (``a;b;command weight``) that flamegraph.pl and
+    speedscope read directly.
+    
+    Args:
+        output_file: Where ``write`` puts the folded stacks
+    """
+    
+    def __init__(self, output_file=None):
+        self.output_file = Path(output_file) if output_file else None
+        # (caller stack..., command) -> [count, seconds, page-object method]
+        self.stacks: Dict[Tuple[str, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+    
+    def attach(self, driver):
+        """Profile every command sent through ``driver``."""
+        execute = driver.execute
+        
+        def profiled(driver_command, params=None):
+            stack, method = self._caller_stack()
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self._add(stack + (driver_command,), method, time.perf_counter() - start)
+        
+        driver.execute = profiled
+        return driver
+    
+    def _caller_stack(self) -> Tuple[Tuple[str, ...], str]:
+        """Return the ``src/`` frames of the call stack, outermost first, and
+        the innermost page-object method among them."""
+        names = []
+        method = None
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(SRC_ROOT) and filename != __file__:
+                names.append(_frame_name(frame))
+                if method is None and filename.startswith(PAGES_ROOT):
+                    method = names[-1]
+            frame = frame.f_back
+        if method is None:
+            method = names[0] if names else "<outside src>"
+        return tuple(reversed(names)), method
+    
+    def _add(self, stack: Tuple[str, ...], method: str, seconds: float):
+        with self._lock:
+            entry = self.stacks.setdefault(stack, [0, 0.0, method])
+            entry[0] += 1
+            entry[1] += seconds
+    
+    def by_method(self) -> List[Dict[str, Any]]:
+        """Return count and time per (page-object method, command), slowest first."""
+        totals: Dict[Tuple[str, str], List[float]] = {}
+        with self._lock:
+            stacks = list(self.stacks.items())
+        
+        for stack, (count, seconds, method) in stacks:
+            entry = totals.setdefault((method, stack[-1]), [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+        
+        rows = [{'method': method, 'command': command, 'count': count, 'seconds': round(seconds, 4)}
+                for (method, command), (count, seconds) in totals.items()]
+        return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+    
+    def folded(self) -> List[str]:
+        """Return folded stack lines weighted by microseconds spent."""
+        with self._lock:
+            stacks = list(self.stacks.items())
+        return [f"{';'.join(stack)} {int(entry[1] * 1_000_000)}" for stack, entry in sorted(stacks)]
+    
+    def write(self, output_file=None) -> Optional[Path]:
+        """Write the folded stacks and log the hottest page-object methods."""
+        output_file = Path(output_file) if output_file else self.output_file
+        if output_file is None or not self.stacks:
+            return None
+        
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text("\n".join(self.folded()) + "\n")
+        
+        rows = self.by_method()
+        logger.info(f"WebDriver commands: {sum(row['count'] for row in rows)} "
+                    f"in {sum(row['seconds'] for row in rows):.2f}s")
+        for row in rows[:15]:
+            logger.info(f"  {row['seconds']:8.3f}s {row['count']:6d}  {row['method']} -> {row['command']}")
+        logger.info(f"Command profile saved to {output_file}")
+        return output_file
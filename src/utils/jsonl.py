@@ -0,0 +1,97 @@
+"""
+Streaming JSON Lines and JSON outputs, written record by record.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JsonLinesWriter:
+    """Writes one JSON record per line as records are produced.
+    
+    Lines go to ``<path>.partial``, which replaces ``path`` when the writer
+    is closed without an error, so readers never see a half-written run.
+    
+    Args:
+        path: Output file
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def __enter__(self):
+        """Context manager entry."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.partial_path, "w", encoding="utf-8")
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self._file.close()
+        self._file = None
+        if exc_type is None:
+            os.replace(self.partial_path, self.path)
+            logger.info(f"Wrote {self.count} records to {self.path}")
+        else:
+            logger.warning(f"Kept partial output {self.partial_path} ({self.count} records)")
+    
+    def write(self, record: Dict[str, Any]):
+        """Append one record."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self.count += 1
+
+
+def read_json_lines(path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a JSON Lines file one at a time."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_json_stream(path, header: Dict[str, Any], key: str, items: Iterable[Any],
+                      footer: Optional[Callable[[], Dict[str, Any]]] = None) -> int:
+    """Write ``{**header, key: [items...], **footer()}`` without holding ``items``.
+    
+    The output matches ``json.dump(..., indent=2, ensure_ascii=False)`` in
+    layout. ``footer`` is called after the last item, so it can report
+    totals gathered while streaming.
+    
+    Returns:
+        Number of items written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".partial")
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for name, value in header.items():
+            f.write(f"  {json.dumps(name)}: {_indent(value)},\n")
+        f.write(f"  {json.dumps(key)}: [")
+        for item in items:
+            f.write(",\n    " if count else "\n    ")
+            f.write(_indent(item, level=2))
+            count += 1
+        f.write("\n  ]" if count else "]")
+        for name, value in (footer() if footer else {}).items():
+            f.write(f",\n  {json.dumps(name)}: {_indent(value)}")
+        f.write("\n}")
+    os.replace(tmp_path, path)
+    return count
+
+
+def _indent(value: Any, level: int = 1) -> str:
+    """Serialize ``value`` with two-space indentation, nested ``level`` deep."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * level)
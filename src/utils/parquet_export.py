@@ -0,0 +1,66 @@
+"""
+Long-format Parquet export of the contacts dataset.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CONTACT_COLUMNS = ['administrator_name', 'position', 'email', 'phone', 'team', 'league']
+CATEGORICAL_COLUMNS = ('league', 'position')
+
+
+def contacts_frame(rows: Iterable[Dict[str, str]]) -> pd.DataFrame:
+    """Build the long-format contacts table.
+    
+    Takes contact rows before de-duplication, one per team appearance, so
+    the result has one row per administrator, team and league instead of
+    the comma-joined fields of contacts.csv. League and position are
+    categoricals ordered by first appearance.
+    """
+    df = pd.DataFrame(list(rows), columns=CONTACT_COLUMNS)
+    df = df.drop_duplicates(ignore_index=True)
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = pd.Categorical(df[column], categories=df[column].dropna().unique())
+    return df
+
+
+def write_contacts_parquet(path: Union[str, Path], rows: Iterable[Dict[str, str]]) -> Path:
+    """Write ``contacts_frame(rows)`` to a Parquet file (requires pyarrow).
+    
+    Returns:
+        Path to the Parquet file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df = contacts_frame(rows)
+    df.to_parquet(path, engine="pyarrow", index=False)
+    logger.info(f"Wrote {len(df)} contact rows to {path}")
+    return path
+
+
+def query_contacts(path: Union[str, Path], leagues: Optional[Iterable[str]] = None,
+                   positions: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Read contacts from the Parquet export, filtered by league and position.
+    
+    Filters are pushed down to the Parquet reader, so only matching row
+    groups are decoded.
+    
+    Args:
+        path: Parquet file written by ``write_contacts_parquet``
+        leagues: League names to keep, None for all
+        positions: Positions to keep, None for all
+    
+    Returns:
+        Matching rows, one per administrator, team and league
+    """
+    filters = []
+    if leagues is not None:
+        filters.append(('league', 'in', [leagues] if isinstance(leagues, str) else list(leagues)))
+    if positions is not None:
+        filters.append(('position', 'in', [positions] if isinstance(positions, str) else list(positions)))
+    return pd.read_parquet(path, engine="pyarrow", filters=filters or None)
@@ -0,0 +1,165 @@
+"""
+Per-host token-bucket rate limiting shared across threads, tasks and processes.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows: buckets are shared within the process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+    
+    With a ``state_file`` the bucket state is kept on disk under an exclusive
+    file lock, so every process pointing at the same file draws from the same
+    bucket. Without one it is shared by the threads of this process only.
+    
+    Args:
+        rate: Tokens added per second
+        burst: Bucket capacity
+        state_file: Optional path of the shared state file
+    """
+    
+    def __init__(self, rate: float, burst: int = 1, state_file: Optional[Path] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state_file = Path(state_file) if state_file and fcntl else None
+        self._lock = threading.Lock()
+        self._state = {'tokens': float(self.burst), 'updated': time.time()}
+        if self.state_file:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.touch(exist_ok=True)
+    
+    def acquire(self) -> float:
+        """Block until a token is available.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            delay = self._try_take()
+            if delay == 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+    
+    async def acquire_async(self) -> float:
+        """Coroutine version of ``acquire`` that sleeps without blocking the loop."""
+        waited = 0.0
+        while True:
+            delay = self._try_take()
+            if delay == 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+    
+    def _try_take(self) -> float:
+        """Take a token if possible; otherwise return how long to wait for one."""
+        with self._lock, self._locked_state() as state:
+            now = time.time()
+            tokens = min(self.burst, state['tokens'] + max(0.0, now - state['updated']) * self.rate)
+            state['updated'] = now
+            if tokens >= 1:
+                state['tokens'] = tokens - 1
+                return 0
+            state['tokens'] = tokens
+            return (1 - tokens) / self.rate
+    
+    @contextmanager
+    def _locked_state(self):
+        if self.state_file is None:
+            yield self._state
+            return
+        
+        with open(self.state_file, "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(f.read() or "null") or dict(self._state)
+                except ValueError:
+                    state = dict(self._state)
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """One token bucket per host.
+    
+    Args:
+        rate: Requests per second allowed per host
+        burst: Requests allowed back to back before throttling
+        state_dir: Directory for shared bucket state, enables cross-process limits
+    """
+    
+    _instances: Dict[Any, "RateLimiter"] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, rate: float, burst: int = 1, state_dir: Optional[str] = None):
+        self.rate = rate
+        self.burst = burst
+        self.state_dir = Path(state_dir) if state_dir else None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["RateLimiter"]:
+        """Return the shared limiter for the ``rate_limit`` config section.
+        
+        Page objects are created per lease, so limiters are cached by settings
+        to make every thread in the process share the same buckets.
+        
+        Returns:
+            RateLimiter, or None when rate limiting is not configured
+        """
+        settings = (config or {}).get('rate_limit')
+        if not settings or not settings.get('requests_per_second'):
+            return None
+        
+        key = (settings['requests_per_second'], settings.get('burst', 1), settings.get('shared_state_dir'))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(*key)
+                logger.info(f"Rate limit: {key[0]} requests/s per host, burst {key[1]}"
+                            + (f", shared via {key[2]}" if key[2] else ""))
+            return cls._instances[key]
+    
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for the host of ``url``."""
+        host = urlsplit(url).netloc or url
+        with self._lock:
+            if host not in self._buckets:
+                state_file = None
+                if self.state_dir:
+                    state_file = self.state_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', host)}.json"
+                self._buckets[host] = TokenBucket(self.rate, self.burst, state_file)
+            return self._buckets[host]
+    
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url`` is allowed; returns seconds waited."""
+        return self.bucket(url).acquire()
+    
+    async def acquire_async(self, url: str) -> float:
+        """Coroutine version of ``acquire``."""
+        return await self.bucket(url).acquire_async()
@@ -0,0 +1,165 @@
+"""
+On-disk snapshot cache for pages that change rarely during a season.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_HOURS = {"teams": 24 * 7, "contact": 24 * 7}
+
+
+class SnapshotCache:
+    """Content-addressed cache of extraction results keyed by URL.
+    
+    Each entry is one JSON file ``<root>/<stage>/<sha[:2]>/<sha>.json``
+    holding the URL, the fetch timestamp and the extracted data. Entries
+    expire after the stage's TTL. Reads touch the file's mtime, so when the
+    cache grows past ``max_bytes`` the least recently used entries go first.
+    
+    Args:
+        root: Cache directory
+        ttl_hours: Time to live per stage, in hours
+        max_bytes: Size limit across all stages, None for unbounded
+    """
+    
+    _instances: Dict[Any, "SnapshotCache"] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, root="data/cache", ttl_hours: Optional[Dict[str, float]] = None,
+                 max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.ttl_hours = {**DEFAULT_TTL_HOURS, **(ttl_hours or {})}
+        self.max_bytes = max_bytes
+        # Counted without the lock; only used for the end-of-stage log line
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._size = None
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["SnapshotCache"]:
+        """Return the shared cache for the ``cache`` config section.
+        
+        Returns:
+            SnapshotCache, or None when caching is not enabled
+        """
+        settings = (config or {}).get('cache')
+        if not settings or not settings.get('enabled', True):
+            return None
+        
+        max_mb = settings.get('max_mb')
+        key = (
+            settings.get('dir', 'data/cache'),
+            tuple(sorted(settings.get('ttl_hours', {}).items())),
+            int(max_mb * 1024 * 1024) if max_mb else None,
+        )
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(key[0], dict(key[1]), key[2])
+                logger.info(f"Snapshot cache: {key[0]}"
+                            + (f", limit {max_mb} MB" if max_mb else ""))
+            return cls._instances[key]
+    
+    def path_for(self, stage: str, url: str) -> Path:
+        """Return the entry file for ``url`` in ``stage``."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / stage / digest[:2] / f"{digest}.json"
+    
+    def get(self, stage: str, url: str) -> Optional[Any]:
+        """Return cached data for ``url`` if present and fresh, else None."""
+        entry = self.get_entry(stage, url)
+        return entry["data"] if entry is not None else None
+    
+    def get_entry(self, stage: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the fresh entry for ``url`` with its ``fetched_at`` epoch time and ``data``."""
+        path = self.path_for(stage, url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        
+        age_hours = (time.time() - entry.get("fetched_at", 0)) / 3600
+        if entry.get("url") != url or age_hours > self.ttl_hours.get(stage, 0):
+            return None
+        
+        # Record the access for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        logger.debug(f"Cache hit ({stage}, {age_hours:.1f}h old): {url}")
+        return entry
+    
+    def invalidate(self, stage: str, url: str):
+        """Drop the entry for ``url`` so the next read goes to the site."""
+        path = self.path_for(stage, url)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+    
+    def put(self, stage: str, url: str, data: Any):
+        """Store ``data`` for ``url``, evicting old entries if over the limit."""
+        path = self.path_for(stage, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"url": url, "fetched_at": time.time(), "data": data},
+                             ensure_ascii=False)
+        
+        # Write then rename, so concurrent readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        previous = path.stat().st_size if path.exists() else 0
+        os.replace(tmp_path, path)
+        
+        if self.max_bytes is not None:
+            with self._lock:
+                if self._size is None:
+                    self._size = self._scan_size()
+                else:
+                    self._size += len(payload.encode("utf-8")) - previous
+                if self._size > self.max_bytes:
+                    self._evict()
+    
+    def _scan_size(self) -> int:
+        """Return the total size of all entries on disk."""
+        return sum(path.stat().st_size for path in self.root.glob("*/*/*.json"))
+    
+    def _evict(self):
+        """Remove least recently used entries until under 90% of the limit."""
+        entries = []
+        for path in self.root.glob("*/*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        
+        self._size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._size -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cache entries, {self._size} bytes remain")
@@ -0,0 +1,320 @@
+"""
+SQLite result store shared by all stages.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.utils.teams import parse_team_id
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leagues (
+    url TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    position INTEGER,            -- order in the latest listing, NULL once no longer listed
+    filters TEXT,
+    listed_at TEXT,
+    teams_fetched_at TEXT
+);
+CREATE TABLE IF NOT EXISTS teams (
+    team_id TEXT PRIMARY KEY,
+    team_url TEXT NOT NULL,
+    team_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS team_leagues (
+    league_url TEXT NOT NULL REFERENCES leagues(url),
+    position INTEGER NOT NULL,
+    team_id TEXT NOT NULL REFERENCES teams(team_id),
+    team_name TEXT NOT NULL,
+    team_url TEXT NOT NULL,
+    PRIMARY KEY (league_url, position)
+);
+CREATE INDEX IF NOT EXISTS team_leagues_team_id ON team_leagues(team_id);
+CREATE TABLE IF NOT EXISTS officials (
+    team_id TEXT NOT NULL REFERENCES teams(team_id),
+    name TEXT NOT NULL,
+    position TEXT,
+    email TEXT NOT NULL,
+    phone TEXT,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (team_id, email)
+);
+CREATE INDEX IF NOT EXISTS officials_email ON officials(email COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS fetch_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stage TEXT NOT NULL,
+    key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    leagues TEXT
+);
+CREATE INDEX IF NOT EXISTS fetch_log_key ON fetch_log(stage, key, id);
+"""
+
+
+class ResultStore:
+    """SQLite store for leagues, teams and officials across runs.
+    
+    Writes are grouped into transactions of ``batch_size`` records, so a
+    crash loses at most one uncommitted batch. One connection is shared by
+    all worker threads behind a lock; reads flush pending writes first.
+    
+    Args:
+        path: Database file
+        batch_size: Records written per transaction
+    """
+    
+    _instances: Dict[Any, "ResultStore"] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, path="data/scraper.db", batch_size: int = 100):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["ResultStore"]:
+        """Return the shared store for the ``store`` config section.
+        
+        Returns:
+            ResultStore, or None when the store is not configured
+        """
+        settings = (config or {}).get('store')
+        if not settings or not settings.get('enabled', True):
+            return None
+        
+        key = (settings.get('path', 'data/scraper.db'), settings.get('batch_size', 100))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(*key)
+                logger.info(f"Result store: {key[0]}")
+            return cls._instances[key]
+    
+    def close(self):
+        """Commit pending writes and close the connection."""
+        self.flush()
+        self._conn.close()
+    
+    # Writes
+    
+    def _write(self, statements):
+        """Run ``(sql, params)`` pairs as part of the current batch."""
+        with self._lock:
+            if self._pending == 0:
+                self._conn.execute("BEGIN")
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self._commit()
+    
+    def _commit(self):
+        if self._pending:
+            self._conn.execute("COMMIT")
+            self._pending = 0
+    
+    def flush(self):
+        """Commit the current batch."""
+        with self._lock:
+            self._commit()
+    
+    def start_listing(self):
+        """Mark every league unlisted before a new categories listing is saved."""
+        self._write([("UPDATE leagues SET position = NULL", ())])
+    
+    def save_league(self, league: Dict[str, Any], position: int):
+        """Record a league found by the categories stage at ``position``.
+        
+        The names of the filter combinations that found it are kept from
+        ``league['filters']``.
+        """
+        filters = league.get('filters')
+        self._write([(
+            "INSERT INTO leagues (url, name, position, filters, listed_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET name = excluded.name, position = excluded.position, "
+            "filters = excluded.filters, listed_at = excluded.listed_at",
+            (league['url'], league['name'], position,
+             json.dumps(filters, ensure_ascii=False) if filters else None, datetime.now().isoformat())
+        )])
+    
+    def save_league_teams(self, entry: Dict[str, Any]):
+        """Replace the teams of one league with a teams.json league entry."""
+        fetched_at = entry.get('fetched_at') or datetime.now().isoformat()
+        statements = [
+            ("INSERT INTO leagues (url, name, teams_fetched_at) VALUES (?, ?, ?) "
+             "ON CONFLICT(url) DO UPDATE SET teams_fetched_at = excluded.teams_fetched_at",
+             (entry['league_url'], entry['league_name'], fetched_at)),
+            ("DELETE FROM team_leagues WHERE league_url = ?", (entry['league_url'],)),
+        ]
+        for position, team in enumerate(entry['teams']):
+            team_id = parse_team_id(team['url'])
+            statements.append((
+                "INSERT INTO teams (team_id, team_url, team_name) VALUES (?, ?, ?) "
+                "ON CONFLICT(team_id) DO NOTHING",
+                (team_id, team['url'], team['name'])
+            ))
+            statements.append((
+                "INSERT INTO team_leagues (league_url, position, team_id, team_name, team_url) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (entry['league_url'], position, team_id, team['name'], team['url'])
+            ))
+        statements.append((
+            "INSERT INTO fetch_log (stage, key, url, fetched_at, found) VALUES ('teams', ?, ?, ?, ?)",
+            (entry['league_url'], entry['league_url'], fetched_at, int(bool(entry['teams'])))
+        ))
+        self._write(statements)
+    
+    def save_contact(self, record: Dict[str, Any]):
+        """Store a contact journal record as the team's current official."""
+        statements = [
+            ("INSERT INTO teams (team_id, team_url, team_name) VALUES (?, ?, ?) "
+             "ON CONFLICT(team_id) DO NOTHING",
+             (record['team_id'], record['team_url'], record.get('team_name', ''))),
+            ("DELETE FROM officials WHERE team_id = ?", (record['team_id'],)),
+            ("INSERT INTO fetch_log (stage, key, url, fetched_at, found, leagues) "
+             "VALUES ('contact', ?, ?, ?, ?, ?)",
+             (record['team_id'], record['team_url'], record['fetched_at'], int(bool(record['contact'])),
+              json.dumps(record.get('leagues', []), ensure_ascii=False))),
+        ]
+        contact = record['contact']
+        if contact:
+            statements.append((
+                "INSERT INTO officials (team_id, name, position, email, phone, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (record['team_id'], contact['name'], contact.get('position'), contact['email'],
+                 contact.get('phone'), record['fetched_at'])
+            ))
+        self._write(statements)
+    
+    def update_contact_leagues(self, records: Iterable[Dict[str, Any]]):
+        """Replace the leagues stored with the latest fetch of each record's team."""
+        for record in records:
+            self._write([(
+                "UPDATE fetch_log SET leagues = ? WHERE id = ("
+                "  SELECT max(id) FROM fetch_log WHERE stage = 'contact' AND key = ?)",
+                (json.dumps(record.get('leagues', []), ensure_ascii=False), record['team_id'])
+            )])
+        self.flush()
+    
+    # Queries
+    
+    def _query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        with self._lock:
+            self._commit()
+            return self._conn.execute(sql, params).fetchall()
+    
+    def _iter_query(self, sql: str, params=()) -> Iterator[sqlite3.Row]:
+        """Stream rows on a separate cursor, so exports do not load whole tables."""
+        self.flush()
+        reader = sqlite3.connect(str(self.path))
+        reader.row_factory = sqlite3.Row
+        try:
+            yield from reader.execute(sql, params)
+        finally:
+            reader.close()
+    
+    def listed_leagues(self) -> Iterator[Dict[str, Any]]:
+        """Yield the leagues of the latest listing, in listing order."""
+        for row in self._iter_query(
+            "SELECT name, url, filters FROM leagues WHERE position IS NOT NULL ORDER BY position"
+        ):
+            league = {'name': row['name'], 'url': row['url']}
+            if row['filters']:
+                league['filters'] = json.loads(row['filters'])
+            yield league
+    
+    def iter_league_entries(self, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield teams.json league entries for the listed leagues with fetched teams.
+        
+        Args:
+            since: Only include leagues whose teams were fetched at or after
+                this ISO timestamp
+        """
+        entry = None
+        for row in self._iter_query(
+            "SELECT l.name AS league_name, l.url AS league_url, l.teams_fetched_at, "
+            "tl.team_name, tl.team_url FROM leagues l "
+            "LEFT JOIN team_leagues tl ON tl.league_url = l.url "
+            "WHERE l.position IS NOT NULL AND l.teams_fetched_at >= ? "
+            "ORDER BY l.position, tl.position",
+            (since or "",)
+        ):
+            if entry is None or entry['league_url'] != row['league_url']:
+                if entry is not None:
+                    yield entry
+                entry = {
+                    'league_name': row['league_name'],
+                    'league_url': row['league_url'],
+                    'fetched_at': row['teams_fetched_at'],
+                    'teams': []
+                }
+            if row['team_url']:
+                entry['teams'].append({'name': row['team_name'], 'url': row['team_url']})
+        if entry is not None:
+            yield entry
+    
+    def iter_team_appearances(self) -> Iterator[Dict[str, str]]:
+        """Yield one entry per team per listed league, as the contact stage reads them."""
+        for row in self._iter_query(
+            "SELECT l.name AS league_name, tl.team_name, tl.team_url FROM leagues l "
+            "JOIN team_leagues tl ON tl.league_url = l.url "
+            "WHERE l.position IS NOT NULL ORDER BY l.position, tl.position"
+        ):
+            yield dict(row)
+    
+    def contact_records(self, since: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Return the latest contact fetch per team, shaped like journal records.
+        
+        Args:
+            since: Only include fetches at or after this ISO timestamp
+        """
+        rows = self._query(
+            "SELECT f.key AS team_id, f.url AS team_url, f.fetched_at, f.leagues, "
+            "o.name, o.position, o.email, o.phone FROM fetch_log f "
+            "LEFT JOIN officials o ON o.team_id = f.key "
+            "WHERE f.stage = 'contact' AND f.fetched_at >= ? AND f.id = ("
+            "  SELECT max(id) FROM fetch_log WHERE stage = 'contact' AND key = f.key)",
+            (since or "",)
+        )
+        records = {}
+        for row in rows:
+            contact = None
+            if row['email']:
+                contact = {'name': row['name'], 'email': row['email']}
+                if row['phone']:
+                    contact['phone'] = row['phone']
+                contact['position'] = row['position']
+            records[row['team_id']] = {
+                'team_id': row['team_id'],
+                'team_url': row['team_url'],
+                'leagues': json.loads(row['leagues'] or "[]"),
+                'fetched_at': row['fetched_at'],
+                'contact': contact
+            }
+        return records
+    
+    def teams_for_email(self, email: str) -> List[Dict[str, str]]:
+        """Return every listed team appearance managed by ``email``."""
+        return [dict(row) for row in self._query(
+            "SELECT o.name AS administrator_name, o.email, tl.team_name, l.name AS league_name "
+            "FROM officials o JOIN team_leagues tl ON tl.team_id = o.team_id "
+            "JOIN leagues l ON l.url = tl.league_url "
+            "WHERE o.email = ? COLLATE NOCASE AND l.position IS NOT NULL "
+            "ORDER BY l.position, tl.position",
+            (email.strip(),)
+        )]
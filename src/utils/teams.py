@@ -0,0 +1,96 @@
+"""
+Team URL helpers shared by the teams and contact stages.
+"""
+
+import logging
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TEAM_ID_PATTERN = re.compile(r"/team/([^/?#]+)")
+
+
+def parse_team_id(team_url: str) -> str:
+    """Return the canonical team ID from a ``/team/<id>/`` URL.
+    
+    Falls back to the URL itself when it does not contain a team path, so the
+    result can always be used as a key.
+    """
+    match = TEAM_ID_PATTERN.search(team_url)
+    return match.group(1) if match else team_url
+
+
+def plan_team_fetches(all_teams: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Collapse team appearances across leagues into one fetch per team ID.
+    
+    Args:
+        all_teams: Team entries with league_name, team_name and team_url,
+            one per league appearance
+            
+    Returns:
+        One entry per team ID, in first-seen order, with the team_id, the
+        team_url and team_name of its first appearance, and ``appearances``
+        holding every original entry so results can be fanned back out
+    """
+    plan = {}
+    for team in all_teams:
+        team_id = parse_team_id(team['team_url'])
+        entry = plan.get(team_id)
+        if entry is None:
+            plan[team_id] = {
+                'team_id': team_id,
+                'team_url': team['team_url'],
+                'team_name': team['team_name'],
+                'appearances': [team]
+            }
+        else:
+            entry['appearances'].append(team)
+    
+    if all_teams:
+        saved = len(all_teams) - len(plan)
+        logger.info(f"Planned {len(plan)} team fetches for {len(all_teams)} league appearances "
+                    f"({saved} duplicate page loads removed)")
+    return list(plan.values())
+
+
+def plan_incremental_fetches(plan: List[Dict[str, Any]], previous: Dict[str, Dict[str, Any]],
+                             max_age: timedelta, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Select the planned teams that need a fresh contact fetch.
+    
+    A team is refetched when it was not fetched before, when the set of
+    leagues it appears in differs from the previous run, or when its last
+    fetch is older than ``max_age``.
+    
+    Args:
+        plan: Output of ``plan_team_fetches`` for the current teams.json
+        previous: Journal records of earlier runs, keyed by team_id
+        max_age: Age after which a fetched contact is refreshed
+        now: Reference time, defaults to the current time
+        
+    Returns:
+        The plan entries to fetch, in plan order
+    """
+    now = now or datetime.now()
+    pending = []
+    reasons = Counter()
+    
+    for team in plan:
+        record = previous.get(team['team_id'])
+        leagues = sorted({a['league_name'] for a in team['appearances']})
+        if record is None:
+            reason = 'new'
+        elif record.get('leagues') != leagues:
+            reason = 'league membership changed'
+        elif now - datetime.fromisoformat(record['fetched_at']) > max_age:
+            reason = 'stale'
+        else:
+            continue
+        reasons[reason] += 1
+        pending.append(team)
+    
+    logger.info(f"Incremental plan: {len(pending)} of {len(plan)} teams to fetch"
+                + "".join(f", {count} {reason}" for reason, count in reasons.items()))
+    return pending
@@ -0,0 +1,190 @@
+"""
+Readiness detection for single-page-app navigation.
+
+Replaces fixed ``time.sleep`` page-load delays with waits that return as soon
+as the target element is present and the DOM has stopped mutating.
+"""
+
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from src.utils.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Installs a MutationObserver once per document and returns the number of
+# milliseconds since the DOM last changed.
+DOM_QUIET_SCRIPT = """
+if (!window.__scraperObserver) {
+    window.__scraperLastMutation = performance.now();
+    window.__scraperObserver = new MutationObserver(function () {
+        window.__scraperLastMutation = performance.now();
+    });
+    window.__scraperObserver.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+return performance.now() - window.__scraperLastMutation;
+"""
+
+# Marks the current document so a new one can be told apart from it
+MARK_DOCUMENT_SCRIPT = "window.__scraperStaleDocument = true;"
+IS_NEW_DOCUMENT_SCRIPT = "return !window.__scraperStaleDocument;"
+
+
+class ReadinessWaiter:
+    """Waits for page elements and DOM quiescence, recording each wait.
+    
+    Args:
+        driver: Selenium WebDriver
+        timeout: Upper bound in seconds for any single wait
+        quiet_period: Seconds without DOM mutations that count as settled
+        quiet_timeout: Upper bound in seconds for the DOM to settle, so a page
+            that never stops mutating (tickers, animations) is not held for
+            the full ``timeout``
+        poll_interval: Seconds between readiness checks
+        page_load_strategy: Browser page load strategy; with "none" the old
+            document can still be current when ``driver.get`` returns
+        rate_limiter: Optional RateLimiter consulted before every navigation
+    """
+    
+    def __init__(self, driver, timeout=20, quiet_period=0.5, poll_interval=0.1,
+                 page_load_strategy="normal", rate_limiter=None, quiet_timeout=2.0):
+        self.driver = driver
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.quiet_timeout = quiet_timeout
+        self.poll_interval = poll_interval
+        self.page_load_strategy = page_load_strategy
+        self.rate_limiter = rate_limiter
+        self.timings = []  # (label, seconds) per completed wait
+        self.timeouts = 0
+        self.rate_limited = 0.0  # seconds spent waiting on the rate limiter
+    
+    @classmethod
+    def from_config(cls, driver, config):
+        """Create a waiter from the ``delays`` and ``browser`` config sections.
+        
+        Reads ``delays.ready_timeout``, ``delays.dom_quiet`` and
+        ``delays.dom_quiet_timeout``.
+        """
+        config = config or {}
+        delays = config.get('delays', {})
+        return cls(
+            driver,
+            timeout=delays.get('ready_timeout', 20),
+            quiet_period=delays.get('dom_quiet', 0.5),
+            quiet_timeout=delays.get('dom_quiet_timeout', 2.0),
+            page_load_strategy=config.get('browser', {}).get('page_load_strategy', 'normal'),
+            rate_limiter=RateLimiter.from_config(config)
+        )
+    
+    def navigate(self, url):
+        """Load ``url`` and make sure later waits run against the new document."""
+        if self.rate_limiter:
+            start = time.monotonic()
+            self.rate_limiter.acquire(url)
+            self.record("rate limit", start)
+            self.rate_limited += time.monotonic() - start
+        
+        start = time.monotonic()
+        if self.page_load_strategy != "none":
+            self.driver.get(url)
+            self.record("navigation", start)
+            return
+        
+        try:
+            self.driver.execute_script(MARK_DOCUMENT_SCRIPT)
+        except WebDriverException:
+            pass
+        self.driver.get(url)
+        try:
+            # Scripts can fail while the navigation is in flight, so retry on errors
+            WebDriverWait(
+                self.driver, self.timeout, poll_frequency=self.poll_interval,
+                ignored_exceptions=(WebDriverException,)
+            ).until(lambda d: d.execute_script(IS_NEW_DOCUMENT_SCRIPT))
+        except TimeoutException:
+            logger.warning(f"Navigation to {url} did not commit within {self.timeout}s")
+        self.record("navigation", start)
+    
+    def wait_for(self, locator, label=None):
+        """Wait until ``locator`` is present and the DOM has settled.
+        
+        Args:
+            locator: (By, value) tuple of the element the page needs
+            label: Name used in timing records, defaults to the locator value
+            
+        Returns:
+            The located element
+            
+        Raises:
+            TimeoutException: If the element does not appear within the timeout
+        """
+        label = label or locator[1]
+        start = time.monotonic()
+        try:
+            element = self._wait(self.timeout).until(EC.presence_of_element_located(locator))
+        except TimeoutException:
+            self.timeouts += 1
+            self.record(f"{label} (timeout)", start)
+            raise
+        
+        self._wait_quiet(start)
+        self.record(label, start)
+        return element
+    
+    def wait_for_quiet(self, label="dom quiet"):
+        """Wait until the DOM has stopped mutating, e.g. after a click."""
+        start = time.monotonic()
+        self._wait_quiet(start)
+        self.record(label, start)
+    
+    def wait_until_hidden(self, locator, label=None):
+        """Wait until ``locator`` is gone or invisible, bounded by the timeout."""
+        label = label or f"{locator[1]} hidden"
+        start = time.monotonic()
+        try:
+            self._wait(self.timeout).until(EC.invisibility_of_element_located(locator))
+        except TimeoutException:
+            logger.warning(f"Still visible after {self.timeout}s: {locator[1]}")
+        self.record(label, start)
+    
+    def _wait(self, timeout):
+        return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval)
+    
+    def _wait_quiet(self, start):
+        """Poll until no mutation for ``quiet_period`` or a timeout is spent.
+        
+        The wait ends at ``quiet_timeout`` after it began, and never later
+        than ``timeout`` after ``start``.
+        """
+        quiet_ms = self.quiet_period * 1000
+        deadline = min(start + self.timeout, time.monotonic() + self.quiet_timeout)
+        
+        while True:
+            try:
+                idle_ms = self.driver.execute_script(DOM_QUIET_SCRIPT)
+            except WebDriverException as e:
+                logger.debug(f"DOM quiet check failed: {e}")
+                return
+            
+            if idle_ms is None or idle_ms >= quiet_ms:
+                return
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.debug("DOM still mutating at wait upper bound, continuing")
+                return
+            # Sleep just long enough for the current quiet window to complete
+            time.sleep(min(remaining, max(self.poll_interval, (quiet_ms - idle_ms) / 1000)))
+    
+    def record(self, label, start):
+        """Record the time spent since ``start`` under ``label``."""
+        elapsed = time.monotonic() - start
+        self.timings.append((label, elapsed))
+        logger.debug(f"Ready: {label} after {elapsed:.2f}s")
@@ -0,0 +1,117 @@
+"""
+Tests for BrowserPool leasing, with fake drivers instead of Chrome.
+"""
+import threading
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.utils.browser import BrowserPool, browser_options
+
+
+class FakeDriver:
+    def __init__(self):
+        self.dead = False
+        self.quit_called = False
+    
+    @property
+    def current_url(self):
+        if self.dead:
+            raise WebDriverException("invalid session id")
+        return "about:blank"
+    
+    def quit(self):
+        self.quit_called = True
+
+
+def fake_pool(size, spawns):
+    """Pool whose driver starts return or raise the items of ``spawns`` in order."""
+    pool = BrowserPool(size=size, warm=False)
+    spawns = iter(spawns)
+    
+    def create_driver():
+        result = next(spawns)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    pool._manager._create_driver = create_driver
+    return pool
+
+
+def test_dead_session_is_retired_on_checkin():
+    first, second = FakeDriver(), FakeDriver()
+    with fake_pool(1, [first, second]) as pool:
+        with pool.acquire() as driver:
+            # Page objects swallow the error; the probe still sees it
+            driver.dead = True
+        with pool.acquire() as driver:
+            assert driver is second
+    assert first.quit_called
+
+
+def test_waiter_wakes_when_replacement_fails():
+    first, third = FakeDriver(), FakeDriver()
+    with fake_pool(1, [first, RuntimeError("chrome failed to start"), third]) as pool:
+        leased = threading.Event()
+        results = []
+        
+        def waiter():
+            leased.wait()
+            try:
+                with pool.acquire():
+                    results.append("leased")
+            except RuntimeError as e:
+                results.append(str(e))
+        
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        with pool.acquire() as driver:
+            leased.set()
+            driver.dead = True
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+        assert results == ["chrome failed to start"]
+        # The failed start gave its slot back
+        with pool.acquire() as driver:
+            assert driver is third
+
+
+def test_checkout_fails_once_closed():
+    pool = fake_pool(1, [FakeDriver()])
+    pool.close()
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            pass
+
+
+def test_recycled_browsers_reuse_profiles(tmp_path):
+    pool = BrowserPool(size=2, max_pages=1, warm=False, user_data_dir=str(tmp_path))
+    profiles = []
+    
+    def start_driver(profile_number=None):
+        profiles.append(profile_number)
+        return FakeDriver()
+    
+    pool._manager._start_driver = start_driver
+    with pool:
+        for _ in range(3):
+            with pool.acquire():
+                with pool.acquire():
+                    pass
+    
+    # Every lease retires its browser and the next one takes the freed profile
+    assert profiles == [0, 1] * 3
+
+
+def test_stages_get_separate_profile_directories(tmp_path):
+    browser_config = {'user_data_dir': str(tmp_path)}
+    
+    teams = browser_options(browser_config, stage="teams")['user_data_dir']
+    contact = browser_options(browser_config, stage="contact")['user_data_dir']
+    
+    assert teams != contact
+    assert Path(teams).parent == Path(contact).parent == tmp_path
+    assert browser_options({}, stage="teams")['user_data_dir'] is None
@@ -0,0 +1,78 @@
+"""
+Tests for the multi-filter categories sweep.
+"""
+import json
+
+from src.scrapers import categories_scraper
+from src.scrapers.categories_scraper import CategoriesScraper
+
+BASE_URL = "https://example.fi"
+
+
+def leagues(*names):
+    return [{'name': name, 'url': f"{BASE_URL}/category/{name}/tables"} for name in names]
+
+
+# Leagues listed by the results page for each gender button
+RESULTS = {
+    'B': leagues("P12", "Mixed", "P11"),
+    'G': leagues("T12", "Mixed"),
+    'M': leagues("M1"),
+}
+
+
+def test_sweep_merges_leagues_by_url_and_keeps_provenance(monkeypatch, tmp_path, fake_pool,
+                                                          fake_categories_page):
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / "scraper.json"
+    config_file.write_text(json.dumps({
+        'output': {'leagues_file': "data/intermediate/leagues.json"},
+        'filters': [
+            {'name': "boys", 'buttons': [{'value': "football"}, {'value': "B"}]},
+            {'buttons': [{'value': "football"}, {'value': "G"}]},
+        ]
+    }))
+    fake_categories_page.results = RESULTS
+    monkeypatch.setattr(categories_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(categories_scraper, "CategoriesPage", fake_categories_page)
+    
+    streamed = []
+    CategoriesScraper(str(config_file)).scrape(
+        delay=0, on_league=lambda league: streamed.append(league['name']), workers=4
+    )
+    
+    output = json.loads((tmp_path / "data/intermediate/leagues.json").read_text())
+    assert [filter_set['name'] for filter_set in output['filters_applied']] == ["boys", "football-G"]
+    assert [(league['name'], league['filters']) for league in output['leagues']] == [
+        ("P12", ["boys"]),
+        ("Mixed", ["boys", "football-G"]),
+        ("P11", ["boys"]),
+        ("T12", ["football-G"]),
+    ]
+    assert sorted(streamed) == ["Mixed", "P11", "P12", "T12"]
+    # The pool never grows past the number of combinations
+    assert [(pool.size, len(pool.leases)) for pool in fake_pool.created] == [(2, 2)]
+
+
+def test_sweep_queues_combinations_for_a_capped_pool(monkeypatch, tmp_path, fake_pool,
+                                                     fake_categories_page):
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / "scraper.json"
+    config_file.write_text(json.dumps({
+        'output': {'leagues_file': "data/intermediate/leagues.json"},
+        'filters': [{'buttons': [{'value': "football"}, {'value': gender}]} for gender in RESULTS]
+    }))
+    fake_categories_page.results = RESULTS
+    # Hold each lease long enough for the combinations to overlap
+    fake_categories_page.delay = 0.05
+    monkeypatch.setattr(categories_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(categories_scraper, "CategoriesPage", fake_categories_page)
+    
+    CategoriesScraper(str(config_file)).scrape(delay=0, workers=2)
+    
+    output = json.loads((tmp_path / "data/intermediate/leagues.json").read_text())
+    assert len(output['leagues']) == 5
+    pool, = fake_pool.created
+    assert (pool.size, len(pool.leases)) == (2, 3)
+    # The third combination waited for a lease instead of starting a browser
+    assert pool.max_active <= 2
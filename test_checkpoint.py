@@ -0,0 +1,50 @@
+"""
+Tests for the contact checkpoint journal and what gets recorded in it.
+"""
+import json
+
+from selenium.common.exceptions import TimeoutException
+
+from src.scrapers import contact_scraper
+from src.scrapers.contact_scraper import ContactScraper
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.teams import plan_team_fetches
+
+
+def test_append_after_truncated_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"key": "1"}\n{"key": "2", "va')
+    
+    with CheckpointJournal(path) as journal:
+        journal.append({'key': "3"})
+    
+    assert set(CheckpointJournal(path).load()) == {"1", "3"}
+    assert json.loads(path.read_text().splitlines()[-1]) == {'key': "3"}
+
+
+def test_failed_pages_are_not_journaled(tmp_path, monkeypatch, fake_pool, fake_page):
+    monkeypatch.chdir(tmp_path)
+    
+    def extract_contact(players_url):
+        if "/team/2/" in players_url:
+            raise TimeoutException("officials table")
+        if "/team/3/" in players_url:
+            return None
+        return {'name': "Liisa Johtaja", 'email': "liisa@example.fi", 'position': "Joukkueenjohtaja"}
+    
+    monkeypatch.setattr(contact_scraper, "ContactPage", fake_page(extract_contact))
+    scraper = ContactScraper({})
+    scraper.begin()
+    
+    with scraper.journal:
+        for team in plan_team_fetches([
+            {'league_name': "A", 'team_name': f"Team {team_id}", 'team_url': f"https://example.fi/team/{team_id}/info"}
+            for team_id in (1, 2, 3)
+        ]):
+            scraper.fetch_team(fake_pool(), team)
+    
+    done = scraper.begin(resume=True)
+    # The timed-out team is left for --resume; a page without officials is a result
+    assert set(done) == {'1', '3'}
+    assert done['3']['contact'] is None
+    assert len(scraper.report.pages) == 3
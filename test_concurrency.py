@@ -0,0 +1,103 @@
+"""
+Tests for the AIMD concurrency controller against the local replay server.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.utils.concurrency import AIMDController, adaptive_slot
+
+
+def crawl(controller, replay_server, pages, workers=8):
+    """Fetch ``pages`` players pages through the controller; return the peak in flight."""
+    session = requests.Session()
+    peak = [0]
+    lock = threading.Lock()
+    
+    def fetch(_):
+        with adaptive_slot(controller):
+            with lock:
+                peak[0] = max(peak[0], controller.in_flight)
+            session.get(f"{replay_server.base_url}/team/101/players").raise_for_status()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, range(pages)))
+    return peak[0]
+
+
+def test_limit_grows_while_latency_is_flat(replay_server):
+    replay_server.latency = 0.01
+    controller = AIMDController(initial=1, maximum=4, window=5)
+    
+    peak = crawl(controller, replay_server, pages=60)
+    
+    assert controller.limit == 4
+    assert peak <= 4
+    assert [d[1] for d in controller.decisions[:3]] == ["increase"] * 3
+
+
+def test_limit_halves_on_injected_errors(replay_server):
+    controller = AIMDController(initial=8, maximum=8, window=100)
+    replay_server.fail_every = 3
+    session = requests.Session()
+    
+    for _ in range(6):
+        with pytest.raises(requests.HTTPError), adaptive_slot(controller):
+            for _ in range(3):
+                session.get(f"{replay_server.base_url}/team/101/players").raise_for_status()
+    
+    assert controller.limit == 1
+    assert all(d[1] in ("decrease", "hold") for d in controller.decisions)
+
+
+def test_one_decrease_per_epoch():
+    controller = AIMDController(initial=8, maximum=8)
+    slots = [controller.acquire() for _ in range(8)]
+    
+    for slot in slots:
+        slot.fail("TimeoutException")
+        controller.release(slot, 1.0)
+    
+    assert controller.limit == 4
+
+
+def test_limit_halves_when_latency_rises(replay_server):
+    replay_server.latency = 0.01
+    controller = AIMDController(initial=2, maximum=2, window=5)
+    crawl(controller, replay_server, pages=10, workers=2)
+    assert controller.limit == 2
+    
+    replay_server.latency = 0.1
+    crawl(controller, replay_server, pages=5, workers=2)
+    
+    assert controller.limit == 1
+    assert controller.decisions[-1][1] == "decrease"
+    assert "p95" in controller.decisions[-1][3]
+
+
+def test_acquire_blocks_at_limit():
+    controller = AIMDController(initial=1, maximum=1)
+    first = controller.acquire()
+    acquired = threading.Event()
+    
+    thread = threading.Thread(target=lambda: (controller.acquire(), acquired.set()))
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+    
+    controller.release(first, 0.01)
+    thread.join(timeout=1)
+    assert acquired.is_set()
+
+
+def test_rate_limit_wait_is_not_latency():
+    controller = AIMDController(initial=1, maximum=2, window=1)
+    
+    with controller.slot() as slot:
+        time.sleep(0.1)
+        slot.exclude(0.1)
+    
+    assert controller.baseline_p95 < 0.05
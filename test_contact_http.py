@@ -0,0 +1,64 @@
+"""
+Tests for the browser-free contact fast path against the local replay server.
+"""
+import pytest
+import requests
+
+from src.pages.contact_http_page import ContactHttpPage
+from src.scrapers import contact_scraper
+from src.scrapers.contact_scraper import ContactScraper
+
+
+def http_config(server, players_url="{base_url}/team/{{team_id}}/players"):
+    return {'http': {'players_url': players_url.format(base_url=server.base_url), 'retries': 0}}
+
+
+def test_fetches_officials_from_the_configured_endpoint(replay_server):
+    page = ContactHttpPage(http_config(replay_server))
+    
+    contact = page.extract_contact("https://tulospalvelu.palloliitto.fi/team/101/players")
+    
+    assert contact['email'] == "liisa.johtaja@example.fi"
+    assert [path for path, _ in replay_server.requests] == ["/team/101/players"]
+    assert [label for label, _ in page.timings] == ["http fetch", "extraction"]
+
+
+def test_nothing_found_returns_none(replay_server):
+    page = ContactHttpPage(http_config(replay_server))
+    
+    # 103 has no officials; 999 is not recorded and answers 404
+    assert page.extract_contact("https://example.fi/team/103/players") is None
+    assert page.extract_contact("https://example.fi/team/999/players") is None
+
+
+def test_overload_is_raised(replay_server):
+    replay_server.fail_every = 1
+    replay_server.fail_status = 429
+    page = ContactHttpPage(http_config(replay_server))
+    
+    with pytest.raises(requests.HTTPError):
+        page.extract_contact("https://example.fi/team/101/players")
+
+
+def test_disabled_without_an_endpoint():
+    assert not ContactHttpPage.enabled({})
+    assert not ContactHttpPage.enabled({'http': {'players_url': "https://example.fi/{team_id}", 'enabled': False}})
+    assert ContactHttpPage.enabled({'http': {'players_url': "https://example.fi/{team_id}"}})
+
+
+def test_scraper_falls_back_to_the_browser(replay_server, monkeypatch, tmp_path, fake_pool, fake_page):
+    monkeypatch.chdir(tmp_path)
+    browser_fetches = []
+    monkeypatch.setattr(contact_scraper, "ContactPage", fake_page(browser_fetches.append))
+    scraper = ContactScraper(http_config(replay_server))
+    pool = fake_pool()
+    
+    found, _ = scraper._fetch_contact(pool, f"{replay_server.base_url}/team/101/info")
+    missing, _ = scraper._fetch_contact(pool, f"{replay_server.base_url}/team/103/info")
+    
+    assert found['name'] == "Liisa Johtaja"
+    assert missing is None
+    # Only the team the fast path found nothing for leased a browser
+    assert len(pool.leases) == 1
+    assert browser_fetches == [f"{replay_server.base_url}/team/103/players"]
+    assert ['http' in page for page in scraper.report.pages] == [True, True, False]
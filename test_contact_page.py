@@ -0,0 +1,54 @@
+"""
+Tests for parsing officials out of recorded team players pages.
+"""
+from pathlib import Path
+
+from src.pages.contact_page import parse_officials_html, select_administrator
+
+
+def players_html(team_id):
+    return (Path(__file__).parent / f"fixtures/pages/team/{team_id}/players.html").read_text()
+
+
+def test_parse_officials_skips_rows_without_email():
+    html = players_html(101)
+    
+    officials = parse_officials_html(html)
+    
+    assert [o['position'] for o in officials] == ["Valmentaja", "Joukkueenjohtaja"]
+    assert officials[1] == {
+        'name': "Liisa Johtaja",
+        'email': "liisa.johtaja@example.fi",
+        'phone': "+358401234567",
+        'position': "Joukkueenjohtaja"
+    }
+
+
+def test_parse_officials_matches_browser_tree():
+    html = players_html(101)
+    # A browser's HTML parser cannot nest links, so it moves the contact div
+    # out of the name link; the rendered app keeps it nested
+    browser_html = html.replace(
+        'Liisa Johtaja\n            <div class="contactinfo">',
+        'Liisa Johtaja</a>\n            <div class="contactinfo">'
+    )
+    assert browser_html != html
+    
+    assert parse_officials_html(browser_html) == parse_officials_html(html)
+
+
+def test_select_administrator_prefers_joukkueenjohtaja():
+    contact = select_administrator(parse_officials_html(players_html(101)))
+    
+    assert contact['name'] == "Liisa Johtaja"
+    assert contact['email'] == "liisa.johtaja@example.fi"
+
+
+def test_select_administrator_falls_back_to_first_official():
+    contact = select_administrator(parse_officials_html(players_html(102)))
+    
+    assert contact == {'name': "Pekka Valmentaja", 'email': "pekka@example.fi", 'position': "Valmentaja"}
+
+
+def test_select_administrator_without_officials():
+    assert select_administrator(parse_officials_html(players_html(103))) is None
@@ -0,0 +1,106 @@
+"""
+Tests for the asyncio crawl engine against the local replay server.
+"""
+import asyncio
+import threading
+import time
+
+import requests
+
+from src.utils.crawl_engine import DEFAULT_PER_HOST, AsyncCrawlEngine, run_jobs
+
+
+class InFlight:
+    """Tracks the peak number of concurrent calls."""
+    
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+    
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+    
+    def __exit__(self, *exc):
+        with self.lock:
+            self.current -= 1
+
+
+def test_results_keep_input_order(replay_server):
+    session = requests.Session()
+    urls = [f"{replay_server.base_url}/team/{team_id}/players" for team_id in (101, 102, 103, 999)]
+    
+    results = AsyncCrawlEngine(concurrency=4).run(urls, lambda url: session.get(url).status_code)
+    
+    assert results == [200, 200, 200, 404]
+
+
+def test_failed_jobs_return_none():
+    def fetch(item):
+        if item == 2:
+            raise RuntimeError("boom")
+        return item
+    
+    assert AsyncCrawlEngine(concurrency=2).run([1, 2, 3], fetch) == [1, None, 3]
+
+
+def test_coroutine_fetcher():
+    async def fetch(item):
+        await asyncio.sleep(0.01)
+        return item * 2
+    
+    assert AsyncCrawlEngine(concurrency=3).run([1, 2, 3], fetch) == [2, 4, 6]
+
+
+def test_per_host_limit(replay_server):
+    replay_server.latency = 0.05
+    in_flight = {"127.0.0.1": InFlight(), "localhost": InFlight()}
+    port = replay_server.server_address[1]
+    urls = [f"http://{host}:{port}/team/101/players" for host in in_flight for _ in range(6)]
+    
+    def fetch(url):
+        with in_flight[url.split("//")[1].split(":")[0]]:
+            return requests.get(url).status_code
+    
+    results = AsyncCrawlEngine(concurrency=8, per_host=2).run(urls, fetch, url_of=lambda url: url)
+    
+    assert results == [200] * 12
+    assert all(tracker.peak == 2 for tracker in in_flight.values())
+
+
+def test_throughput_scales_with_concurrency(replay_server):
+    replay_server.latency = 0.05
+    urls = [f"{replay_server.base_url}/team/101/players"] * 20
+    
+    def crawl(concurrency):
+        session = requests.Session()
+        start = time.monotonic()
+        AsyncCrawlEngine(concurrency=concurrency, per_host=concurrency).run(
+            urls, lambda url: session.get(url).status_code, url_of=lambda url: url
+        )
+        return time.monotonic() - start
+    
+    serial = crawl(1)
+    parallel = crawl(5)
+    
+    assert parallel < serial / 2
+
+
+def test_run_jobs_keeps_order_on_both_engines():
+    def slow_square(n):
+        time.sleep(0.01 * (5 - n))
+        return n * n
+    
+    for engine in ("threads", "async"):
+        assert list(run_jobs(list(range(5)), slow_square, workers=3, engine=engine)) == [0, 1, 4, 9, 16]
+
+
+def test_per_host_default_does_not_follow_workers():
+    engine = AsyncCrawlEngine.from_config({}, workers=16)
+    assert engine.concurrency == 16
+    assert engine.per_host == DEFAULT_PER_HOST
+    
+    engine = AsyncCrawlEngine.from_config({'crawl': {'concurrency': 2, 'per_host': 1}}, workers=16)
+    assert (engine.concurrency, engine.per_host) == (2, 1)
@@ -0,0 +1,118 @@
+"""
+Tests for incremental re-scrape planning.
+"""
+import json
+import time
+from datetime import datetime, timedelta
+
+from selenium.common.exceptions import TimeoutException
+
+from src.scrapers import teams_scraper
+from src.scrapers.teams_scraper import TeamsScraper
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.teams import plan_incremental_fetches, plan_team_fetches
+
+NOW = datetime(2025, 3, 10, 12, 0)
+
+
+def team(league, team_id):
+    return {'league_name': league, 'team_name': f"Team {team_id}",
+            'team_url': f"https://example.fi/team/{team_id}/info"}
+
+
+def record(leagues, days_old):
+    return {'leagues': leagues, 'fetched_at': (NOW - timedelta(days=days_old)).isoformat()}
+
+
+def test_only_new_moved_and_stale_teams_are_fetched():
+    plan = plan_team_fetches([
+        team("A", 1), team("A", 2), team("A", 3), team("B", 3), team("B", 4), team("B", 5)
+    ])
+    previous = {
+        '1': record(["A"], 1),        # unchanged and fresh
+        '2': record(["A"], 10),       # stale
+        '3': record(["A"], 1),        # now also in league B
+        '4': record(["B"], 1),        # unchanged and fresh
+    }
+    
+    pending = plan_incremental_fetches(plan, previous, timedelta(days=7), now=NOW)
+    
+    assert [t['team_id'] for t in pending] == ['2', '3', '5']
+
+
+def test_previous_teams_json_is_reused_when_fresh(tmp_path):
+    teams_file = tmp_path / "teams.json"
+    teams_file.write_text(json.dumps({
+        'timestamp': (datetime.now() - timedelta(days=30)).isoformat(),
+        'leagues': [
+            {'league_name': "A", 'league_url': "https://example.fi/category/A/tables",
+             'fetched_at': datetime.now().isoformat(), 'teams': []},
+            # No per-league timestamp: falls back to the stale run timestamp
+            {'league_name': "B", 'league_url': "https://example.fi/category/B/tables", 'teams': []},
+            {'league_name': "C", 'league_url': "https://example.fi/category/C/tables",
+             'fetched_at': datetime.now().isoformat(), 'teams': []},
+        ]
+    }))
+    leagues = [{'name': name, 'url': f"https://example.fi/category/{name}/tables"}
+               for name in ("A", "B", "D")]
+    
+    fresh = TeamsScraper({})._load_fresh_leagues(teams_file, leagues)
+    
+    assert list(fresh) == ["https://example.fi/category/A/tables"]
+
+
+def test_cached_league_keeps_its_fetch_time(tmp_path, monkeypatch, fake_pool):
+    monkeypatch.chdir(tmp_path)
+    config = {'cache': {'dir': str(tmp_path / "cache")}}
+    league = {'name': "A", 'url': "https://example.fi/category/A/tables"}
+    cache = SnapshotCache.from_config(config)
+    cache.put("teams", league['url'], [{'name': "Team 1", 'url': "https://example.fi/team/1/info"}])
+    
+    # Age the entry by three days, within the cache TTL
+    path = cache.path_for("teams", league['url'])
+    entry = json.loads(path.read_text())
+    entry['fetched_at'] = time.time() - 3 * 86400
+    path.write_text(json.dumps(entry))
+    
+    pool = fake_pool()
+    result = TeamsScraper(config).fetch_league(pool, league, 1, 1)
+    
+    assert pool.leases == []
+    assert result['fetched_at'] == datetime.fromtimestamp(entry['fetched_at']).isoformat()
+    assert result['teams'][0]['name'] == "Team 1"
+    
+    # An incremental refetch drops the entry so the league comes from the site
+    cache.invalidate("teams", league['url'])
+    assert cache.get("teams", league['url']) is None
+
+
+def test_timed_out_league_keeps_its_previous_entry(tmp_path, monkeypatch, fake_pool, fake_page):
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "data/intermediate"
+    output_dir.mkdir(parents=True)
+    leagues = [{'name': name, 'url': f"https://example.fi/category/{name}/tables"} for name in ("A", "B")]
+    (output_dir / "leagues.json").write_text(json.dumps({'leagues': leagues}))
+    stale = (datetime.now() - timedelta(days=10)).isoformat()
+    (output_dir / "teams.json").write_text(json.dumps({
+        'timestamp': stale,
+        'leagues': [
+            {'league_name': "A", 'league_url': leagues[0]['url'], 'fetched_at': stale,
+             'teams': [{'name': "Team 1", 'url': "https://example.fi/team/1/info"}]},
+        ]
+    }))
+    
+    def extract_teams(league_url):
+        if "/A/" in league_url:
+            raise TimeoutException("league tables")
+        return [{'name': "Team 2", 'url': "https://example.fi/team/2/info"}]
+    
+    monkeypatch.setattr(teams_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(teams_scraper, "TeamsPage", fake_page(extract_teams))
+    
+    TeamsScraper({}).scrape(incremental=True)
+    
+    # A is neither emptied nor marked fresh, so the next run retries it
+    teams = {entry['league_name']: entry for entry in json.loads((output_dir / "teams.json").read_text())['leagues']}
+    assert teams["A"]['teams'] == [{'name': "Team 1", 'url': "https://example.fi/team/1/info"}]
+    assert teams["A"]['fetched_at'] == stale
+    assert [team['name'] for team in teams["B"]['teams']] == ["Team 2"]
@@ -0,0 +1,79 @@
+"""
+Tests for per-page timing instrumentation and run reports.
+"""
+import csv
+import json
+from types import SimpleNamespace
+
+from src.pages.contact_page import ContactPage
+from src.utils.instrumentation import CommandCounter, CommandProfiler, RunReport, percentile
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_command_counter_is_installed_once():
+    driver = SimpleNamespace(execute=lambda command, params=None: {'value': command})
+    
+    counter = CommandCounter.attach(driver)
+    driver.execute("get")
+    assert CommandCounter.attach(driver) is counter
+    driver.execute("findElement")
+    
+    assert counter.count == 2
+
+
+def test_report_groups_timings_by_phase(tmp_path):
+    report = RunReport("contact")
+    report.add_page("https://example.fi/team/1/players", [
+        ("rate limit", 0.1), ("navigation", 0.5), ("officials table", 0.25),
+        ("consent", 0.05), ("extraction", 0.02)
+    ], total=1.0, webdriver_calls=4)
+    report.add_page("https://example.fi/team/2/players", [
+        ("navigation", 0.3), ("officials table (timeout)", 2.0), ("debug dump", 0.4)
+    ], total=2.8, webdriver_calls=3)
+    
+    report_file = report.write(tmp_path)
+    
+    summary = json.loads(report_file.read_text())['summary']
+    assert summary['navigation']['count'] == 2
+    assert summary['wait']['max'] == 2.0
+    assert summary['debug_dump']['count'] == 1
+    assert summary['total']['p50'] == 1.0
+    with open(tmp_path / "contact_pages.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row['url'] for row in rows] == ["https://example.fi/team/1/players", "https://example.fi/team/2/players"]
+    assert rows[0]['extraction'] == "0.02"
+
+
+class StubDriver:
+    """Minimal driver whose commands all go through ``execute``."""
+    
+    def execute(self, driver_command, params=None):
+        return {'value': [{'position': "Joukkueenjohtaja", 'name': "Liisa", 'email': "l@example.fi"}]}
+    
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {'script': script, 'args': list(args)})['value']
+
+
+def test_profiler_attributes_commands_to_page_methods(tmp_path):
+    profiler = CommandProfiler(tmp_path / "contact_commands.folded")
+    driver = profiler.attach(StubDriver())
+    page = ContactPage(driver, {})
+    
+    page._extract_officials_script()
+    page._extract_officials_script()
+    driver.execute("getTitle")
+    
+    rows = profiler.by_method()
+    assert {(row['method'], row['command'], row['count']) for row in rows} == {
+        ("ContactPage._extract_officials_script", "executeScript", 2),
+        ("<outside src>", "getTitle", 1),
+    }
+    folded = profiler.write().read_text().splitlines()
+    assert folded[0].startswith("ContactPage._extract_officials_script;executeScript ")
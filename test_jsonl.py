@@ -0,0 +1,38 @@
+"""
+Tests for the streaming JSON Lines and JSON writers.
+"""
+import json
+
+import pytest
+
+from src.utils.jsonl import JsonLinesWriter, read_json_lines, write_json_stream
+
+
+def test_json_stream_matches_json_dump(tmp_path):
+    leagues = [
+        {'league_name': "P12", 'teams': [{'name': "FC Esimerkki", 'url': "https://example.fi/team/1/info"}]},
+        {'league_name': "P11 Ä", 'teams': []},
+    ]
+    expected = {'timestamp': "2025-03-10T12:00:00", 'leagues_processed': 2,
+                'leagues': leagues, 'total_teams': 1}
+    
+    count = write_json_stream(tmp_path / "teams.json",
+                              {'timestamp': expected['timestamp'], 'leagues_processed': 2},
+                              'leagues', iter(leagues), footer=lambda: {'total_teams': 1})
+    
+    assert count == 2
+    assert (tmp_path / "teams.json").read_text(encoding="utf-8") == \
+        json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_lines_replace_output_only_on_success(tmp_path):
+    path = tmp_path / "leagues.jsonl"
+    with JsonLinesWriter(path) as lines:
+        lines.write({'name': "P12"})
+    
+    with pytest.raises(RuntimeError), JsonLinesWriter(path) as lines:
+        lines.write({'name': "P11"})
+        raise RuntimeError("browser crashed")
+    
+    assert list(read_json_lines(path)) == [{'name': "P12"}]
+    assert list(read_json_lines(tmp_path / "leagues.jsonl.partial")) == [{'name': "P11"}]
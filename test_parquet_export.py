@@ -0,0 +1,52 @@
+"""
+Tests for the long-format Parquet export of contacts.
+"""
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.parquet_export import contacts_frame, query_contacts, write_contacts_parquet
+
+ROWS = [
+    {'administrator_name': "Pekka", 'position': "Joukkueenjohtaja", 'email': "pekka@example.fi",
+     'team': "FC A P12", 'league': "P12"},
+    {'administrator_name': "Pekka", 'position': "Joukkueenjohtaja", 'email': "pekka@example.fi",
+     'team': "FC A P12", 'league': "P11"},
+    {'administrator_name': "Liisa", 'position': "Valmentaja", 'email': "liisa@example.fi",
+     'phone': "040 123", 'team': "FC B P11", 'league': "P11"},
+    # Same appearance listed twice
+    {'administrator_name': "Liisa", 'position': "Valmentaja", 'email': "liisa@example.fi",
+     'phone': "040 123", 'team': "FC B P11", 'league': "P11"},
+]
+
+
+def test_contacts_frame_has_one_row_per_administrator_team_and_league():
+    df = contacts_frame(ROWS)
+    
+    assert len(df) == 3
+    assert list(df['league'].cat.categories) == ["P12", "P11"]
+    assert str(df['position'].dtype) == "category"
+    assert df.loc[df['administrator_name'] == "Pekka", 'phone'].isna().all()
+
+
+def test_query_contacts_filters_by_league(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = write_contacts_parquet(tmp_path / "contacts.parquet", ROWS)
+    
+    p11 = query_contacts(path, leagues="P11")
+    
+    assert sorted(p11['administrator_name']) == ["Liisa", "Pekka"]
+    assert str(p11['league'].dtype) == "category"
+    assert list(query_contacts(path, positions=["Valmentaja"])['team']) == ["FC B P11"]
+
+
+def test_contact_stage_does_not_load_pandas():
+    # Checked in a fresh interpreter, since this module has imported pandas
+    result = subprocess.run([
+        sys.executable, "-c",
+        "import sys; from src.scrapers.contact_scraper import ContactScraper; "
+        "sys.exit('pandas' in sys.modules)"
+    ])
+    
+    assert result.returncode == 0
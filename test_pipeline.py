@@ -0,0 +1,65 @@
+"""
+Tests for the pipelined run of all three stages against the local replay server.
+"""
+import csv
+import json
+
+import requests
+from click.testing import CliRunner
+
+from src.cli import main
+from src.pages.contact_page import parse_officials_html, select_administrator
+from src.pages.teams_page import parse_teams_html
+from src.scrapers import categories_scraper, contact_scraper, pipeline_scraper, teams_scraper
+from src.scrapers.pipeline_scraper import PipelineScraper
+
+
+def test_pipeline_streams_leagues_and_teams(replay_server, monkeypatch, tmp_path, fake_pool,
+                                            fake_categories_page, fake_page):
+    monkeypatch.chdir(tmp_path)
+    base_url = replay_server.base_url
+    config_file = tmp_path / "scraper.json"
+    config_file.write_text(json.dumps({
+        'output': {'leagues_file': "data/intermediate/leagues.json"}
+    }))
+    # The default filters end with the boys button
+    fake_categories_page.results = {'B': [
+        {'name': "P12", 'url': f"{base_url}/category/P12!etejp25/tables"},
+        {'name': "P11", 'url': f"{base_url}/category/P11!etejp25/tables"},
+    ]}
+    
+    monkeypatch.setattr(categories_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(categories_scraper, "CategoriesPage", fake_categories_page)
+    monkeypatch.setattr(pipeline_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(teams_scraper, "TeamsPage", fake_page(
+        lambda league_url: parse_teams_html(requests.get(league_url).text, league_url)
+    ))
+    monkeypatch.setattr(contact_scraper, "ContactPage", fake_page(
+        lambda players_url: select_administrator(parse_officials_html(requests.get(players_url).text))
+    ))
+    
+    output_file = PipelineScraper(str(config_file)).scrape(delay=0, workers=2)
+    
+    # Team 102 plays in both leagues but is fetched once; 103 has no officials
+    players_requests = [path for path, _ in replay_server.requests if path.endswith("/players")]
+    assert sorted(players_requests) == ["/team/101/players", "/team/102/players", "/team/103/players"]
+    
+    teams = json.loads((tmp_path / "data/intermediate/teams.json").read_text())
+    assert [league['league_name'] for league in teams['leagues']] == ["P12", "P11"]
+    assert json.loads((tmp_path / "data/intermediate/leagues.json").read_text())['leagues'][1]['name'] == "P11"
+    
+    with open(output_file, encoding="utf-8") as f:
+        rows = {row['email']: row for row in csv.DictReader(f)}
+    assert rows["pekka@example.fi"]['league'] == "P12, P11"
+    assert rows["liisa.johtaja@example.fi"]['team'] == "FC Esimerkki P12"
+
+
+def test_pipeline_rejects_stage_only_options(tmp_path):
+    config_file = tmp_path / "scraper.json"
+    config_file.write_text("{}")
+    
+    for option in (["--incremental"], ["--engine", "async"]):
+        result = CliRunner().invoke(main, ["--pipeline", "--config", str(config_file), *option])
+        
+        assert result.exit_code == 2
+        assert "not supported with --pipeline" in result.output
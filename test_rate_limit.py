@@ -0,0 +1,63 @@
+"""
+Tests for the per-host token-bucket rate limiter.
+"""
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from src.utils import rate_limit
+from src.utils.rate_limit import RateLimiter, TokenBucket
+
+
+def take_tokens(state_file, count, stamps):
+    bucket = TokenBucket(rate=20, burst=1, state_file=state_file)
+    for _ in range(count):
+        bucket.acquire()
+        stamps.put(time.time())
+
+
+@pytest.mark.skipif(rate_limit.fcntl is None, reason="shared state needs fcntl")
+def test_processes_share_one_rate(tmp_path):
+    context = multiprocessing.get_context("fork")
+    stamps = context.Queue()
+    state_file = tmp_path / "example.fi.json"
+    processes = [context.Process(target=take_tokens, args=(state_file, 5, stamps)) for _ in range(3)]
+    for process in processes:
+        process.start()
+    times = sorted(stamps.get(timeout=10) for _ in range(15))
+    for process in processes:
+        process.join(timeout=10)
+    
+    # 15 requests at 20/s with a burst of 1 need 14 refills, whoever makes them
+    assert times[-1] - times[0] >= 14 / 20 * 0.9
+    assert times[-1] - times[0] < 3
+    # No window of 0.5s holds more than the rate allows
+    assert all(times[i + 11] - times[i] >= 0.5 for i in range(len(times) - 11))
+
+
+def test_async_acquire_does_not_block_the_loop():
+    limiter = RateLimiter(rate=20, burst=2)
+    ticks = []
+    
+    async def ticker(stop):
+        while not stop.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+    
+    async def main():
+        stop = asyncio.Event()
+        ticking = asyncio.create_task(ticker(stop))
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async("https://example.fi/team/1/players") for _ in range(6)))
+        elapsed = time.monotonic() - start
+        stop.set()
+        await ticking
+        return elapsed
+    
+    elapsed = asyncio.run(main())
+    
+    # Two tokens in the burst, then four refills at 20/s
+    assert 4 / 20 * 0.9 <= elapsed < 1
+    assert len(ticks) >= 10
@@ -0,0 +1,54 @@
+"""
+Tests for the on-disk snapshot cache.
+"""
+import json
+import os
+import time
+
+from src.scrapers.contact_scraper import ContactScraper
+from src.utils.snapshot_cache import SnapshotCache
+
+
+def test_round_trip_and_ttl(tmp_path):
+    cache = SnapshotCache(tmp_path, ttl_hours={"teams": 1})
+    url = "https://example.fi/category/P12!etejp25/tables"
+    
+    cache.put("teams", url, [{'name': "FC Test", 'url': "https://example.fi/team/1/info"}])
+    
+    assert cache.get("teams", url)[0]['name'] == "FC Test"
+    assert cache.get("contact", url) is None
+    
+    # Age the entry past the TTL
+    path = cache.path_for("teams", url)
+    entry = json.loads(path.read_text())
+    entry['fetched_at'] -= 7200
+    path.write_text(json.dumps(entry))
+    assert cache.get("teams", url) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SnapshotCache(tmp_path, max_bytes=3500)
+    urls = [f"https://example.fi/team/{i}/players" for i in range(3)]
+    for i, url in enumerate(urls):
+        cache.put("contact", url, {'name': "x" * 800, 'email': f"{i}@example.fi"})
+        os.utime(cache.path_for("contact", url), (time.time() - 100 + i, time.time() - 100 + i))
+    
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get("contact", urls[0]) is not None
+    cache.put("contact", "https://example.fi/team/3/players", {'name': "y" * 800})
+    
+    assert cache.get("contact", urls[0]) is not None
+    assert cache.get("contact", urls[1]) is None
+    assert cache.get("contact", urls[2]) is not None
+
+
+def test_cached_contact_skips_the_browser(tmp_path, monkeypatch, fake_pool):
+    monkeypatch.chdir(tmp_path)
+    config = {'cache': {'dir': str(tmp_path / "cache")}}
+    contact = {'name': "Liisa Johtaja", 'email': "liisa.johtaja@example.fi", 'position': "Joukkueenjohtaja"}
+    SnapshotCache.from_config(config).put("contact", "https://example.fi/team/101/players", contact)
+    
+    pool = fake_pool()
+    
+    assert ContactScraper(config)._fetch_contact(pool, "https://example.fi/team/101/info")[0] == contact
+    assert pool.leases == []
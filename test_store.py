@@ -0,0 +1,141 @@
+"""
+Tests for the SQLite result store.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.scrapers import teams_scraper
+from src.scrapers.contact_scraper import ContactScraper
+from src.scrapers.teams_scraper import TeamsScraper
+from src.utils.store import ResultStore
+
+
+def league(name):
+    return {'name': name, 'url': f"https://example.fi/category/{name}/tables"}
+
+
+def entry(name, team_ids, fetched_at=None):
+    return {
+        'league_name': name,
+        'league_url': league(name)['url'],
+        'fetched_at': fetched_at or datetime.now().isoformat(),
+        'teams': [{'name': f"Team {team_id}", 'url': f"https://example.fi/team/{team_id}/info"}
+                  for team_id in team_ids]
+    }
+
+
+def contact_record(team_id, email, fetched_at=None, leagues=("A",)):
+    return {
+        'team_id': str(team_id),
+        'team_url': f"https://example.fi/team/{team_id}/info",
+        'leagues': list(leagues),
+        'fetched_at': fetched_at or datetime.now().isoformat(),
+        'contact': {'name': f"Admin {team_id}", 'email': email, 'position': "Joukkueenjohtaja"}
+                   if email else None
+    }
+
+
+def test_exports_follow_the_latest_listing(tmp_path):
+    store = ResultStore(tmp_path / "scraper.db")
+    for position, name in enumerate(["A", "B", "C"]):
+        store.save_league(league(name), position)
+    store.save_league_teams(entry("A", [1, 2]))
+    store.save_league_teams(entry("C", [2, 3]))
+    
+    # C drops out of the listing and B has no teams fetched yet
+    store.start_listing()
+    store.save_league(league("B"), 0)
+    store.save_league(league("A"), 1)
+    
+    assert [l['name'] for l in store.listed_leagues()] == ["B", "A"]
+    assert [e['league_name'] for e in store.iter_league_entries()] == ["A"]
+    assert [a['team_name'] for a in store.iter_team_appearances()] == ["Team 1", "Team 2"]
+    
+    stale = (datetime.now() - timedelta(days=10)).isoformat()
+    store.save_league_teams(entry("B", [4], fetched_at=stale))
+    cutoff = (datetime.now() - timedelta(days=7)).isoformat()
+    assert [e['league_name'] for e in store.iter_league_entries(since=cutoff)] == ["A"]
+
+
+def test_contact_records_keep_the_latest_fetch_per_team(tmp_path):
+    store = ResultStore(tmp_path / "scraper.db")
+    store.save_league(league("A"), 0)
+    store.save_league_teams(entry("A", [1, 2]))
+    
+    earlier = (datetime.now() - timedelta(hours=1)).isoformat()
+    store.save_contact(contact_record(1, "old@example.fi", fetched_at=earlier))
+    store.save_contact(contact_record(2, "Pekka@Example.fi", fetched_at=earlier))
+    started = datetime.now().isoformat()
+    store.save_contact(contact_record(1, "new@example.fi"))
+    
+    records = store.contact_records()
+    assert records['1']['contact']['email'] == "new@example.fi"
+    assert records['1']['leagues'] == ["A"]
+    assert set(store.contact_records(since=started)) == {'1'}
+    
+    assert [row['team_name'] for row in store.teams_for_email("pekka@example.fi")] == ["Team 2"]
+    assert store.teams_for_email("old@example.fi") == []
+    
+    store.save_contact(contact_record(2, None))
+    assert store.contact_records()['2']['contact'] is None
+
+
+def test_writes_are_committed_in_batches(tmp_path):
+    path = tmp_path / "scraper.db"
+    store = ResultStore(path, batch_size=3)
+    
+    def committed():
+        with sqlite3.connect(str(path)) as conn:
+            return conn.execute("SELECT count(*) FROM leagues").fetchone()[0]
+    
+    store.save_league(league("A"), 0)
+    store.save_league(league("B"), 1)
+    assert committed() == 0
+    store.save_league(league("C"), 2)
+    assert committed() == 3
+    
+    store.save_league(league("D"), 3)
+    store.flush()
+    assert committed() == 4
+
+
+def test_contact_checkpoint_commits_on_interrupt(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "scraper.db"
+    scraper = ContactScraper({'store': {'path': str(path), 'batch_size': 100}})
+    
+    with pytest.raises(KeyboardInterrupt), scraper.checkpoint():
+        scraper.store.save_contact(contact_record(1, "liisa@example.fi"))
+        raise KeyboardInterrupt
+    
+    with sqlite3.connect(str(path)) as conn:
+        assert conn.execute("SELECT email FROM officials").fetchall() == [("liisa@example.fi",)]
+    # The journal is not used alongside the store
+    assert not scraper.journal.path.exists()
+
+
+def test_failed_league_keeps_its_stored_teams(tmp_path, monkeypatch, fake_pool, fake_page):
+    monkeypatch.chdir(tmp_path)
+    scraper = TeamsScraper({'store': {'path': str(tmp_path / "scraper.db")}})
+    stale = (datetime.now() - timedelta(days=10)).isoformat()
+    for position, name in enumerate(["A", "B"]):
+        scraper.store.save_league(league(name), position)
+    scraper.store.save_league_teams(entry("A", [1, 2], fetched_at=stale))
+    
+    def extract_teams(league_url):
+        if "/A/" in league_url:
+            raise TimeoutException("league tables")
+        return entry("B", [3])['teams']
+    
+    monkeypatch.setattr(teams_scraper, "BrowserPool", fake_pool)
+    monkeypatch.setattr(teams_scraper, "TeamsPage", fake_page(extract_teams))
+    
+    scraper.scrape(incremental=True)
+    
+    entries = {e['league_name']: e for e in scraper.store.iter_league_entries()}
+    assert [team['name'] for team in entries["A"]['teams']] == ["Team 1", "Team 2"]
+    assert entries["A"]['fetched_at'] == stale
+    assert [team['name'] for team in entries["B"]['teams']] == ["Team 3"]
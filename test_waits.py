@@ -0,0 +1,70 @@
+"""
+Tests for ReadinessWaiter with a fake driver standing in for the page.
+"""
+import time
+
+from selenium.webdriver.common.by import By
+
+from src.utils.waits import DOM_QUIET_SCRIPT, ReadinessWaiter
+
+
+class FakePage:
+    """Driver whose DOM either settles at once or mutates every ``mutate_every`` seconds.
+    
+    Mirrors ``DOM_QUIET_SCRIPT``: the observer is installed on the first call
+    and only sees mutations from then on.
+    """
+    
+    def __init__(self, mutate_every=None):
+        self.mutate_every = mutate_every
+        self.observed_since = None
+    
+    def find_element(self, by, value):
+        return (by, value)
+    
+    def execute_script(self, script):
+        assert script == DOM_QUIET_SCRIPT
+        now = time.monotonic()
+        if self.observed_since is None:
+            self.observed_since = now
+        last_mutation = self.observed_since
+        if self.mutate_every:
+            # The latest mutation on a fixed schedule since observing began
+            last_mutation += (now - self.observed_since) // self.mutate_every * self.mutate_every
+        return (now - last_mutation) * 1000
+
+
+def timed_wait(waiter):
+    start = time.monotonic()
+    element = waiter.wait_for((By.CLASS_NAME, "activeofficials"))
+    return element, time.monotonic() - start
+
+
+def test_settled_page_waits_one_quiet_period():
+    waiter = ReadinessWaiter(FakePage(), timeout=5, quiet_period=0.3, poll_interval=0.05)
+    
+    element, elapsed = timed_wait(waiter)
+    
+    assert element == (By.CLASS_NAME, "activeofficials")
+    # The observer starts with the wait, so a full quiet period is the floor
+    assert 0.3 <= elapsed < 0.6
+    assert waiter.timings[-1][0] == "activeofficials"
+
+
+def test_mutating_page_is_capped_by_quiet_timeout():
+    waiter = ReadinessWaiter(FakePage(mutate_every=0.05), timeout=10, quiet_period=0.3,
+                             poll_interval=0.05, quiet_timeout=0.5)
+    
+    element, elapsed = timed_wait(waiter)
+    
+    assert element == (By.CLASS_NAME, "activeofficials")
+    assert 0.5 <= elapsed < 1.0
+    assert waiter.timeouts == 0
+
+
+def test_quiet_timeout_from_config():
+    waiter = ReadinessWaiter.from_config(FakePage(), {'delays': {'dom_quiet': 0.2, 'dom_quiet_timeout': 1}})
+    
+    assert waiter.quiet_period == 0.2
+    assert waiter.quiet_timeout == 1
+    assert waiter.timeout == 20